@@ -197,7 +197,8 @@ def get_paginated_event_table(
     events_table = events_table.dropna(axis=1, how="all")
 
     e2o_table = (
-        ocel.e2o.df.loc[ocel.e2o.df[EID_COL].isin(events_table[EID_COL])]
+        ocel.e2o.get_relations_of_events(events_table[EID_COL])
+        .astype({col: object for col in [EID_COL, E2O_QUALIFIER, OTYPE_COL, OID_COL]})
         .groupby([EID_COL, E2O_QUALIFIER, OTYPE_COL])[OID_COL]
         .agg(list)
     )
@@ -238,26 +239,15 @@ def get_paginated_object_table(
     sort_by: str | None = None,
     ascending: bool = True,
 ) -> PaginatedResponse:
-    object_table = ocel.objects.df.loc[
-        ocel.objects.df[OTYPE_COL].eq(object_type)
-    ].set_index(OID_COL)
+    is_of_type = ocel.objects.df[OTYPE_COL].eq(object_type)
+    object_table = ocel.objects.df.loc[is_of_type].set_index(OID_COL)
 
     if sort_by:
         if sort_by in ocel.objects.dynamic_attribute_names:
-            changes = (
-                ocel.objects.changes.loc[
-                    ocel.objects.changes[OTYPE_COL].eq(object_type)
-                    & ocel.objects.changes["ocel:field"].eq(sort_by),
-                    [OID_COL, sort_by],
-                ]
-                .drop_duplicates(OID_COL, keep="last")
-                .set_index(OID_COL)
-            )
-
-            if sort_by not in object_table:
-                object_table[sort_by] = None
-
-            object_table.update(changes)
+            # Sort by the latest values, shared with the object attribute filters
+            object_table[sort_by] = ocel.objects.latest_attributes.loc[
+                is_of_type, sort_by
+            ].to_numpy()
 
         object_table[sort_by] = coerce_series(object_table[sort_by])
         object_table = object_table.sort_values(
@@ -278,7 +268,7 @@ def get_paginated_object_table(
         dynamic_attributes = changes_table["ocel:field"].drop_duplicates()
         dynamic_attributes_aggr = {field: (field, list) for field in dynamic_attributes}
 
-        changes_table = changes_table.groupby(OID_COL).agg(
+        changes_table = changes_table.groupby(OID_COL, observed=True).agg(
             **dynamic_attributes_aggr,
             **{TIMESTAMP_COL: (TIMESTAMP_COL, list)},
         )
@@ -302,7 +292,18 @@ def get_paginated_object_table(
 
     typed_o2o = ocel.o2o.typed_df
     o2o_table = (
-        typed_o2o.loc[typed_o2o[O2O_SOURCE_ID].isin(object_table.index)]
+        typed_o2o.loc[ocel.o2o.get_relations_of_objects(object_table.index).index]
+        .astype(
+            {
+                col: object
+                for col in [
+                    O2O_SOURCE_ID,
+                    O2O_QUALIFIER,
+                    O2O_TARGET_TYPE,
+                    O2O_TARGET_ID,
+                ]
+            }
+        )
         .groupby([O2O_SOURCE_ID, O2O_QUALIFIER, O2O_TARGET_TYPE])[O2O_TARGET_ID]
         .agg(list)
     )
@@ -1,3 +1,4 @@
+from threading import Lock
 from typing import Hashable, Self, cast
 
 import pandas as pd
@@ -42,6 +43,13 @@ class OcelMetadata(BaseModel):
         )
 
 
+class OcelStreamSummary(BaseModel):
+    batches: int = 0
+    events: int = 0
+    objects: int = 0
+    relations: int = 0
+
+
 # TODO: Remove this concept completly
 class OCELFilter(TypedDict, total=False):
     object_types: ObjectTypeFilter
@@ -58,12 +66,19 @@ class SessionOCEL:
         self.origin: OCEL = ocel
         self.applied_filter: list[BaseFilter] = []
         self._filtered_ocel: OCEL = ocel
+        # Appends swap the origin's tables, so they must not interleave with
+        # each other or with filtering the origin
+        self._lock = Lock()
 
     @property
     def ocel(self):
         return self._filtered_ocel
 
     def apply_filter(self, pipeline: list[BaseFilter]):
+        with self._lock:
+            self._apply_filter(pipeline)
+
+    def _apply_filter(self, pipeline: list[BaseFilter]):
         self.applied_filter = pipeline
         self._filtered_ocel = (
             self.origin.filter(self.applied_filter)
@@ -71,6 +86,15 @@ class SessionOCEL:
             else self.origin
         )
 
+    def append(self, tables: dict[str, pd.DataFrame]):
+        with self._lock:
+            self.origin.append(**tables)
+            # Filtered views keep showing the log as it was before the append
+            if self.applied_filter:
+                self._apply_filter(self.applied_filter)
+            else:
+                self._filtered_ocel = self.origin
+
 
 class Attribute(BaseModel):
     name: str
@@ -1,9 +1,13 @@
+import hashlib
 import json
 import os
-from copy import deepcopy
+import shutil
+import uuid
 from functools import cached_property
+from pathlib import Path
 from typing import Any
 
+from ocelescope.ocel.util.snapshot import SNAPSHOT_MANIFEST
 from pydantic import Field, FilePath
 
 import ocelescope_backend.app.internal.util.misc as util
@@ -14,6 +18,7 @@ from ocelescope_backend.app.internal.model.base import ApiBaseModel
 from ocelescope_backend.app.internal.session import Session
 
 OCEL_BASE_PATH = None
+SNAPSHOT_DIR_NAME = "snapshots"
 DEFAULT_OCELS: list["DefaultOCEL"] = []
 DEFAULT_OCEL_KEYS: list[str] = []
 
@@ -46,24 +51,68 @@ class DefaultOCEL(ApiBaseModel):
         return json.load(open(json_path, "r", encoding="utf8"))
 
     def get_ocel_copy(self, use_abbreviations: bool = False) -> OCEL:
-        """Reads the OCEL from the given file (if not done yet), and returns a copy of the stored OCEL object."""
+        """Reads the OCEL from the given file (if not done yet), and returns a copy-on-write copy of the stored OCEL object."""
         self.load_ocel()
         ocel = getattr(self, "__ocel")
-        ocel = deepcopy(ocel)
+        ocel = ocel.copy()
         if use_abbreviations and self.abbr_map:
             ocel = ocel.translate(self.abbr_map)
         return ocel
 
+    @property
+    def snapshot_path(self) -> Path | None:
+        """Path of the Arrow snapshot of this OCEL in DATA_DIR, bound to the size and modification time of the source file."""
+        if not config.DATA_DIR:
+            return None
+        stat = self.path.stat()
+        stamp = hashlib.sha1(
+            f"{self.path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}".encode()
+        ).hexdigest()[:16]
+        return (
+            config.DATA_DIR
+            / SNAPSHOT_DIR_NAME
+            / f"{self.key}_{self.version}_{stamp}.arrowocel"
+        )
+
     def load_ocel(self):
-        """Reads the OCEL from the given file."""
+        """Reads the OCEL from its memory-mapped snapshot, creating the snapshot from the given file first if needed."""
         if hasattr(self, "__ocel"):
             return
-        logger.info('Reading OCEL 2.0 "%s" ...', self.name)
-        ocel = OCEL.read(
-            self.path,
-        )
+        snapshot_path = self.snapshot_path
+        if snapshot_path is None or not (snapshot_path / SNAPSHOT_MANIFEST).exists():
+            logger.info('Reading OCEL 2.0 "%s" ...', self.name)
+            ocel = OCEL.read(
+                self.path,
+            )
+            if snapshot_path is None or not self.write_snapshot(ocel, snapshot_path):
+                object.__setattr__(self, "__ocel", ocel)
+                return
+
+        logger.info('Opening OCEL 2.0 snapshot of "%s" ...', self.name)
+        ocel = OCEL.read(snapshot_path, memory_map=True)
         object.__setattr__(self, "__ocel", ocel)
 
+    def write_snapshot(self, ocel: OCEL, snapshot_path: Path) -> bool:
+        """Atomically writes the snapshot and removes outdated snapshots of this OCEL. Returns whether a snapshot is available."""
+        tmp_path = snapshot_path.with_name(f".{uuid.uuid4().hex}.arrowocel")
+        try:
+            snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            ocel.write(tmp_path)
+            os.replace(tmp_path, snapshot_path)
+        except OSError as e:
+            # Another worker may have published the same snapshot first
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            if not (snapshot_path / SNAPSHOT_MANIFEST).exists():
+                logger.warning(f'Could not write snapshot of OCEL "{self.name}": {e}')
+                return False
+
+        for outdated in snapshot_path.parent.glob(
+            f"{self.key}_{self.version}_*.arrowocel"
+        ):
+            if outdated != snapshot_path:
+                shutil.rmtree(outdated, ignore_errors=True)
+        return True
+
 
 # Try to load event_logs.json only if everything is present
 try:
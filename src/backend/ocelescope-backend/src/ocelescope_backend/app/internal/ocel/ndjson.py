@@ -0,0 +1,207 @@
+from collections.abc import AsyncIterator
+from typing import Any
+
+import numpy as np
+import orjson
+import pandas as pd
+from ocelescope.ocel.constants.pm4py import (
+    ACTIVITY_COL,
+    E2O_QUALIFIER,
+    EID_COL,
+    O2O_QUALIFIER,
+    OBJECT_CHANGED_FIELD,
+    OID_COL,
+    OTYPE_COL,
+    TIMESTAMP_COL,
+)
+
+DEFAULT_BATCH_SIZE = 50_000
+
+
+class _Table:
+    """Collect the rows of one table, with sparse attribute columns.
+
+    Rows are kept as tuples and only split into columns when the frame is built.
+    """
+
+    def __init__(self, columns: list[str]):
+        self.columns = columns
+        self.rows: list[tuple] = []
+        self.attributes: dict[str, tuple[list[int], list]] = {}
+
+    def add(self, row: tuple, attributes: dict[str, Any] | None = None):
+        if attributes:
+            position = len(self.rows)
+            for name, value in attributes.items():
+                rows, values = self.attributes.setdefault(name, ([], []))
+                rows.append(position)
+                values.append(value)
+        self.rows.append(row)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def frame(self) -> pd.DataFrame | None:
+        if not self.rows:
+            return None
+
+        attributes = {}
+        for name, (rows, values) in self.attributes.items():
+            column = np.full(len(self.rows), None, dtype=object)
+            column[rows] = values
+            attributes[name] = pd.Series(column).infer_objects()
+
+        table = np.empty((len(self.rows), len(self.columns)), dtype=object)
+        table[:] = self.rows
+        # Explicitly object typed, so the strings are not converted to Arrow
+        # only to be converted back when the log's dictionaries are extended
+        return pd.DataFrame(
+            {
+                **{
+                    column: pd.Series(table[:, position], dtype=object)
+                    for position, column in enumerate(self.columns)
+                },
+                **attributes,
+            }
+        )
+
+
+def _timestamps(values: pd.Series) -> pd.Series:
+    return pd.to_datetime(values, utc=True, format="ISO8601")
+
+
+class NDJSONBatch:
+    """The tables decoded from one batch of newline-delimited OCEL records.
+
+    Records are JSON objects on a line of their own, distinguished by their
+    ``kind``:
+
+    - ``event``: an OCEL 2.0 JSON event (``id``, ``type``, ``time``, and
+      optionally ``attributes`` and ``relationships``).
+    - ``object``: an OCEL 2.0 JSON object (``id``, ``type``, and optionally
+      ``attributes`` and ``relationships``). The first value of each attribute
+      goes to the object table, further values become object changes.
+    - ``relation``: a single E2O relation (``eventId``, ``objectId``, and
+      optionally ``qualifier``).
+    """
+
+    def __init__(self):
+        self.events = _Table([EID_COL, ACTIVITY_COL, TIMESTAMP_COL])
+        self.objects = _Table([OID_COL, OTYPE_COL])
+        self.object_changes = _Table(
+            [OID_COL, OTYPE_COL, OBJECT_CHANGED_FIELD, TIMESTAMP_COL]
+        )
+        self.relations = _Table([EID_COL, OID_COL, E2O_QUALIFIER])
+        self.o2o = _Table([OID_COL, f"{OID_COL}_2", O2O_QUALIFIER])
+        self.records = 0
+
+    def add(self, record: dict[str, Any]):
+        if not isinstance(record, dict):
+            raise TypeError(f"Expected a JSON object, got {type(record).__name__}")
+        match record.get("kind"):
+            case "event":
+                eid = record["id"]
+                attributes = record.get("attributes")
+                self.events.add(
+                    (eid, record["type"], record["time"]),
+                    {attribute["name"]: attribute["value"] for attribute in attributes}
+                    if attributes
+                    else None,
+                )
+                relations = self.relations.rows
+                for relationship in record.get("relationships") or ():
+                    relations.append(
+                        (eid, relationship["objectId"], relationship.get("qualifier"))
+                    )
+            case "object":
+                oid, otype = record["id"], record["type"]
+                initial = {}
+                for attribute in record.get("attributes") or []:
+                    name = attribute["name"]
+                    if name not in initial:
+                        initial[name] = attribute["value"]
+                    else:
+                        self.object_changes.add(
+                            (oid, otype, name, attribute["time"]),
+                            {name: attribute["value"]},
+                        )
+                self.objects.add((oid, otype), initial)
+                o2o = self.o2o.rows
+                for relationship in record.get("relationships") or ():
+                    o2o.append(
+                        (oid, relationship["objectId"], relationship.get("qualifier"))
+                    )
+            case "relation":
+                self.relations.rows.append(
+                    (record["eventId"], record["objectId"], record.get("qualifier"))
+                )
+            case kind:
+                raise ValueError(f"Unknown record kind {kind!r}")
+        self.records += 1
+
+    def tables(self) -> dict[str, pd.DataFrame]:
+        """Return the non-empty tables, named like the arguments of ``OCEL.append``."""
+        tables = {
+            name: frame
+            for name, frame in {
+                "events": self.events.frame(),
+                "objects": self.objects.frame(),
+                "relations": self.relations.frame(),
+                "o2o": self.o2o.frame(),
+                "object_changes": self.object_changes.frame(),
+            }.items()
+            if frame is not None
+        }
+        for name in ("events", "object_changes"):
+            if name in tables:
+                tables[name][TIMESTAMP_COL] = _timestamps(tables[name][TIMESTAMP_COL])
+        return tables
+
+
+async def ndjson_batches(
+    chunks: AsyncIterator[bytes], batch_size: int = DEFAULT_BATCH_SIZE
+) -> AsyncIterator[NDJSONBatch]:
+    """Decode a chunked NDJSON byte stream into batches of ``batch_size`` records.
+
+    Chunks may split lines anywhere; only the incomplete last line of a chunk
+    is carried over to the next one. Blank lines are skipped.
+
+    Raises:
+        ValueError: If a line is not a valid record, naming its line number.
+    """
+    batch = NDJSONBatch()
+    rest = b""
+    line_number = 0
+
+    def add(lines: list[bytes]):
+        nonlocal line_number
+        for line in lines:
+            line_number += 1
+            try:
+                record = orjson.loads(line)
+            except orjson.JSONDecodeError as e:
+                if not line.strip():
+                    continue
+                raise ValueError(f"Invalid record on line {line_number}: {e}") from e
+            try:
+                batch.add(record)
+            # AttributeError for relationships or attributes that are not objects
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"Invalid record on line {line_number}: {e!r}") from e
+
+    async for chunk in chunks:
+        lines = (rest + chunk).split(b"\n")
+        rest = lines.pop()
+        start = 0
+        while start < len(lines):
+            # Fill the batch up to its size, so it is handed over as soon as it is full
+            end = start + batch_size - batch.records
+            add(lines[start:end])
+            start = end
+            if batch.records >= batch_size:
+                yield batch
+                batch = NDJSONBatch()
+
+    add([rest])
+    if batch.records > 0:
+        yield batch
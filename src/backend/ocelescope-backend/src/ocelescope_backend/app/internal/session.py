@@ -4,6 +4,8 @@ import json
 import uuid
 from typing import Any, Callable, Hashable, Type, TypeVar, cast
 
+import pandas as pd
+
 from ocelescope import OCEL, BaseFilter
 from ocelescope_backend.app.internal.exceptions import NotFound
 from ocelescope_backend.app.internal.model.ocel import SessionOCEL
@@ -111,6 +113,14 @@ class Session:
         self.ocels.pop(ocel_id, None)
         sse_manager.send_safe(self.id, InvalidationRequest(routes=["ocels"]))
 
+    def append_to_ocel(self, ocel_id: str, tables: dict[str, pd.DataFrame]):
+        if ocel_id not in self.ocels:
+            raise NotFound(f"OCEL with id {ocel_id} not found")
+
+        self.ocels[ocel_id].append(tables)
+
+        sse_manager.send_safe(self.id, InvalidationRequest(routes=["ocels"]))
+
     def get_ocel_filters(self, ocel_id: str) -> list[BaseFilter]:
         if ocel_id not in self.ocels:
             raise NotFound(f"OCEL with id {ocel_id} not found")
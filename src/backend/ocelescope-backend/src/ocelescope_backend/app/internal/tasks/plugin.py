@@ -1,17 +1,20 @@
-from copy import deepcopy
+from threading import Lock
 from typing import (
     TYPE_CHECKING,
     Any,
     Generic,
     Hashable,
     ParamSpec,
+    cast,
 )
 
+from cachetools import LRUCache
 from pydantic.fields import Field
 from pydantic.main import BaseModel
 from typing_extensions import TypedDict
 
-from ocelescope import OCEL, BaseFilter, Resource
+from ocelescope import OCEL, Resource
+from ocelescope_backend.app.internal.exceptions import NotFound
 from ocelescope_backend.app.internal.model.resource import ResourceStore
 from ocelescope_backend.app.internal.registry import registry_manager
 from ocelescope_backend.app.internal.tasks.base import (
@@ -32,6 +35,14 @@ if TYPE_CHECKING:
 
 P = ParamSpec("P")
 
+# Plugin runs by dedupe key, shared by all sessions, so the same run on the same
+# log (e.g. the default log every session starts with) is only computed once.
+# Each run holds its outputs, so only the latest runs are kept.
+MAX_SHARED_RUNS = 64
+_dedupe_tasks = LRUCache(maxsize=MAX_SHARED_RUNS)
+# Guards the shared runs and the followers of each run
+_dedupe_lock = Lock()
+
 
 class PluginInput(TypedDict):
     ocels: dict[str, str]
@@ -62,16 +73,134 @@ class PluginTask(TaskBase, Generic[P]):
 
         self.session = session
 
+        self._key: Hashable | None = None
+        # The plugin's outputs with their names, shared with identical runs
+        self._outputs: list[tuple[str, OCEL | Resource]] = []
+        self._followers: list[PluginTask] = []
+
+    def _fingerprints(self, known_only: bool) -> dict[str, str] | None:
+        # Hashing a log for the first time is a full pass over its tables, so
+        # only known fingerprints are used outside of the task's thread
+        fingerprints = {}
+        for key, ocel_id in self.input["ocels"].items():
+            ocel = self.session.get_ocel(ocel_id)
+            fingerprint = ocel.peek_fingerprint() if known_only else ocel.fingerprint
+            if fingerprint is None:
+                return None
+            fingerprints[key] = fingerprint
+        return fingerprints
+
+    def _follow(self, key: Hashable) -> bool:
+        """Register this run under its dedupe key, unless an earlier run has it.
+
+        An earlier successful run's outputs are taken over right away; one
+        still running hands them over when it is done. Returns whether this
+        run follows an earlier one.
+        """
+        with _dedupe_lock:
+            earlier = _dedupe_tasks.get(key)
+            if (
+                earlier is None
+                or earlier is self
+                or earlier.state in (TaskState.FAILURE, TaskState.CANCELLED)
+            ):
+                _dedupe_tasks[key] = self
+                return False
+            running = earlier.state != TaskState.SUCCESS
+            if running:
+                self.state = TaskState.STARTED
+                earlier._followers.append(self)
+
+        print(f"[Task: {self.plugin_id}] Deduplicated -> {earlier.id}")
+        if not running:
+            self._take_over(earlier)
+        return True
+
+    def _take_over(self, earlier: "PluginTask"):
+        """Finish this run with the outputs of an earlier identical one."""
+        if earlier.state != TaskState.SUCCESS:
+            # The earlier run failed, so this one runs itself (or follows another)
+            super().start()
+            return
+
+        try:
+            # Logs are copied, so changes in one session do not reach another
+            self._add_outputs(
+                [
+                    (name, entitiy.copy() if isinstance(entitiy, OCEL) else entitiy)
+                    for name, entitiy in earlier._outputs
+                ]
+            )
+            if self.state != TaskState.CANCELLED:
+                self.state = TaskState.SUCCESS
+        # Not raised, as it would skip the other followers of the earlier run
+        except Exception as exc:  # noqa: BLE001
+            self.error = exc
+            self.state = TaskState.FAILURE
+        finally:
+            self._finish()
+
+    def _finish(self):
+        self.session.running_tasks.pop(self.id, None)
+        sse_manager.send_safe(
+            session_id=self.session.id,
+            message=SystemNotification(
+                type="notification",
+                title="Plugin successfully run",
+                message=f"Successfully run plugin {self.plugin_id} {self.method_name}",
+                notification_type="info",
+                link=PluginLink(
+                    type="plugin",
+                    method=self.method_name,
+                    id=self.plugin_id,
+                    task_id=self.id,
+                ),
+            ),
+        )
+
+        # The state is final here, so no follower is added after this
+        with _dedupe_lock:
+            followers, self._followers = self._followers, []
+        for follower in followers:
+            follower._take_over(self)
+
+    def start(self):
+        # Duplicates of a run on logs hashed before wait for it without a thread
+        try:
+            fingerprints = self._fingerprints(known_only=True)
+        except NotFound:
+            # Reported as the failure of the task
+            fingerprints = None
+        if fingerprints is not None:
+            self._key = self._dedupe_key(
+                self.plugin_id, self.method_name, self.input, fingerprints
+            )
+            if self._follow(self._key):
+                return
+        super().start()
+
     def run(self):
         self.state = TaskState.STARTED
+        following = False
         try:
+            if self._key is None:
+                fingerprints = cast(
+                    dict[str, str], self._fingerprints(known_only=False)
+                )
+                self._key = self._dedupe_key(
+                    self.plugin_id, self.method_name, self.input, fingerprints
+                )
+            following = self._follow(self._key)
+            if following:
+                return
+
             plugin = registry_manager.get_plugin(plugin_id=self.plugin_id)
             method = registry_manager.get_plugin_method(
                 self.plugin_id, self.method_name
             )
 
             ocel_args: dict[str, OCEL] = {
-                key: deepcopy(self.session.get_ocel(self.input["ocels"][key]))
+                key: self.session.get_ocel(self.input["ocels"][key]).copy()
                 for key in method.input_ocels.keys()
             }
 
@@ -99,34 +228,16 @@ class PluginTask(TaskBase, Generic[P]):
             if not isinstance(result, tuple):
                 result = (result,)
 
-            for item_index, item in enumerate(result):
-                if not isinstance(item, list):
-                    item = [item]
-
-                for entitiy_index, entitiy in enumerate(item):
-                    if isinstance(entitiy, OCEL):
-                        entitiy.meta.extra["name"] = (
-                            f"{plugin.meta().name if plugin else self.plugin_id}_{self.method_name}_{item_index}_{entitiy_index}"
-                        )
-                        self.result.ocel_ids.append(self.session.add_ocel(entitiy))
-                    if isinstance(entitiy, Resource):
-                        self.result.resource_ids.append(
-                            self.session.add_resource(
-                                ResourceStore(
-                                    name=f"{plugin.meta().name if plugin else self.plugin_id}_{self.method_name}_{item_index}_{entitiy_index}",
-                                    type=entitiy.get_type(),
-                                    source={
-                                        "task_id": self.id,
-                                        "method_name": self.method_name,
-                                        "plugin_name": plugin.meta().name,
-                                        "version": "",
-                                    }
-                                    if plugin
-                                    else None,
-                                    data=entitiy.model_dump(),
-                                ),
-                            )
-                        )
+            name = plugin.meta().name if plugin else self.plugin_id
+            self._outputs = [
+                (f"{name}_{self.method_name}_{item_index}_{entitiy_index}", entitiy)
+                for item_index, item in enumerate(result)
+                for entitiy_index, entitiy in enumerate(
+                    item if isinstance(item, list) else [item]
+                )
+                if isinstance(entitiy, (OCEL, Resource))
+            ]
+            self._add_outputs(self._outputs)
 
             if self.state != TaskState.CANCELLED:
                 self.state = TaskState.SUCCESS
@@ -135,22 +246,34 @@ class PluginTask(TaskBase, Generic[P]):
             self.state = TaskState.FAILURE
             raise
         finally:
-            self.session.running_tasks.pop(self.id, None)
-            sse_manager.send_safe(
-                session_id=self.session.id,
-                message=SystemNotification(
-                    type="notification",
-                    title="Plugin successfully run",
-                    message=f"Successfully run plugin {self.plugin_id} {self.method_name}",
-                    notification_type="info",
-                    link=PluginLink(
-                        type="plugin",
-                        method=self.method_name,
-                        id=self.plugin_id,
-                        task_id=self.id,
-                    ),
-                ),
-            )
+            if not following:
+                self._finish()
+
+    def _add_outputs(self, outputs: list[tuple[str, OCEL | Resource]]):
+        plugin = registry_manager.get_plugin(plugin_id=self.plugin_id)
+
+        for name, entitiy in outputs:
+            if isinstance(entitiy, OCEL):
+                entitiy.meta.extra["name"] = name
+                self.result.ocel_ids.append(self.session.add_ocel(entitiy))
+            if isinstance(entitiy, Resource):
+                self.result.resource_ids.append(
+                    self.session.add_resource(
+                        ResourceStore(
+                            name=name,
+                            type=entitiy.get_type(),
+                            source={
+                                "task_id": self.id,
+                                "method_name": self.method_name,
+                                "plugin_name": plugin.meta().name,
+                                "version": "",
+                            }
+                            if plugin
+                            else None,
+                            data=entitiy.model_dump(),
+                        ),
+                    )
+                )
 
     def summarize(self) -> PluginTaskSummary:
         return PluginTaskSummary(
@@ -166,9 +289,18 @@ class PluginTask(TaskBase, Generic[P]):
         plugin_name: str,
         method_name: str,
         input: PluginInput,
-        filter: dict[str, list[BaseFilter]],
+        fingerprints: dict[str, str],
     ) -> Hashable:
-        return generate_tuple_hash("plugin", plugin_name, method_name, input, filter)
+        # OCELs are keyed by content (including their filters) instead of their ids,
+        # so runs on identical logs are deduplicated as well
+        return generate_tuple_hash(
+            "plugin",
+            plugin_name,
+            method_name,
+            input["resources"],
+            input["input"],
+            fingerprints,
+        )
 
     @classmethod
     def create_plugin_task(
@@ -178,20 +310,6 @@ class PluginTask(TaskBase, Generic[P]):
         method_name: str,
         input: PluginInput,
     ) -> str:
-        filters = {
-            ocel_id: session.get_ocel_filters(ocel_id)
-            for ocel_id in input["ocels"].values()
-        }
-
-        key = cls._dedupe_key(plugin_id, method_name, input, filters)
-
-        existing_id = session._dedupe_keys.get(key)
-        if existing_id and existing_id in session.tasks:
-            print(
-                f"[Task: {plugin_id} {method_name}] Skipped (deduplicated) -> {existing_id}"
-            )
-            return existing_id
-
         task = cls(
             session=session,
             plugin_id=plugin_id,
@@ -200,7 +318,6 @@ class PluginTask(TaskBase, Generic[P]):
         )
         session.tasks[task.id] = task
         session.running_tasks[task.id] = task
-        session._dedupe_keys[key] = task.id
 
         print(f"[Task] Starting in thread (ID: {task.id})")
         task.start()
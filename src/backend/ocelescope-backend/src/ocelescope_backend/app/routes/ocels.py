@@ -2,13 +2,15 @@ from datetime import datetime
 from pathlib import Path
 from typing import Annotated, Literal, Optional
 
+import numpy as np
 import pandas as pd
-from fastapi import APIRouter, Query, Response
+from fastapi import APIRouter, Query, Request, Response
 from ocelescope import RelationCountSummary
 from ocelescope.ocel.constants.misc import OCELFileExtensions
+from starlette.concurrency import run_in_threadpool
 
 from ocelescope_backend.app.dependencies import ApiOcel, ApiSession
-from ocelescope_backend.app.internal.exceptions import NotFound
+from ocelescope_backend.app.internal.exceptions import BadRequest, NotFound
 from ocelescope_backend.app.internal.model.base import PaginatedResponse
 from ocelescope_backend.app.internal.model.events import (
     Date_Distribution_Item,
@@ -18,6 +20,7 @@ from ocelescope_backend.app.internal.model.ocel import (
     AggregatedAttribute,
     OCELFilter,
     OcelMetadata,
+    OcelStreamSummary,
     QuantityInfo,
     TypedAttribute,
 )
@@ -28,6 +31,10 @@ from ocelescope_backend.app.internal.ocel.default_ocel import (
     filter_default_ocels,
     get_default_ocel,
 )
+from ocelescope_backend.app.internal.ocel.ndjson import (
+    DEFAULT_BATCH_SIZE,
+    ndjson_batches,
+)
 from ocelescope_backend.app.internal.registry import registry_manager
 from ocelescope_backend.app.internal.registry.extension import OCELExtensionDescription
 from ocelescope_backend.app.internal.util.filters import merge_filters, unmerge_filter
@@ -139,6 +146,45 @@ def delete_ocel(session: ApiSession, ocel_id: str):
     session.delete_ocel(ocel_id)
 
 
+@ocels_router.post(
+    "/{ocel_id}/stream",
+    summary="Append a stream of records to an OCEL",
+    description=(
+        "Appends newline-delimited JSON records to the OCEL with the given "
+        "`ocel_id` while the request body is still being received. Each line "
+        "holds one record with a `kind` of `event`, `object` (both in the OCEL "
+        "2.0 JSON layout) or `relation` (`eventId`, `objectId`, `qualifier`). "
+        "Records are appended in batches of `batch_size`, and one invalidation "
+        "is sent per batch. Events and objects have to be streamed no later "
+        "than the relations referring to them."
+    ),
+    operation_id="streamOcel",
+)
+async def stream_ocel(
+    request: Request,
+    session: ApiSession,
+    ocel_id: str,
+    batch_size: int = Query(default=DEFAULT_BATCH_SIZE, gt=0),
+) -> OcelStreamSummary:
+    if ocel_id not in session.ocels:
+        raise NotFound(f"OCEL with id {ocel_id} not found")
+
+    summary = OcelStreamSummary()
+    try:
+        async for batch in ndjson_batches(request.stream(), batch_size=batch_size):
+            tables = batch.tables()
+            # Appending is CPU bound, so it must not block the event loop
+            await run_in_threadpool(session.append_to_ocel, ocel_id, tables)
+            summary.batches += 1
+            summary.events += len(batch.events)
+            summary.objects += len(batch.objects)
+            summary.relations += len(batch.relations)
+    except ValueError as e:
+        raise BadRequest(f"{e} ({summary.batches} batches were appended before)") from e
+
+    return summary
+
+
 @ocels_router.post(
     "/{ocel_id}/rename",
     summary="Rename an uploaded OCEL",
@@ -210,46 +256,32 @@ def get_event_counts(
     operation_id="timeInfo",
 )
 def get_time_info(
-    ocel: ApiOcel, periods: int | None = None, freq: str | None = None
+    ocel: ApiOcel,
+    periods: int | None = None,
+    freq: str | None = None,
+    by: Literal["activity", "object_type"] = "activity",
 ) -> Entity_Time_Info:
-    activity_timestamp = ocel.events.df[
-        [ocel.ocel.event_timestamp, ocel.ocel.event_activity]
-    ].reset_index(drop=True)
-    timestamps = activity_timestamp[ocel.ocel.event_timestamp]
-    start_time = timestamps.min()
-    end_time = timestamps.max()
+    time_index = ocel.events.time_index
+    start_time, end_time = time_index.start, time_index.end
 
     bins = pd.date_range(start_time, end_time, periods=periods, freq=freq)
-
-    activity_timestamp["window_id"] = pd.cut(
-        timestamps,
-        bins=bins,
-        labels=False,
-        include_lowest=True,
-    )
-
-    activity_timestamp = (
-        activity_timestamp.groupby(["window_id", ocel.ocel.event_activity])
-        .size()  # type:ignore
-        .reset_index(name="count")
-        .merge(
-            pd.DataFrame(
-                {"window_id": range(len(bins) - 1), "start": bins[:-1], "end": bins[1:]}
-            ),
-            on="window_id",
-            how="left",
+    histogram = ocel.events.histogram(bins, by=by)
+    counts = histogram.to_numpy()
+    labels = histogram.columns.to_numpy(dtype=object)
+    edges = [edge.isoformat() for edge in bins]
+
+    date_distribution = []
+    for window_id in np.flatnonzero(counts.any(axis=1)):
+        present = np.flatnonzero(counts[window_id])
+        date_distribution.append(
+            Date_Distribution_Item(
+                start_timestamp=edges[window_id],
+                end_timestamp=edges[window_id + 1],
+                entity_count=dict(
+                    zip(labels[present].tolist(), counts[window_id, present].tolist())
+                ),
+            )
         )
-    )
-
-    date_distribution = [
-        Date_Distribution_Item(
-            start_timestamp=row["start"].isoformat(),
-            end_timestamp=row["end"].isoformat(),
-            entity_count=dict(zip(grp[ocel.ocel.event_activity], grp["count"])),
-        )
-        for _, grp in activity_timestamp.groupby("window_id")
-        for row in [grp.iloc[0]]
-    ]
 
     return Entity_Time_Info(
         start_time=start_time.isoformat(),
@@ -0,0 +1,36 @@
+import asyncio
+
+import pytest
+from ocelescope_backend.app.internal.ocel.ndjson import ndjson_batches
+
+EVENT = b'{"kind": "event", "id": "e1", "type": "pack", "time": "2024-01-01"}'
+
+
+async def _records(chunks: list[bytes]) -> int:
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+
+    return sum([batch.records async for batch in ndjson_batches(stream())])
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        b"[1, 2]",
+        b"42",
+        b'"x"',
+        (
+            b'{"kind": "event", "id": "e2", "type": "pack", "time": "2024-01-01",'
+            b' "relationships": [42]}'
+        ),
+        b'{"kind": "object", "id": "o1", "type": "order", "attributes": ["x"]}',
+    ],
+)
+def test_non_object_records_are_rejected_with_their_line(line: bytes):
+    with pytest.raises(ValueError, match="line 2"):
+        asyncio.run(_records([EVENT + b"\n", line + b"\n"]))
+
+
+def test_records_split_across_chunks_are_decoded():
+    assert asyncio.run(_records([EVENT[:10], EVENT[10:] + b"\n\n", EVENT])) == 2
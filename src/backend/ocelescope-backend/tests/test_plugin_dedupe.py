@@ -0,0 +1,101 @@
+from threading import Event
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+from ocelescope_backend.app.internal.registry import registry_manager
+from ocelescope_backend.app.internal.session import Session
+from ocelescope_backend.app.internal.tasks.base import TaskState
+from ocelescope_backend.app.internal.tasks.plugin import PluginTask
+from pm4py.objects.ocel.obj import OCEL as PM4PYOCEL
+
+from ocelescope import OCEL
+
+
+def _ocel() -> OCEL:
+    return OCEL(
+        PM4PYOCEL(
+            events=pd.DataFrame(
+                {
+                    "ocel:eid": ["e1"],
+                    "ocel:activity": ["pack"],
+                    "ocel:timestamp": pd.to_datetime(["2024-01-01"], utc=True),
+                }
+            ),
+            objects=pd.DataFrame({"ocel:oid": ["o1"], "ocel:type": ["order"]}),
+        )
+    )
+
+
+@pytest.fixture
+def plugin(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    calls, release = [], Event()
+
+    def method(log: OCEL) -> OCEL:
+        calls.append(log)
+        release.wait(timeout=10)
+        return log
+
+    monkeypatch.setattr(registry_manager, "get_plugin", lambda plugin_id: None)
+    monkeypatch.setattr(
+        registry_manager,
+        "get_plugin_method",
+        lambda plugin_id, method_name: SimpleNamespace(
+            input_ocels={"log": None},
+            input_resources={},
+            _input_model=None,
+            _method=method,
+        ),
+    )
+    return SimpleNamespace(calls=calls, release=release)
+
+
+def _run(session: Session, ocel: OCEL, marker: str) -> PluginTask:
+    task_id = PluginTask.create_plugin_task(
+        session,
+        "dedupe-test",
+        "run",
+        {
+            "ocels": {"log": session.add_ocel(ocel)},
+            "resources": {},
+            "input": {"marker": marker},
+        },
+    )
+    return session.tasks[task_id]
+
+
+def test_identical_runs_in_different_sessions_share_one_evaluation(
+    plugin: SimpleNamespace,
+):
+    first = _run(Session(), _ocel(), "shared")
+    # The second session's log is another instance, which its task's thread hashes
+    second = _run(Session(), _ocel(), "shared")
+
+    plugin.release.set()
+    first.join()
+    second.join()
+
+    assert len(plugin.calls) == 1
+    assert first.state == second.state == TaskState.SUCCESS
+    outputs = [
+        task.session.get_ocel(task.result.ocel_ids[0]) for task in (first, second)
+    ]
+    assert outputs[0] is not outputs[1]
+    assert not second.session.running_tasks
+
+
+def test_duplicates_of_hashed_logs_wait_without_a_thread(plugin: SimpleNamespace):
+    ocel = _ocel()
+    _ = ocel.fingerprint
+    first = _run(Session(), ocel, "hashed")
+    second = _run(Session(), ocel, "hashed")
+
+    assert second.thread is None
+    assert second.state == TaskState.STARTED
+
+    plugin.release.set()
+    first.join()
+
+    assert len(plugin.calls) == 1
+    assert second.state == TaskState.SUCCESS
+    assert len(second.result.ocel_ids) == 1
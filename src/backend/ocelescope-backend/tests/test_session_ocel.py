@@ -0,0 +1,47 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from ocelescope_backend.app.internal.model.ocel import SessionOCEL
+from pm4py.objects.ocel.obj import OCEL as PM4PYOCEL
+
+from ocelescope import OCEL, EventTypeFilter
+
+
+def _events(start: int, count: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "ocel:eid": [f"e{i}" for i in range(start, start + count)],
+            "ocel:activity": ["pack"] * count,
+            "ocel:timestamp": pd.to_datetime(["2024-01-01"] * count, utc=True),
+        }
+    )
+
+
+def test_concurrent_appends_and_filters_lose_no_rows():
+    ocel = OCEL(
+        PM4PYOCEL(
+            events=_events(0, 1),
+            objects=pd.DataFrame({"ocel:oid": ["o1"], "ocel:type": ["order"]}),
+            relations=pd.DataFrame(
+                {
+                    "ocel:eid": ["e0"],
+                    "ocel:oid": ["o1"],
+                    "ocel:activity": ["pack"],
+                    "ocel:timestamp": pd.to_datetime(["2024-01-01"], utc=True),
+                    "ocel:type": ["order"],
+                }
+            ),
+        )
+    )
+    session_ocel = SessionOCEL(ocel)
+    pipeline = [EventTypeFilter(event_types=["pack"])]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for batch in range(40):
+            events = _events(1 + 10 * batch, 10)
+            relations = pd.DataFrame({"ocel:eid": events["ocel:eid"], "ocel:oid": "o1"})
+            pool.submit(session_ocel.append, {"events": events, "relations": relations})
+            pool.submit(session_ocel.apply_filter, pipeline)
+
+    assert len(session_ocel.origin.events.df) == 401
+    assert len(session_ocel.ocel.events.df) == 401
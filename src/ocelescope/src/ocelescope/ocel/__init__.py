@@ -2,9 +2,11 @@ from ocelescope.ocel.core import OCEL
 from ocelescope.ocel.extensions.base_extension import OCELExtension
 from ocelescope.ocel.filter import (
     BaseFilter,
+    Bitset,
     E2OCountFilter,
     EventAttributeFilter,
     EventTypeFilter,
+    FilterEstimate,
     FilterResult,
     O2OCountFilter,
     ObjectAttributeFilter,
@@ -25,5 +27,7 @@ __all__ = [
     "TimeFrameFilter",
     "BaseFilter",
     "FilterResult",
+    "FilterEstimate",
+    "Bitset",
     "RelationCountSummary",
 ]
@@ -1,18 +1,22 @@
 from __future__ import annotations
 
 import warnings
+from collections.abc import Iterable
+from copy import deepcopy
+from functools import cached_property, partial
+from itertools import chain
 from os import PathLike
 from pathlib import Path
 from typing import Any
 
 import pandas as pd
-import pm4py
 import r4pm
 from pm4py.objects.ocel.obj import OCEL as PM4PYOCEL
-from pm4py.objects.ocel.obj import deepcopy
 
+from ocelescope.ocel.extensions.base_extension import OCELExtension
 from ocelescope.ocel.extensions.manager import ExtensionManager
 from ocelescope.ocel.filter.base import BaseFilter
+from ocelescope.ocel.filter.cache import FilterResultCache
 from ocelescope.ocel.managers import (
     E2OManager,
     EventsManager,
@@ -21,10 +25,25 @@ from ocelescope.ocel.managers import (
     QuantityManager,
 )
 from ocelescope.ocel.managers.attributes import AttributeManager
+from ocelescope.ocel.managers.base import BaseManager
 from ocelescope.ocel.managers.executions import ExecutionsManager
-from ocelescope.ocel.managers.quantities.util.io import read_quantity_extension
+from ocelescope.ocel.managers.quantities.util.io import (
+    read_quantity_extension,
+    read_quantity_extension_from_json,
+)
 from ocelescope.ocel.models.meta import OCELMeta
-from ocelescope.ocel.util.io import pretty_print_json, pretty_print_xml
+from ocelescope.ocel.util.append import append_rows
+from ocelescope.ocel.util.encoding import encode_ocel
+from ocelescope.ocel.util.fingerprint import (
+    LazyFingerprint,
+    ocel_fingerprint,
+    table_fingerprint,
+)
+from ocelescope.ocel.util.io import write_ocel_json, write_ocel_sqlite, write_ocel_xml
+from ocelescope.ocel.util.snapshot import read_snapshot, write_snapshot
+from ocelescope.ocel.util.sqlite import read_ocel_sqlite
+from ocelescope.ocel.util.streaming import read_ocel_json_streaming
+from ocelescope.ocel.util.view import CopyOnWriteOCEL, MaskedOCEL
 from ocelescope.ocel.util.xes import create_ocel_from_xml, write_ocel_to_xes
 
 
@@ -59,6 +78,8 @@ class OCEL:
         o2o (O2OManager):
             Manages object-to-object relations, providing typed lookups and
             relation-count summaries.
+        fingerprint (str):
+            Content hash of the log, equal for logs with identical tables.
     """
 
     def __init__(
@@ -67,16 +88,50 @@ class OCEL:
         meta: OCELMeta | None = None,
         quantityExtension: tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame] | None = None,
     ):
-        self.ocel = ocel
+        # Views and copies share the (already encoded) tables of their parent log
+        self.ocel = ocel if isinstance(ocel, (MaskedOCEL, CopyOnWriteOCEL)) else encode_ocel(ocel)
         self.meta = meta or OCELMeta()
-        self.extensions = ExtensionManager(self)
-        self.objects = ObjectsManager(self)
-        self.events = EventsManager(self)
-        self.quantities = QuantityManager(self, quantityExtension)
-        self.e2o = E2OManager(self)
-        self.o2o = O2OManager(self)
-        self.attributes = AttributeManager(self)
-        self.executions = ExecutionsManager(self)
+        self._quantity_tables = quantityExtension
+        self._fingerprint = LazyFingerprint(partial(ocel_fingerprint, self.ocel, quantityExtension))
+
+    # Managers are created on first access, so filtered views and copies that
+    # only touch a few of them do not pay for the others.
+
+    @cached_property
+    def extensions(self) -> ExtensionManager:
+        return ExtensionManager(self)
+
+    @cached_property
+    def objects(self) -> ObjectsManager:
+        return ObjectsManager(self)
+
+    @cached_property
+    def events(self) -> EventsManager:
+        return EventsManager(self)
+
+    @cached_property
+    def quantities(self) -> QuantityManager:
+        return QuantityManager(self, self._quantity_tables)
+
+    @cached_property
+    def e2o(self) -> E2OManager:
+        return E2OManager(self)
+
+    @cached_property
+    def o2o(self) -> O2OManager:
+        return O2OManager(self)
+
+    @cached_property
+    def attributes(self) -> AttributeManager:
+        return AttributeManager(self)
+
+    @cached_property
+    def executions(self) -> ExecutionsManager:
+        return ExecutionsManager(self)
+
+    @cached_property
+    def _filter_results(self) -> FilterResultCache:
+        return FilterResultCache(self)
 
     def filter(self, pipeline: list[BaseFilter]) -> OCEL:
         """
@@ -86,6 +141,16 @@ class OCEL:
         to produce a refined subset of events and objects. A new OCEL instance
         is returned containing only the items that satisfy all filters.
 
+        The mask of every filter is cached on this OCEL, keyed by the filter's
+        class and configuration, so applying an edited pipeline only evaluates
+        the filters that are new or changed. Appending rows drops the cache.
+        Filters run in the order :meth:`explain_filter` reports, cheap
+        selective ones first, with later ones only looking at the rows left.
+
+        The returned OCEL is a view: it only stores row masks over this log's
+        tables and slices a table the first time it is read. Use
+        :meth:`materialize` to obtain a standalone copy.
+
         Args:
             pipeline (list[BaseFilter]):
                 A list of filter objects, each implementing a ``filter()`` method
@@ -98,10 +163,180 @@ class OCEL:
 
         return apply_filters(ocel=self, filters=pipeline)
 
+    def explain_filter(self, pipeline: list[BaseFilter], analyze: bool = False) -> str:
+        """
+        Describe how :meth:`filter` would evaluate a sequence of filters on this OCEL.
+
+        Filters are not evaluated in pipeline order: cached results are used
+        first, then cheap filters that remove many rows run before expensive
+        ones, and later filters only look at the rows still left. The report
+        lists the chosen order with each filter's estimated cost and share of
+        rows kept.
+
+        Args:
+            pipeline (list[BaseFilter]):
+                The filters to plan.
+            analyze (bool, optional):
+                Also run the plan and report how each filter was evaluated and
+                how many events and objects were left after it.
+
+        Returns:
+            str: The plan as human-readable text.
+        """
+        from ocelescope.ocel.filter.planner import plan_filters
+
+        plan = plan_filters(self, pipeline)
+        if analyze:
+            plan.evaluate()
+        return plan.explain()
+
+    def append(
+        self,
+        events: pd.DataFrame | None = None,
+        objects: pd.DataFrame | None = None,
+        relations: pd.DataFrame | None = None,
+        o2o: pd.DataFrame | None = None,
+        object_changes: pd.DataFrame | None = None,
+    ):
+        """
+        Append batches of rows to the tables of this OCEL.
+
+        Batches use the column names of the corresponding pm4py tables.
+        Relations may leave out the activity, timestamp, and object type
+        columns, and object changes the object type; they are taken from the
+        events and objects they refer to. Timestamps are converted to the
+        log's timestamp type, with naive timestamps read as UTC.
+
+        The work done is proportional to the batches rather than the log:
+        the dictionaries of the encoded columns only gain the new values, and
+        cached activity and object type counts and the E2O and O2O adjacency
+        indices of the managers are updated rather than rebuilt. Other cached
+        results are dropped and recomputed when next used. Growing the tables
+        copies their columns once, but neither hashes nor sorts existing rows.
+
+        Filtered views created before the append keep showing the log as it
+        was. The fingerprint of the grown log combines the previous
+        fingerprint with the hashes of the batches.
+
+        Args:
+            events (pd.DataFrame | None, optional): Events to append.
+            objects (pd.DataFrame | None, optional): Objects to append.
+            relations (pd.DataFrame | None, optional): E2O relations to append.
+            o2o (pd.DataFrame | None, optional): O2O relations to append.
+            object_changes (pd.DataFrame | None, optional): Object attribute
+                changes to append.
+
+        Raises:
+            ValueError: If this OCEL is a filtered view, a batch lacks a
+                required column (e.g. the timestamp of an event), appends an
+                event or object id the log already holds (or holds one twice),
+                or has relations or object changes referring to events or
+                objects neither the log nor the batches hold. Nothing is
+                appended then.
+        """
+        if self.is_view:
+            raise ValueError("Cannot append to a filtered view, materialize it first")
+
+        batches = {
+            name: batch
+            for name, batch in {
+                "events": events,
+                "objects": objects,
+                "relations": relations,
+                "o2o": o2o,
+                "object_changes": object_changes,
+            }.items()
+            if batch is not None and len(batch) > 0
+        }
+        if not batches:
+            return
+
+        self.ocel, appended = append_rows(self.ocel, batches)
+
+        for manager in list(self.__dict__.values()):
+            if isinstance(manager, BaseManager):
+                manager._append(appended)
+
+        parts = [
+            part
+            for name, batch in batches.items()
+            for part in (name.encode(), table_fingerprint(batch))
+        ]
+        self._fingerprint = LazyFingerprint.derived(self._fingerprint, *parts)
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Content fingerprint of this OCEL.
+
+        Logs with identical tables (including the quantity tables) have the
+        same fingerprint, independent of their ``meta.id``, so it can key
+        caches and deduplicate work across instances. The tables are hashed
+        column by column on first access. Filtered views and materialized
+        logs combine the fingerprint of the log they were derived from with
+        the hash of their filter pipeline instead, and logs grown by
+        :meth:`append` with the hashes of the appended batches, so deriving
+        them never re-hashes any table.
+
+        Like the managers' caches, the fingerprint assumes the log is not
+        modified in place after it has been computed.
+
+        Returns:
+            str: The hexadecimal fingerprint.
+        """
+        return self._fingerprint()
+
+    def peek_fingerprint(self) -> str | None:
+        """
+        Return the fingerprint if it is known without hashing a table.
+
+        That is the case once :attr:`fingerprint` was read on this log, or on
+        the log a view, materialized, or grown log was derived from.
+
+        Returns:
+            str | None: The hexadecimal fingerprint, None if tables would have
+            to be hashed for it.
+        """
+        return self._fingerprint.peek()
+
+    @property
+    def is_view(self) -> bool:
+        """Whether this OCEL is a filtered view over the tables of another log."""
+        return isinstance(self.ocel, MaskedOCEL)
+
+    def materialize(self) -> OCEL:
+        """
+        Return a standalone OCEL holding only the rows selected by this view.
+
+        The result no longer references the root log, so the root can be
+        released. OCELs that are not views are returned unchanged.
+
+        Returns:
+            OCEL: The materialized OCEL instance.
+        """
+        if not isinstance(self.ocel, MaskedOCEL):
+            return self
+
+        materialized = OCEL(
+            ocel=self.ocel.materialize(),
+            meta=self.meta,
+            quantityExtension=self.quantities.tables,
+        )
+        materialized._fingerprint = self._fingerprint
+        return materialized
+
     @staticmethod
-    def read(path: str | Path, meta: dict[str, Any] = {}) -> OCEL:
+    def read(
+        path: str | Path,
+        meta: dict[str, Any] = {},
+        memory_map: bool = False,
+        streaming: bool = False,
+        tables: Iterable[str] | None = None,
+        filters: list[BaseFilter] | None = None,
+    ) -> OCEL:
         """
-        Read an OCEL file (.jsonocel, .xmlocel, or .sqlite) from disk.
+        Read an OCEL file (.jsonocel, .xmlocel, or .sqlite) or a columnar
+        snapshot (.parquetocel or .arrowocel) from disk.
 
         Automatically detects the file format based on extension and loads the
         OCEL into a structured wrapper.
@@ -111,30 +346,61 @@ class OCEL:
                 Path to the OCEL file on disk.
             meta (dict[str, Any], optional):
                 Additional metadata to attach to the OCELMeta container.
+            memory_map (bool, optional):
+                Memory-map .arrowocel snapshots instead of reading them, so
+                processes opening the same snapshot share its memory. Ignored
+                for other formats.
+            streaming (bool, optional):
+                Read .jsonocel files in a single streaming pass with bounded
+                memory, including the quantity extension. Ignored for other
+                formats.
+            tables (Iterable[str] | None, optional):
+                Names of the OCEL tables to load from a .sqlite log (e.g.
+                without "object_changes"); the others stay empty. All tables
+                are loaded by default. Ignored for other formats.
+            filters (list[BaseFilter] | None, optional):
+                A filter pipeline to apply while loading, with the same result
+                as :meth:`filter` on the whole log. If every filter only
+                depends on the event or object it masks, activities, object
+                types and time ranges are pushed down into .sqlite, snapshot,
+                and streamed .jsonocel reads, which then skip non-matching
+                rows and relations to them. Other logs are filtered after
+                loading.
 
         Returns:
             OCEL: A fully constructed OCEL wrapper instance.
         """
+        from ocelescope.ocel.filter.engine import read_predicate
 
         path = Path(path)
+        predicate = read_predicate(filters) if filters else None
+
+        if streaming and path.suffix in (".jsonocel", ".json"):
+            pm4py_ocel, quantity_extension = read_ocel_json_streaming(path, predicate=predicate)
+            quantity_table = read_quantity_extension_from_json(quantity_extension)
+        else:
+            with warnings.catch_warnings(record=True):
+                match path.suffix:
+                    case ".sqlite":
+                        pm4py_ocel = read_ocel_sqlite(path, tables=tables, predicate=predicate)
+                    case ".xmlocel" | ".xml":
+                        pm4py_ocel = r4pm.df.import_ocel_xml_pm4py(str(path))
+                    case ".jsonocel" | ".json":
+                        pm4py_ocel = r4pm.df.import_ocel_json_pm4py(str(path))
+                    case ".parquetocel" | ".arrowocel":
+                        pm4py_ocel = read_snapshot(path, memory_map=memory_map, predicate=predicate)
+                    case _:
+                        raise ValueError(f"Unsupported extension: {path.suffix}")
+
+            quantity_table = read_quantity_extension(path)
 
-        with warnings.catch_warnings(record=True):
-            match path.suffix:
-                case ".sqlite":
-                    pm4py_ocel = pm4py.read.read_ocel2_sqlite(str(path))
-                case ".xmlocel" | ".xml":
-                    pm4py_ocel = r4pm.df.import_ocel_xml_pm4py(str(path))
-                case ".jsonocel" | ".json":
-                    pm4py_ocel = r4pm.df.import_ocel_json_pm4py(str(path))
-                case _:
-                    raise ValueError(f"Unsupported extension: {path.suffix}")
-
-        quantity_table = read_quantity_extension(path)
-        return OCEL(
+        ocel = OCEL(
             ocel=pm4py_ocel, meta=OCELMeta(path=path, extra=meta), quantityExtension=quantity_table
         )
+        # The pushdown only skips rows, the filters still decide which loaded rows remain
+        return ocel.filter(filters).materialize() if filters else ocel
 
-    def write(self, path: str | Path):
+    def write(self, path: str | Path, compact: bool = False):
         """
         Write the OCEL log and all registered extensions to disk.
 
@@ -143,32 +409,63 @@ class OCEL:
             - .jsonocel
             - .xmlocel
             - .sqlite
+            - .parquetocel, .arrowocel (columnar snapshot directories)
+
+        JSON and XML logs are written in a single streaming pass and SQLite
+        logs in a single transaction, together with the quantity extension and
+        the payloads of extensions that can embed themselves; remaining
+        extensions export to the written file afterwards.
 
         Args:
             path (str | Path):
                 Destination file path.
+            compact (bool, optional):
+                Write JSON and XML logs without indentation.
 
         Raises:
             ValueError: If the file extension is not supported.
         """
         path = Path(path)
 
+        embedded: list[type[OCELExtension]] = []
         match path.suffix:
-            case ".xmlocel" | ".xml":
-                xml_path = path.with_suffix(".xml")
-                r4pm.df.export_ocel_pm4py(self.ocel, str(xml_path))
-                pretty_print_xml(xml_path)
-            case ".jsonocel" | ".json":
-                json_path = path.with_suffix(".json")
-                r4pm.df.export_ocel_pm4py(self.ocel, str(json_path))
-                pretty_print_json(json_path)
-            case ".sqlite":
-                pm4py.write_ocel2_sqlite(self.ocel, str(path))
+            case ".xmlocel" | ".xml" | ".jsonocel" | ".json" | ".sqlite":
+                extension_payloads = self.extensions.export_payloads(path)
+                embedded = list(extension_payloads)
+                payloads = list(extension_payloads.values())
+                # The quantity extension goes last, which is where its reader looks for it
+                quantity_payload = self.quantities.export_payload(path)
+                if quantity_payload is not None:
+                    payloads.append(quantity_payload)
+
+                if path.suffix in (".xmlocel", ".xml"):
+                    write_ocel_xml(
+                        self.ocel, path, elements=chain.from_iterable(payloads), compact=compact
+                    )
+                elif path.suffix == ".sqlite":
+                    write_ocel_sqlite(
+                        self.ocel,
+                        path,
+                        tables={
+                            name: table for payload in payloads for name, table in payload.items()
+                        },
+                    )
+                else:
+                    write_ocel_json(
+                        self.ocel,
+                        path,
+                        members={
+                            key: value for payload in payloads for key, value in payload.items()
+                        },
+                        compact=compact,
+                    )
+            case ".parquetocel" | ".arrowocel":
+                write_snapshot(self.ocel, path)
+                self.quantities.write_quantities(path)
             case _:
                 raise ValueError(f"Unsupported extension: {path.suffix}")
 
-        self.quantities.write_quantities(path)
-        self.extensions.export_all(path)
+        self.extensions.export_all(path, exclude=embedded)
 
     def write_xes(self, object_type: str, path: str | Path):
         """
@@ -188,21 +485,30 @@ class OCEL:
     def read_xes(path: str | PathLike, fallback_object_name: str = "LogObject") -> OCEL:
         return OCEL(ocel=create_ocel_from_xml(str(path), fallback_object_name))
 
-    def __deepcopy__(self, memo: dict[int, Any]):
-        # TODO revisit this. Are the underlying DataFrames mutable? If not, might optimize this
-        pm4py_ocel = deepcopy(self.ocel, memo)
-        ocel = OCEL(
-            ocel=pm4py_ocel,
+    def copy(self, memo: dict[int, Any] | None = None) -> OCEL:
+        """
+        Return a copy-on-write copy of this OCEL.
+
+        The copy shares the tables of this log and only duplicates a table
+        once it is modified (or replaced) on the copy, so changes never reach
+        the original. Managers of the copy start with empty caches.
+
+        Args:
+            memo (dict[int, Any], optional):
+                The ``deepcopy`` memo, used when copying the metadata.
+
+        Returns:
+            OCEL: The copied OCEL instance.
+        """
+        oqty, qop, properties = self.quantities.tables
+        return OCEL(
+            ocel=CopyOnWriteOCEL(self.ocel),
             meta=OCELMeta(extra=deepcopy(self.meta.extra, memo)),
-            quantityExtension=(
-                self.quantities.oqty.copy(),
-                self.quantities.qop.copy(),
-                self.quantities.properties.copy(),
-            )
-            if self.quantities.is_populated()
-            else None,
+            quantityExtension=(oqty, qop, properties.copy()),
         )
-        return ocel
+
+    def __deepcopy__(self, memo: dict[int, Any]):
+        return self.copy(memo)
 
     def __str__(self):
         return f"OCEL [{len(self.events.df)} events, {len(self.objects.df)} objects]"
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from ocelescope.ocel.constants.misc import OCELFileExtensions
 
@@ -42,3 +42,16 @@ class OCELExtension(ABC):
         Write the extension data to the given path.
         """
         pass
+
+    def export_payload(self, path: Path) -> Any | None:
+        """
+        Serialize the extension data for embedding it into the log exported to the given path.
+
+        For JSON logs, return a mapping of members to add to the root object
+        (iterators in values are written as arrays). For XML logs, return an
+        iterable of serialized elements to append to the log root. For SQLite
+        logs, return a mapping of table names to DataFrames. The default
+        returns None, in which case the log is written first and
+        ``export_extension`` is called on the written file.
+        """
+        return None
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, TypeVar
+from typing import TYPE_CHECKING, Any, Dict, TypeVar
 
 from ocelescope.ocel.extensions.base_extension import OCELExtension
 
@@ -76,7 +77,29 @@ class ExtensionManager:
         """
         return list(self._extensions.values())
 
-    def export_all(self, target_path: Path):
+    def export_payloads(self, target_path: Path) -> dict[type[OCELExtension], Any]:
+        """Collect the payloads of loaded extensions that embed themselves into the written log.
+
+        Only extensions that support the target file's extension are asked.
+
+        Args:
+            target_path: The destination path for the main OCEL file write.
+
+        Returns:
+            The payloads by extension class, in the order the extensions were loaded.
+        """
+        payloads = {}
+        for ext_cls, ext in self._extensions.items():
+            try:
+                if target_path.suffix in getattr(ext, "supported_extensions", []):
+                    payload = ext.export_payload(target_path)
+                    if payload is not None:
+                        payloads[ext_cls] = payload
+            except (OSError, ValueError, TypeError, KeyError) as exc:
+                print(f"[ExtensionManager] Failed to export {type(ext).__name__}: {exc}")
+        return payloads
+
+    def export_all(self, target_path: Path, exclude: Iterable[type[OCELExtension]] = ()):
         """Export all loaded extensions to disk.
 
         Only extensions that support the target file's extension are exported.
@@ -84,8 +107,13 @@ class ExtensionManager:
 
         Args:
             target_path: The destination path for the main OCEL file write.
+            exclude: Extension classes to skip, e.g. because their payload was
+                already embedded into the written log.
         """
-        for ext in self._extensions.values():
+        exclude = set(exclude)
+        for ext_cls, ext in self._extensions.items():
+            if ext_cls in exclude:
+                continue
             try:
                 if target_path.suffix in getattr(ext, "supported_extensions", []):
                     ext.export_extension(target_path)
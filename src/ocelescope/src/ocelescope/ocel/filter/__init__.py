@@ -1,4 +1,4 @@
-from ocelescope.ocel.filter.base import BaseFilter, FilterResult
+from ocelescope.ocel.filter.base import BaseFilter, FilterEstimate, FilterResult
 from ocelescope.ocel.filter.filters.attribute import EventAttributeFilter, ObjectAttributeFilter
 from ocelescope.ocel.filter.filters.entity_type import (
     EventTypeFilter,
@@ -6,6 +6,8 @@ from ocelescope.ocel.filter.filters.entity_type import (
 )
 from ocelescope.ocel.filter.filters.relation_count import E2OCountFilter, O2OCountFilter
 from ocelescope.ocel.filter.filters.time_range import TimeFrameFilter
+from ocelescope.ocel.filter.planner import FilterPlan, PlanStep, plan_filters
+from ocelescope.ocel.util.bitset import Bitset
 
 __all__ = [
     "ObjectTypeFilter",
@@ -17,4 +19,9 @@ __all__ = [
     "TimeFrameFilter",
     "BaseFilter",
     "FilterResult",
+    "FilterEstimate",
+    "Bitset",
+    "FilterPlan",
+    "PlanStep",
+    "plan_filters",
 ]
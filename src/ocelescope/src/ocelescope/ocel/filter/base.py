@@ -1,22 +1,61 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING
 
-from pandas import Series
+from pandas import Index, RangeIndex, Series
 from pydantic import BaseModel
 
+from ocelescope.ocel.util.bitset import Bitset
+from ocelescope.ocel.util.pushdown import ReadPredicate
+
 if TYPE_CHECKING:
     from ocelescope.ocel.core.ocel import OCEL
 
 
+Mask = Series | Bitset
+
+
+def _as_bitset(mask: Mask, index: Index) -> Bitset:
+    """Return a mask as a bitset over the rows of a table with the given index.
+
+    Series are aligned by index like Series combined with each other, rows
+    they leave out being dropped.
+    """
+    if isinstance(mask, Bitset):
+        return mask
+    if not mask.index.equals(index):
+        mask = mask.reindex(index, fill_value=False)
+    return Bitset.from_mask(mask.to_numpy(dtype=bool, na_value=False))
+
+
 @dataclass()
 class FilterResult:
-    events: Optional[Series] = None
-    objects: Optional[Series] = None
+    """Masks over the events and objects of a log (None masks nothing).
 
-    def and_merge(self, other: "FilterResult") -> "FilterResult":
-        def _and(a, b):
+    A mask is either a boolean ``Series`` over the table's index or a
+    `Bitset` over its row positions. Bitsets are eight times smaller and
+    combine without index alignment, so filters computing their masks with
+    numpy return them. Series are always aligned by index, also when
+    combined with bitsets.
+    """
+
+    events: Mask | None = None
+    objects: Mask | None = None
+
+    def and_merge(self, other: "FilterResult", ocel: "OCEL | None" = None) -> "FilterResult":
+        """Combine two results into one keeping the rows both keep.
+
+        Combining a Series with a Bitset aligns the Series to the table of
+        the given log. Without a log, the Series' labels are read as row
+        positions, which only holds for tables with a default RangeIndex.
+        """
+
+        def _and(a, b, table):
             if a is not None and b is not None:
+                if isinstance(a, Bitset) or isinstance(b, Bitset):
+                    size = len(a) if isinstance(a, Bitset) else len(b)
+                    index = getattr(ocel, table).df.index if ocel is not None else RangeIndex(size)
+                    return _as_bitset(a, index) & _as_bitset(b, index)
                 return a & b
             elif a is not None:
                 return a
@@ -26,12 +65,69 @@ class FilterResult:
                 return None
 
         return FilterResult(
-            events=_and(self.events, other.events),
-            objects=_and(self.objects, other.objects),
+            events=_and(self.events, other.events, "events"),
+            objects=_and(self.objects, other.objects, "objects"),
         )
 
 
+@dataclass(frozen=True)
+class FilterEstimate:
+    """Estimated cost and selectivity of a filter on a log.
+
+    Attributes:
+        cost: Rough number of row operations evaluating the filter on all rows takes.
+        events: Estimated share of events the filter keeps (1.0 if unknown),
+            None if it does not mask events.
+        objects: Estimated share of objects the filter keeps (1.0 if unknown),
+            None if it does not mask objects.
+    """
+
+    cost: float
+    events: float | None = 1.0
+    objects: float | None = 1.0
+
+
 class BaseFilter(ABC, BaseModel):
     @abstractmethod
     def filter(self, ocel: "OCEL") -> FilterResult:
         pass
+
+    def pushdown(self) -> ReadPredicate | None:
+        """Return the rows a reader has to load for this filter to see the same result.
+
+        Only filters whose mask for an event or object depends on nothing but
+        that event or object can be evaluated on a partially loaded log. Such
+        filters return the conditions a reader can check while loading (an
+        empty predicate if they cannot be checked that early); all others
+        return None, which disables pushdown for the whole pipeline.
+        """
+        return None
+
+    def estimate(self, ocel: "OCEL") -> FilterEstimate:
+        """Estimate the cost and selectivity of the filter, used to order a pipeline.
+
+        Estimates have to be cheap, ideally answered from cached counts. The
+        default assumes a scan over all events and objects that keeps them all.
+        """
+        return FilterEstimate(cost=len(ocel.events.df) + len(ocel.objects.df))
+
+    def prepare(self, ocel: "OCEL"):
+        """Build the managers, tables, and cached indices the filter reads.
+
+        Managers and cached results are built on first access without a
+        lock, so filters evaluated concurrently must only read them. The
+        planner calls this for every filter before evaluating any of them
+        concurrently. The default builds the event and object tables.
+        """
+        _ = ocel.events.df, ocel.objects.df
+
+    def filter_candidates(self, ocel: "OCEL", candidates: FilterResult) -> FilterResult:
+        """Evaluate the filter for the rows that passed the filters run before it.
+
+        ``candidates`` holds the masks combined so far, as boolean Series
+        over all events and objects. The result only has to be correct for
+        candidate rows, and its masks may leave out other rows altogether.
+        Filters that can skip work for non-candidate rows override this; the
+        default evaluates the filter on all rows.
+        """
+        return self.filter(ocel)
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from cachetools import LRUCache
+from cachetools.keys import hashkey
+
+from ocelescope.ocel.filter.base import BaseFilter, FilterResult
+from ocelescope.ocel.managers.base import BaseManager
+from ocelescope.ocel.util.fingerprint import filter_key
+
+if TYPE_CHECKING:
+    from ocelescope.ocel.core.ocel import OCEL
+
+# Each result holds a mask per event and object, so fewer results are kept
+# than the managers keep cached values
+MAX_CACHED_RESULTS = 32
+
+
+class FilterResultCache(BaseManager):
+    """The results of single filters evaluated on a log, keyed by their configuration.
+
+    Filters with equal classes and configurations share a result, so
+    re-applying a pipeline only evaluates the filters that were added or
+    changed since it was last applied. Results are dropped when rows are
+    appended to the log.
+    """
+
+    def __init__(self, ocel: OCEL):
+        super().__init__(ocel)
+        self.cache = LRUCache(maxsize=MAX_CACHED_RESULTS)
+
+    def cached(self, filter: BaseFilter) -> FilterResult | None:
+        """Return the cached result of a filter (None if it was not evaluated yet)."""
+        with self.cache_lock:
+            return self.cache.get(hashkey("result", filter_key(filter)))
+
+    def result(self, filter: BaseFilter) -> FilterResult:
+        """Return the result of a filter on the log, evaluating it on first use."""
+        key = hashkey("result", filter_key(filter))
+        with self.cache_lock:
+            result = self.cache.get(key)
+        if result is None:
+            result = filter.filter(self._ocel)
+            with self.cache_lock:
+                self.cache[key] = result
+        return result
@@ -1,25 +1,34 @@
-from typing import TYPE_CHECKING, Optional, cast
+from functools import reduce
+from typing import TYPE_CHECKING
 
-import pandas as pd
-import pm4py
-
-from ocelescope.ocel.constants.pm4py import OID_COL
 from ocelescope.ocel.filter.base import BaseFilter, FilterResult
+from ocelescope.ocel.filter.planner import plan_filters
+from ocelescope.ocel.util.fingerprint import LazyFingerprint, pipeline_fingerprint
+from ocelescope.ocel.util.pushdown import ReadPredicate
+from ocelescope.ocel.util.view import mask_ocel
 
 if TYPE_CHECKING:
     from ocelescope.ocel.core.ocel import OCEL
 
 
-def compute_combined_masks(ocel: "OCEL", filters: list[BaseFilter]) -> FilterResult:
-    combined = FilterResult(
-        events=pd.Series(True, index=ocel.events.df.index),
-        objects=pd.Series(True, index=ocel.objects.df.index),
-    )
+def compute_combined_masks(
+    ocel: "OCEL", filters: list[BaseFilter], max_workers: int | None = None
+) -> FilterResult:
+    """Combine the masks of all filters, evaluated in the order `plan_filters` chooses.
+
+    Independent filters are evaluated concurrently on up to ``max_workers``
+    threads (see `FilterPlan.evaluate`).
+    """
+    return plan_filters(ocel, filters).evaluate(max_workers=max_workers)
 
-    for filter in filters:
-        combined = combined.and_merge(filter.filter(ocel))
 
-    return combined
+def read_predicate(filters: list[BaseFilter]) -> ReadPredicate | None:
+    """Combine the pushdown predicates of a pipeline, None if any filter cannot be pushed down."""
+    predicates = [filter.pushdown() for filter in filters]
+    if any(predicate is None for predicate in predicates):
+        return None
+
+    return reduce(ReadPredicate.__and__, predicates, ReadPredicate())
 
 
 def apply_filters(ocel: "OCEL", filters: list[BaseFilter]) -> "OCEL":
@@ -27,35 +36,16 @@ def apply_filters(ocel: "OCEL", filters: list[BaseFilter]) -> "OCEL":
 
     masks = compute_combined_masks(ocel, filters)
 
-    filtered_event_ids: Optional[pd.Series] = (
-        cast(pd.Series, ocel.events.df[ocel.ocel.event_id_column][masks.events])
-        if masks.events is not None
-        else None
-    )
-
-    filtered_object_ids: Optional[pd.Series] = (
-        cast(pd.Series, ocel.objects.df[OID_COL][masks.objects])
-        if masks.objects is not None
-        else None
-    )
-
-    filtered_ocel = ocel.ocel
-
-    if filtered_event_ids is not None:
-        filtered_ocel = pm4py.filter_ocel_events(filtered_ocel, filtered_event_ids, positive=True)
-
-    if filtered_object_ids is not None:
-        filtered_ocel = pm4py.filter_ocel_objects(filtered_ocel, filtered_object_ids, positive=True)
-
-    # TODO: Don't do this step
+    # The filtered OCEL is a view holding row masks over the root log's tables
     filtered_ocel = OCEL(
-        filtered_ocel,
+        mask_ocel(ocel.ocel, events=masks.events, objects=masks.objects),
         ocel.meta,
         # TODO: Clean up quantities
-        quantityExtension=(ocel.quantities.oqty, ocel.quantities.qop, ocel.quantities.properties)
-        if ocel.quantities.is_populated
-        else None,
+        quantityExtension=ocel.quantities.tables,
+    )
+    # Only the source's (lazy) fingerprint is kept, not the source itself
+    filtered_ocel._fingerprint = LazyFingerprint.derived(
+        ocel._fingerprint, pipeline_fingerprint(filters)
     )
-    filtered_ocel.meta = ocel.meta
 
     return filtered_ocel
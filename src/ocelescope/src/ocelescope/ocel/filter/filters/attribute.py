@@ -6,9 +6,15 @@ from pandas.core.frame import DataFrame
 from pandas.core.series import Series
 from pydantic.main import BaseModel
 
-from ocelescope.ocel.util.attributes import get_objects_with_object_changes
+from ocelescope.ocel.constants.pm4py import OTYPE_COL
+from ocelescope.ocel.util.pushdown import ReadPredicate
 
-from ..base import BaseFilter, FilterResult
+from ..base import BaseFilter, FilterEstimate, FilterResult
+
+# Per-row cost of checking an attribute value, relative to looking up a type,
+# and of matching it against a regular expression
+_CHECK_COST = 4
+_REGEX_COST = 20
 
 
 class AttributeFilterConfig(BaseModel):
@@ -71,30 +77,62 @@ def filter_by_attribute(attribute_df: DataFrame, type_column: str, config: Attri
     return final_mask
 
 
+def _check_cost(config: AttributeFilterConfig) -> int:
+    return _REGEX_COST if config.regex is not None else _CHECK_COST
+
+
 class EventAttributeFilter(BaseFilter, AttributeFilterConfig):
     def filter(self, ocel):
+        return self._filter_events(ocel, ocel.events.df)
+
+    def filter_candidates(self, ocel, candidates):
+        if candidates.events is None:
+            return self.filter(ocel)
+        return self._filter_events(ocel, ocel.events.df[candidates.events])
+
+    def _filter_events(self, ocel, events: DataFrame) -> FilterResult:
         return FilterResult(
             events=filter_by_attribute(
-                ocel.events.df,
+                events,
                 ocel.ocel.event_activity,
                 config=AttributeFilterConfig(**self.model_dump()),
             )
         )
 
+    def estimate(self, ocel):
+        return FilterEstimate(cost=len(ocel.events.df) * _check_cost(self), objects=None)
+
+    def pushdown(self):
+        # Depends on each event's own attributes only, but is checked after loading
+        return ReadPredicate()
+
 
 class ObjectAttributeFilter(BaseFilter, AttributeFilterConfig):
     def filter(self, ocel):
-        enriched_objects = get_objects_with_object_changes(ocel.ocel)
+        return self._filter_objects(ocel, None)
 
-        filtered_rows = enriched_objects[
-            filter_by_attribute(
-                enriched_objects,
-                ocel.ocel.object_type_column,
-                config=AttributeFilterConfig(**self.model_dump()),
-            )
-        ]
-        valid_ids = filtered_rows[ocel.ocel.object_id_column].unique()  # type:ignore
+    def filter_candidates(self, ocel, candidates):
+        return self._filter_objects(ocel, candidates.objects)
+
+    def _filter_objects(self, ocel, candidates: Series | None) -> FilterResult:
+        objects = ocel.objects.df
+        latest = ocel.objects.latest_attributes
+        if candidates is not None:
+            objects, latest = objects[candidates], latest[candidates]
 
         return FilterResult(
-            objects=ocel.ocel.objects[ocel.ocel.object_id_column].isin(valid_ids)  # type:ignore
+            objects=filter_by_attribute(
+                latest[[column for column in latest.columns if column == self.attribute]].assign(
+                    **{OTYPE_COL: objects[OTYPE_COL]}
+                ),
+                OTYPE_COL,
+                config=AttributeFilterConfig(**self.model_dump()),
+            )
         )
+
+    def estimate(self, ocel):
+        return FilterEstimate(cost=len(ocel.objects.df) * _check_cost(self), events=None)
+
+    def pushdown(self):
+        # Depends on each object's own attribute history only, but is checked after loading
+        return ReadPredicate()
@@ -1,9 +1,21 @@
-from typing import Literal, cast
+from typing import Literal
 
 import pandas as pd
 
 from ocelescope.ocel.constants.pm4py import ACTIVITY_COL, OTYPE_COL
-from ocelescope.ocel.filter.base import BaseFilter, FilterResult
+from ocelescope.ocel.filter.base import BaseFilter, FilterEstimate, FilterResult
+from ocelescope.ocel.util.bitset import Bitset
+from ocelescope.ocel.util.encoding import is_in
+from ocelescope.ocel.util.pushdown import ReadPredicate
+
+
+def _share(counts: pd.Series, types: list[str], mode: str) -> float:
+    """Return the share of rows a type filter keeps, from the counts per type."""
+    total = counts.sum()
+    if total == 0:
+        return 1.0
+    share = counts[counts.index.isin(types)].sum() / total
+    return float(1 - share if mode == "exclude" else share)
 
 
 class EventTypeFilter(BaseFilter):
@@ -11,11 +23,23 @@ class EventTypeFilter(BaseFilter):
     mode: Literal["exclude", "include"] = "include"
 
     def filter(self, ocel):
-        mask = cast(pd.Series, ocel.events.df[ACTIVITY_COL].isin(self.event_types))
+        mask = is_in(ocel.events.df[ACTIVITY_COL], self.event_types)
         if self.mode == "exclude":
             mask = ~mask
 
-        return FilterResult(events=mask)
+        return FilterResult(events=Bitset.from_mask(mask))
+
+    def estimate(self, ocel):
+        return FilterEstimate(
+            cost=len(ocel.events.df),
+            events=_share(ocel.events.activity_counts, self.event_types, self.mode),
+            objects=None,
+        )
+
+    def pushdown(self):
+        if self.mode == "exclude":
+            return ReadPredicate(excluded_activities=frozenset(self.event_types))
+        return ReadPredicate(activities=frozenset(self.event_types))
 
 
 class ObjectTypeFilter(BaseFilter):
@@ -23,9 +47,21 @@ class ObjectTypeFilter(BaseFilter):
     mode: Literal["exclude", "include"] = "include"
 
     def filter(self, ocel):
-        mask = cast(pd.Series, ocel.objects.df[OTYPE_COL].isin(self.object_types))
+        mask = is_in(ocel.objects.df[OTYPE_COL], self.object_types)
 
         if self.mode == "exclude":
             mask = ~mask
 
-        return FilterResult(objects=mask)
+        return FilterResult(objects=Bitset.from_mask(mask))
+
+    def estimate(self, ocel):
+        return FilterEstimate(
+            cost=len(ocel.objects.df),
+            events=None,
+            objects=_share(ocel.objects.counts, self.object_types, self.mode),
+        )
+
+    def pushdown(self):
+        if self.mode == "exclude":
+            return ReadPredicate(excluded_object_types=frozenset(self.object_types))
+        return ReadPredicate(object_types=frozenset(self.object_types))
@@ -1,13 +1,23 @@
-from typing import Literal, Optional, cast
+from typing import Literal, Optional
 
+import numpy as np
 import pandas as pd
-from pandas.core.frame import DataFrame
-from pandas.core.series import Series
 from pydantic import BaseModel
 
-from ocelescope.ocel.constants.pm4py import OID_COL
-from ocelescope.ocel.filter.base import BaseFilter, FilterResult
-from ocelescope.ocel.util.relations import getO2OWithTypes
+from ocelescope.ocel.constants.pm4py import (
+    ACTIVITY_COL,
+    E2O_QUALIFIER,
+    EID_COL,
+    O2O_QUALIFIER,
+    OID_COL,
+    OTYPE_COL,
+)
+from ocelescope.ocel.filter.base import BaseFilter, FilterEstimate, FilterResult
+from ocelescope.ocel.util.bitset import Bitset
+from ocelescope.ocel.util.encoding import codes, lookup, to_code
+
+# Per-row cost of counting relations (a bincount), relative to looking up a type
+_COUNT_COST = 2
 
 
 class RelationCountFilterConfig(BaseModel):
@@ -18,101 +28,86 @@ class RelationCountFilterConfig(BaseModel):
     qualifier: Optional[str] = None
 
 
-def filter_by_relation_counts(
-    relation_table: pd.DataFrame,
-    source_id_column: str,
-    source_column: str,
-    target_column: str,
-    qualifier_column: str,
-    entity_id_column: str,
-    entity_type_column: str,
-    source_df: pd.DataFrame,
-    config: RelationCountFilterConfig,
-):
-    # Get o2o with types if not provided
-    relation_table = cast(
-        DataFrame,
-        relation_table[
-            (relation_table[source_column] == config.source)
-            & (relation_table[target_column] == config.target)
-        ],
-    )
-
-    if config.qualifier is not None:
-        relation_table = cast(
-            DataFrame,
-            relation_table[relation_table[qualifier_column] == config.qualifier],
-        )
+def _equals(column: pd.Series, value: str) -> np.ndarray:
+    """Mark the rows of an encoded column holding a value."""
+    code = to_code(value, column)
+    if code < 0:
+        return np.zeros(len(column), dtype=bool)
+    return codes(column) == code
 
-    # Count how many times each target appears
-    entity_counts = cast(Series, relation_table.groupby(source_id_column).size()).reset_index(
-        name="entity_count"
-    )
 
-    min_count, max_count = config.range
+def relation_count_mask(
+    sources: np.ndarray,
+    relevant: np.ndarray,
+    entities: np.ndarray,
+    is_source_type: np.ndarray,
+    size: int,
+    config: RelationCountFilterConfig,
+) -> np.ndarray:
+    """Mask entities of the source type by their number of relevant relations.
+
+    The relations are counted per source id code with a single bincount, so
+    entities without relevant relations simply count zero. Entities of other
+    types are always kept.
+
+    Args:
+        sources: The source id code of every relation.
+        relevant: Whether each relation connects the configured types (and
+            has the configured qualifier).
+        entities: The id code of every entity in the source table.
+        is_source_type: Whether each entity has the configured source type.
+        size: The size of the id dictionary.
+        config: The range and mode of the filter.
+    """
+    counted = relevant & (sources >= 0)
+    # The spare last slot counts zero for entities without an id
+    counts = np.bincount(sources[counted], minlength=size + 1)[entities]
 
+    min_count, max_count = config.range
+    in_range = np.ones(len(entities), dtype=bool)
     if min_count is not None:
-        entity_counts = entity_counts[entity_counts["entity_count"] >= min_count]
+        in_range &= counts >= min_count
     if max_count is not None:
-        entity_counts = entity_counts[entity_counts["entity_count"] <= max_count]
-    entity_counts = cast(Series, entity_counts[source_id_column])
-
-    if min_count == 0:
-        merged = pd.merge(
-            source_df[source_df[entity_type_column] == config.source],
-            relation_table,
-            left_on=entity_id_column,
-            right_on=source_id_column,
-            how="left",
-            indicator=True,
-        )
-        entities_with_no_relations = merged.loc[merged["_merge"] == "left_only", entity_id_column]
-
-        entity_counts = pd.concat([entity_counts, entities_with_no_relations])
-
-    # Mask for non-target-type objects (always kept)
-    is_not_target_type = source_df[entity_type_column] != config.source
+        in_range &= counts <= max_count
 
-    # Mask for objects meeting the relation count condition
-    is_in_filtered_ids = source_df[entity_id_column].isin(entity_counts)
-
-    # Invert if in exclude mode
     if config.mode == "exclude":
-        is_in_filtered_ids = ~is_in_filtered_ids
-
-    # Final mask: keep non-target-type or qualifying objects
-    final_mask = cast(Series, is_not_target_type | is_in_filtered_ids)
+        in_range = ~in_range
 
-    return final_mask
+    return ~is_source_type | in_range
 
 
 class E2OCountFilter(BaseFilter, RelationCountFilterConfig):
     direction: Literal["source", "target"] = "source"
 
+    def _columns(self) -> tuple[str, str, str]:
+        """Return the id, source type, and target type columns of the relations."""
+        if self.direction == "source":
+            return EID_COL, ACTIVITY_COL, OTYPE_COL
+        return OID_COL, OTYPE_COL, ACTIVITY_COL
+
+    def _entities(self, ocel) -> pd.DataFrame:
+        return ocel.events.df if self.direction == "source" else ocel.objects.df
+
     def filter(self, ocel):
-        source_column = (
-            ocel.ocel.event_activity if self.direction == "source" else ocel.ocel.object_type_column
-        )
-        target_column = (
-            ocel.ocel.object_type_column if self.direction == "source" else ocel.ocel.event_activity
-        )
-        source_id_column = (
-            ocel.ocel.event_id_column if self.direction == "source" else ocel.ocel.object_id_column
+        relations = ocel.ocel.relations
+        entities = self._entities(ocel)
+        id_column, source_column, target_column = self._columns()
+
+        relevant = _equals(relations[source_column], self.source) & _equals(
+            relations[target_column], self.target
         )
-        entity_id_column = source_id_column
-        qualifier_column = ocel.ocel.qualifier
-        entity_type_column = source_column
-
-        mask = filter_by_relation_counts(
-            relation_table=ocel.e2o,
-            source_column=source_column,
-            target_column=target_column,
-            source_id_column=source_id_column,
-            qualifier_column=qualifier_column,
-            entity_id_column=entity_id_column,
-            entity_type_column=entity_type_column,
-            source_df=ocel.events.df if self.direction == "source" else ocel.objects.df,
-            config=RelationCountFilterConfig(**self.model_dump()),
+        if self.qualifier is not None:
+            relevant &= _equals(relations[E2O_QUALIFIER], self.qualifier)
+
+        mask = Bitset.from_mask(
+            relation_count_mask(
+                sources=codes(relations[id_column]),
+                relevant=relevant,
+                entities=codes(entities[id_column]),
+                is_source_type=_equals(entities[source_column], self.source),
+                size=len(entities[id_column].cat.categories),
+                config=self,
+            )
         )
 
         return FilterResult(
@@ -120,23 +115,50 @@ class E2OCountFilter(BaseFilter, RelationCountFilterConfig):
             objects=mask if self.direction == "target" else None,
         )
 
+    def prepare(self, ocel):
+        super().prepare(ocel)
+        _ = ocel.ocel.relations
+
+    def estimate(self, ocel):
+        events = self.direction == "source"
+        return FilterEstimate(
+            cost=len(self._entities(ocel)) + len(ocel.ocel.relations) * _COUNT_COST,
+            events=1.0 if events else None,
+            objects=None if events else 1.0,
+        )
+
 
 class O2OCountFilter(BaseFilter, RelationCountFilterConfig):
     direction: Literal["source", "target"] = "source"
 
     def filter(self, ocel):
-        o2oTable = getO2OWithTypes(ocel.ocel, direction=self.direction)
-
-        mask = filter_by_relation_counts(
-            relation_table=o2oTable,
-            source_column="source_type",
-            target_column="target_type",
-            source_id_column="source",
-            qualifier_column="qualifier",
-            entity_id_column=OID_COL,
-            entity_type_column=OID_COL,
-            source_df=ocel.objects.df,
-            config=RelationCountFilterConfig(**self.model_dump()),
+        o2o, objects = ocel.ocel.o2o, ocel.objects.df
+        sources, targets = o2o[OID_COL], o2o[f"{OID_COL}_2"]
+        if self.direction == "target":
+            sources, targets = targets, sources
+
+        relevant = _equals(
+            lookup(sources, objects[OID_COL], objects[OTYPE_COL]), self.source
+        ) & _equals(lookup(targets, objects[OID_COL], objects[OTYPE_COL]), self.target)
+        if self.qualifier is not None:
+            relevant &= _equals(o2o[O2O_QUALIFIER], self.qualifier)
+
+        mask = relation_count_mask(
+            sources=codes(sources),
+            relevant=relevant,
+            entities=codes(objects[OID_COL]),
+            is_source_type=_equals(objects[OTYPE_COL], self.source),
+            size=len(objects[OID_COL].cat.categories),
+            config=self,
         )
 
-        return FilterResult(objects=mask)
+        return FilterResult(objects=Bitset.from_mask(mask))
+
+    def prepare(self, ocel):
+        super().prepare(ocel)
+        _ = ocel.ocel.o2o
+
+    def estimate(self, ocel):
+        return FilterEstimate(
+            cost=len(ocel.objects.df) + len(ocel.ocel.o2o) * _COUNT_COST, events=None
+        )
@@ -1,8 +1,8 @@
 from typing import Literal, Optional
 
-import pandas as pd
-
-from ocelescope.ocel.filter.base import BaseFilter, FilterResult
+from ocelescope.ocel.filter.base import BaseFilter, FilterEstimate, FilterResult
+from ocelescope.ocel.util.bitset import Bitset
+from ocelescope.ocel.util.pushdown import ReadPredicate, utc_timestamp
 
 
 class TimeFrameFilter(BaseFilter):
@@ -12,19 +12,32 @@ class TimeFrameFilter(BaseFilter):
     def filter(self, ocel):
         start_time, end_time = self.time_range
 
-        if start_time is not None:
-            start_time = pd.Timestamp(start_time, tz="UTC")
-        if end_time is not None:
-            end_time = pd.Timestamp(end_time, tz="UTC")
+        # Naive bounds and timestamps are both read as UTC
+        mask = ocel.events.time_index.mask(start_time, end_time)
+        if self.mode == "exclude":
+            mask = ~mask
+
+        return FilterResult(events=Bitset.from_mask(mask))
 
-        events_df = ocel.events.df
+    def prepare(self, ocel):
+        _ = ocel.events.time_index
 
-        mask = pd.Series([True] * len(events_df), index=events_df.index)
-        if start_time is not None:
-            mask &= events_df["ocel:timestamp"] >= start_time
-        if end_time is not None:
-            mask &= events_df["ocel:timestamp"] <= end_time
+    def estimate(self, ocel):
+        index = ocel.events.time_index
+        span = index.span(*self.time_range)
+        share = (span.stop - span.start) / index.size if index.size > 0 else 1.0
+        return FilterEstimate(
+            cost=index.size,
+            events=1 - share if self.mode == "exclude" else share,
+            objects=None,
+        )
+
+    def pushdown(self):
         if self.mode == "exclude":
-            mask = ~mask
+            return ReadPredicate()
 
-        return FilterResult(events=mask)
+        start_time, end_time = self.time_range
+        return ReadPredicate(
+            start=utc_timestamp(start_time) if start_time is not None else None,
+            end=utc_timestamp(end_time) if end_time is not None else None,
+        )
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal
+
+import pandas as pd
+
+from ocelescope.ocel.filter.base import BaseFilter, FilterEstimate, FilterResult, _as_bitset
+from ocelescope.ocel.util.bitset import Bitset
+
+if TYPE_CHECKING:
+    from ocelescope.ocel.core.ocel import OCEL
+
+StepOutcome = Literal["cached", "evaluated", "candidates", "skipped"]
+
+# Filters of a tier, evaluated concurrently, differ in rank by at most this
+# factor, so a tier does little work a filter ranked before it could have saved
+_TIER_RATIO = 2.0
+
+
+@dataclass
+class PlanStep:
+    """A filter of a plan, with its estimate and how it was evaluated.
+
+    Attributes:
+        position: Position of the filter in the pipeline.
+        filter: The filter.
+        estimate: The filter's estimated cost and selectivity.
+        cached: Whether the filter's result was cached when the plan was made.
+        outcome: How the filter was evaluated (None until the plan is run):
+            its cached result was used, it was evaluated on all rows (and its
+            result cached, possibly concurrently with other filters), only on
+            the candidate rows (not cached), or it was skipped as the tables
+            it masks were empty already.
+        events: Events left after the step (None until the plan is run).
+        objects: Objects left after the step (None until the plan is run).
+    """
+
+    position: int
+    filter: BaseFilter
+    estimate: FilterEstimate
+    cached: bool
+    outcome: StepOutcome | None = None
+    events: int | None = None
+    objects: int | None = None
+
+    @property
+    def kept(self) -> float:
+        """The estimated share of rows the filter keeps, over the tables it masks."""
+        events, objects = self.estimate.events, self.estimate.objects
+        return (1.0 if events is None else events) * (1.0 if objects is None else objects)
+
+    @property
+    def rank(self) -> float:
+        """Cost per share of rows removed; steps run in increasing rank."""
+        if self.cached:
+            return 0.0
+        removed = 1.0 - self.kept
+        return self.estimate.cost / removed if removed > 0 else float("inf")
+
+
+def _narrows(filter: BaseFilter) -> bool:
+    """Whether a filter does less work on candidate rows than on all rows."""
+    return type(filter).filter_candidates is not BaseFilter.filter_candidates
+
+
+def _independent(step: PlanStep) -> bool:
+    """Whether a step's filter is evaluated on all rows, regardless of the steps before it."""
+    return not step.cached and not _narrows(step.filter)
+
+
+@dataclass
+class FilterPlan:
+    """The order in which the filters of a pipeline are evaluated on a log.
+
+    Filters whose results are cached come first, the others follow by their
+    estimated cost per share of rows removed, so cheap selective filters run
+    before expensive ones. Once the masks combined so far exclude some rows,
+    filters that can skip work for excluded rows are only evaluated on the
+    remaining candidates. All other filters are evaluated on all rows, so
+    their results can be cached. Consecutive ones of similar rank form a
+    tier and are evaluated concurrently, as they do not depend on each
+    other. Filters masking tables that are empty already when their step
+    (or tier) is reached are skipped. The combined masks are the same as
+    evaluating every filter on all rows.
+    """
+
+    ocel: OCEL = field(repr=False)
+    steps: list[PlanStep]
+
+    def _tiers(self) -> list[list[PlanStep]]:
+        """Split the steps into runs evaluated together, in plan order.
+
+        Uncached filters evaluated on all rows whose ranks are within
+        `_TIER_RATIO` of the first one's form a tier; every other step is a
+        tier of its own.
+        """
+        tiers: list[list[PlanStep]] = []
+        for step in self.steps:
+            tier = tiers[-1] if tiers else None
+            if (
+                tier is not None
+                and _independent(tier[0])
+                and _independent(step)
+                and step.rank <= tier[0].rank * _TIER_RATIO
+            ):
+                tier.append(step)
+            else:
+                tiers.append([step])
+        return tiers
+
+    def _evaluate_concurrently(
+        self, steps: list[PlanStep], max_workers: int | None
+    ) -> dict[int, FilterResult]:
+        """Evaluate the filters of a tier on all rows, keyed by pipeline position.
+
+        numpy, and pandas for most column operations, release the GIL while
+        scanning, so the filters use several cores. Everything they read is
+        built before the threads start (see `BaseFilter.prepare`).
+        """
+        cache = self.ocel._filter_results
+        pending = [step for step in steps if cache.cached(step.filter) is None]
+        if len(pending) <= 1 or max_workers == 1:
+            return {}
+
+        for step in pending:
+            step.filter.prepare(self.ocel)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(lambda step: cache.result(step.filter), pending)
+            return {step.position: result for step, result in zip(pending, results)}
+
+    def evaluate(self, max_workers: int | None = None) -> FilterResult:
+        """Run the plan, recording each step's outcome, and return the combined masks.
+
+        Args:
+            max_workers: Maximum number of filters evaluated concurrently
+                (``ThreadPoolExecutor``'s default if None, 1 evaluates them
+                one after the other).
+
+        Returns:
+            FilterResult: Boolean Series masks over all events and objects.
+        """
+        cache = self.ocel._filter_results
+        event_index, object_index = self.ocel.events.df.index, self.ocel.objects.df.index
+        events, objects = Bitset.full(len(event_index)), Bitset.full(len(object_index))
+        narrowed = False
+
+        def has_rows(step: PlanStep) -> bool:
+            return any(
+                mask.any()
+                for share, mask in (
+                    (step.estimate.events, events),
+                    (step.estimate.objects, objects),
+                )
+                if share is not None
+            )
+
+        for tier in self._tiers():
+            evaluated = self._evaluate_concurrently(
+                [step for step in tier if has_rows(step)], max_workers
+            )
+            for step in tier:
+                result = evaluated.get(step.position)
+                if result is not None:
+                    step.outcome = "evaluated"
+                elif not has_rows(step):
+                    step.outcome = "skipped"
+                else:
+                    result = cache.cached(step.filter)
+                    if result is not None:
+                        step.outcome = "cached"
+                    elif not narrowed or not _narrows(step.filter):
+                        result, step.outcome = cache.result(step.filter), "evaluated"
+                    else:
+                        candidates = FilterResult(
+                            events=pd.Series(events.to_mask(), index=event_index),
+                            objects=pd.Series(objects.to_mask(), index=object_index),
+                        )
+                        result = step.filter.filter_candidates(self.ocel, candidates)
+                        step.outcome = "candidates"
+
+                if result is not None:
+                    if result.events is not None:
+                        events = events & _as_bitset(result.events, event_index)
+                    if result.objects is not None:
+                        objects = objects & _as_bitset(result.objects, object_index)
+                    narrowed = not (events.all() and objects.all())
+
+                step.events, step.objects = events.count(), objects.count()
+
+        return FilterResult(
+            events=pd.Series(events.to_mask(), index=event_index),
+            objects=pd.Series(objects.to_mask(), index=object_index),
+        )
+
+    def explain(self) -> str:
+        """Describe the chosen order with the estimates, and the outcomes once the plan ran."""
+        lines = [
+            (
+                f"Filter plan over {len(self.ocel.events.df):,} events "
+                f"and {len(self.ocel.objects.df):,} objects:"
+            )
+        ]
+        for number, step in enumerate(self.steps, start=1):
+            shares = ", ".join(
+                f"{share:.1%} of {table}"
+                for table, share in (
+                    ("events", step.estimate.events),
+                    ("objects", step.estimate.objects),
+                )
+                if share is not None
+            )
+            lines.append(
+                f"{number}. {type(step.filter).__name__} (pipeline position {step.position + 1}): "
+                f"cost ~{step.estimate.cost:,.0f}, keeps ~{shares or 'all rows'}"
+                f"{', cached' if step.cached else ''}"
+            )
+            if step.outcome is not None:
+                lines.append(
+                    f"   {step.outcome}, leaving {step.events:,} events "
+                    f"and {step.objects:,} objects"
+                )
+        return "\n".join(lines)
+
+
+def plan_filters(ocel: OCEL, filters: list[BaseFilter]) -> FilterPlan:
+    """Order the filters of a pipeline for evaluation on a log (see `FilterPlan`)."""
+    cache = ocel._filter_results
+    steps = [
+        PlanStep(
+            position=position,
+            filter=filter,
+            estimate=filter.estimate(ocel),
+            cached=cache.cached(filter) is not None,
+        )
+        for position, filter in enumerate(filters)
+    ]
+    # Ties keep the pipeline order
+    steps.sort(key=lambda step: (step.rank, step.estimate.cost, step.position))
+    return FilterPlan(ocel=ocel, steps=steps)
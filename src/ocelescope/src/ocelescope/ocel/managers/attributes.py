@@ -220,7 +220,9 @@ class AttributeManager(BaseManager):
                 ([group[0], "object"] if pd.notna(group[0]) else [group[1], "activity"])
                 + (summarize_attribute_values(col, group_df)[:-2])
                 for group, group_df in merged.groupby(
-                    list(set([OTYPE_COL, ACTIVITY_COL]) & set(merged.columns)), dropna=False
+                    list(set([OTYPE_COL, ACTIVITY_COL]) & set(merged.columns)),
+                    dropna=False,
+                    observed=True,
                 )[attribute_names]
                 for col in group_df.dropna(axis=1, how="all").columns
             ],
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from threading import Lock
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from cachetools import LRUCache
+from cachetools.keys import hashkey
 
 if TYPE_CHECKING:
     from ocelescope.ocel.core.ocel import OCEL
+    from ocelescope.ocel.util.append import AppendedRows
 
 
 class BaseManager:
@@ -16,3 +19,30 @@ class BaseManager:
         self._ocel = ocel
         self.cache = LRUCache(maxsize=128)
         self.cache_lock = Lock()
+
+    def _append(self, rows: AppendedRows):
+        """Update the cache after rows were appended to the log.
+
+        Managers override this to carry cached results over incrementally;
+        everything else cached is dropped and recomputed on its next use.
+        """
+        self._carry_over({})
+
+    def _carry_over(self, updates: dict[str, Callable[[Any], Any]]):
+        """Keep the cached results of the given argument-less methods and drop all others.
+
+        Each cached result is replaced by its update function's return value
+        (None drops it). Updates run in the given order, so an update can
+        use the already updated results of the methods before it.
+        """
+        with self.cache_lock:
+            cached = {name: self.cache.get(hashkey(name)) for name in updates}
+            self.cache.clear()
+
+        for name, update in updates.items():
+            if cached[name] is None:
+                continue
+            value = update(cached[name])
+            if value is not None:
+                with self.cache_lock:
+                    self.cache[hashkey(name)] = value
@@ -1,16 +1,25 @@
+from collections.abc import Iterable
+
+import numpy as np
 import pandas as pd
 
 from ocelescope.ocel.constants.pm4py import (
+    ACTIVITY_COL,
     E2O_ACTIVITY,
     E2O_EVENT_ID,
     E2O_OBJECT_ID,
     E2O_OBJECT_TYPE,
+    E2O_QUALIFIER,
     EID_COL,
     OID_COL,
+    OTYPE_COL,
     TIMESTAMP_COL,
 )
 from ocelescope.ocel.managers.base import BaseManager
 from ocelescope.ocel.models.relations import RelationCountSummary
+from ocelescope.ocel.util.append import AppendedRows
+from ocelescope.ocel.util.csr import CSRIndex
+from ocelescope.ocel.util.encoding import codes, lookup, to_code, to_codes
 from ocelescope.ocel.util.relations import SUMMARY_DIRECTION, summarize_e2o_counts
 from ocelescope.util.cache import instance_lru_cache
 
@@ -80,17 +89,18 @@ class E2OManager(BaseManager):
         Returns:
             DataFrame: Type- and activity-enriched E2O table.
         """
-        df = self.df.copy()
-
-        # Join activity (via EventsManager)
-        activity_by_id = self._ocel.events.activity_by_id
-        df = df.join(activity_by_id.rename(E2O_ACTIVITY), on=E2O_EVENT_ID)
-
-        # Join object type (via ObjectsManager)
-        type_by_id = self._ocel.objects.type_by_id
-        df = df.join(type_by_id.rename(E2O_OBJECT_TYPE), on=E2O_OBJECT_ID)
+        df = self.df
+        events = self._ocel.events.df
+        objects = self._ocel.objects.df
 
-        return df
+        return df.assign(
+            **{
+                # Look up activity (via the events table)
+                E2O_ACTIVITY: lookup(df[E2O_EVENT_ID], events[EID_COL], events[ACTIVITY_COL]),
+                # Look up object type (via the objects table)
+                E2O_OBJECT_TYPE: lookup(df[E2O_OBJECT_ID], objects[OID_COL], objects[OTYPE_COL]),
+            }
+        )
 
     # ---------------------------------------------------------
     # Summary
@@ -118,26 +128,200 @@ class E2OManager(BaseManager):
         """
         return summarize_e2o_counts(self._ocel.ocel, direction)
 
-    def get_events_of_object(self, object_id: str):
-        return self.df.loc[self.df[OID_COL].eq(object_id), EID_COL].dropna().unique()
+    # ---------------------------------------------------------
+    # Adjacency Indices
+    # ---------------------------------------------------------
+    @property
+    @instance_lru_cache()
+    def event_index(self) -> CSRIndex:
+        """
+        Return a CSR index from events to their related objects.
+
+        Rows are event id codes, targets are object id codes. Relations of an
+        event keep the order of the relations table.
+
+        Returns:
+            CSRIndex: The event → objects adjacency index.
+        """
+        df = self.df
+
+        return CSRIndex.from_codes(
+            sources=codes(df[E2O_EVENT_ID]),
+            targets=codes(df[E2O_OBJECT_ID]),
+            size=len(df[E2O_EVENT_ID].cat.categories),
+            labels=codes(df[E2O_QUALIFIER]),
+        )
 
-    def __get_event_timestamps_of_object(self, object_id: str):
+    @property
+    @instance_lru_cache()
+    def object_index(self) -> CSRIndex:
+        """
+        Return a CSR index from objects to their related events.
+
+        Rows are object id codes, targets are event id codes. The events of
+        each object are ordered by timestamp (ties keep the event table order).
+
+        Returns:
+            CSRIndex: The object → events adjacency index.
+        """
+        df = self.df
+        event_codes = codes(df[E2O_EVENT_ID])
+        timestamps, positions = self._event_order_keys()
+
+        return CSRIndex.from_codes(
+            sources=codes(df[E2O_OBJECT_ID]),
+            targets=event_codes,
+            size=len(df[E2O_OBJECT_ID].cat.categories),
+            order=[timestamps[event_codes], positions[event_codes]],
+            labels=codes(df[E2O_QUALIFIER]),
+        )
+
+    @instance_lru_cache()
+    def _event_order_keys(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the timestamp (int64) and table position of every event id code."""
         events = self._ocel.events.df
+        event_codes = codes(events[EID_COL])
+        size = len(events[EID_COL].cat.categories) + 1
 
-        return events.loc[
-            events[EID_COL].isin(self.get_events_of_object(object_id)), [EID_COL, TIMESTAMP_COL]
-        ].set_index(EID_COL)[TIMESTAMP_COL]
+        timestamps = np.full(size, np.iinfo(np.int64).max, dtype=np.int64)
+        timestamps[event_codes] = pd.DatetimeIndex(events[TIMESTAMP_COL]).asi8
+        positions = np.full(size, len(events), dtype=np.int64)
+        positions[event_codes[::-1]] = np.arange(len(events) - 1, -1, -1)
 
-    def get_first_event_of_object(self, object_id: str) -> str | None:
-        return str(
-            self.__get_event_timestamps_of_object(
-                object_id,
-            ).idxmin()
+        return timestamps, positions
+
+    def _append(self, rows: AppendedRows):
+        relations = rows.tables["relations"]
+        sources, targets = codes(relations[E2O_EVENT_ID]), codes(relations[E2O_OBJECT_ID])
+        labels = codes(relations[E2O_QUALIFIER])
+        first_edge = rows.offsets["relations"]
+        event_remap, object_remap = rows.remaps["event_id"], rows.remaps["object_id"]
+        qualifier_remap = rows.remaps["qualifier"]
+
+        def event_order_keys(cached: tuple[np.ndarray, np.ndarray]):
+            timestamps, positions = cached
+            events = rows.tables["events"]
+            size, length = rows.size("event_id") + 1, rows.offsets["events"] + len(events)
+
+            grown_timestamps = np.full(size, np.iinfo(np.int64).max, dtype=np.int64)
+            grown_positions = np.full(size, length, dtype=np.int64)
+            old_codes = slice(0, len(timestamps) - 1) if event_remap is None else event_remap
+            grown_timestamps[old_codes] = timestamps[:-1]
+            # Unknown codes pointed past the old table, now they point past the grown one
+            grown_positions[old_codes] = np.where(
+                positions[:-1] == rows.offsets["events"], length, positions[:-1]
+            )
+
+            event_codes = codes(events[EID_COL])
+            grown_timestamps[event_codes] = pd.DatetimeIndex(events[TIMESTAMP_COL]).asi8
+            first = grown_positions[event_codes[::-1]] == length
+            grown_positions[event_codes[::-1][first]] = np.arange(
+                length - 1, rows.offsets["events"] - 1, -1
+            )[first]
+            return grown_timestamps, grown_positions
+
+        def event_index(cached: CSRIndex):
+            return cached.remapped(
+                rows.size("event_id"), event_remap, object_remap, qualifier_remap
+            ).appended(sources, targets, first_edge, labels=labels)
+
+        def object_index(cached: CSRIndex):
+            # Appended events with known ids may move existing relations in the time order
+            if not rows.fresh("event_id")[codes(rows.tables["events"][EID_COL])].all():
+                return None
+
+            timestamps, positions = self._event_order_keys()
+            index = cached.remapped(
+                rows.size("object_id"), object_remap, event_remap, qualifier_remap
+            )
+            old_degrees = index.degree()
+            index = index.appended(
+                targets,
+                sources,
+                first_edge,
+                order=[timestamps[sources], positions[sources]],
+                labels=labels,
+            )
+
+            # Appended relations follow the existing ones of their object, which
+            # keeps the time order only if none of them is earlier
+            joined = np.flatnonzero((old_degrees > 0) & (index.degree() > old_degrees))
+            last = index.targets[index.offsets[joined] + old_degrees[joined] - 1]
+            following = index.targets[index.offsets[joined] + old_degrees[joined]]
+            in_order = (timestamps[last] < timestamps[following]) | (
+                (timestamps[last] == timestamps[following])
+                & (positions[last] <= positions[following])
+            )
+            return index if in_order.all() else None
+
+        self._carry_over(
+            {
+                "_event_order_keys": event_order_keys,
+                "event_index": event_index,
+                "object_index": object_index,
+            }
         )
 
+    def get_relations_of_events(self, event_ids: Iterable[str]) -> pd.DataFrame:
+        """
+        Return all E2O relations of the given events.
+
+        Args:
+            event_ids (Iterable[str]): Event IDs to look up.
+
+        Returns:
+            DataFrame: The matching rows of `df`, grouped by event.
+        """
+        index = self.event_index
+        event_codes = to_codes(list(event_ids), self.df[E2O_EVENT_ID])
+
+        return self.df.iloc[index.edges[index.positions(event_codes)]]
+
+    def get_relations_of_objects(self, object_ids: Iterable[str]) -> pd.DataFrame:
+        """
+        Return all E2O relations of the given objects.
+
+        Args:
+            object_ids (Iterable[str]): Object IDs to look up.
+
+        Returns:
+            DataFrame: The matching rows of `df`, grouped by object and
+            ordered by event timestamp.
+        """
+        index = self.object_index
+        object_codes = to_codes(list(object_ids), self.df[E2O_OBJECT_ID])
+
+        return self.df.iloc[index.edges[index.positions(object_codes)]]
+
+    def _event_codes_of_object(self, object_id: str) -> np.ndarray:
+        object_code = to_code(object_id, self._ocel.ocel.relations[E2O_OBJECT_ID])
+        return self.object_index.targets[self.object_index.row(object_code)]
+
+    @property
+    def _event_ids(self) -> pd.Index:
+        return self._ocel.ocel.relations[E2O_EVENT_ID].cat.categories
+
+    def get_events_of_object(self, object_id: str):
+        """
+        Return the IDs of all events related to an object, ordered by timestamp.
+        """
+        event_codes = pd.unique(self._event_codes_of_object(object_id))
+        return self._event_ids.take(event_codes).to_numpy()
+
+    def get_first_event_of_object(self, object_id: str) -> str | None:
+        event_codes = self._event_codes_of_object(object_id)
+        if len(event_codes) == 0:
+            return None
+
+        return str(self._event_ids[event_codes[0]])
+
     def get_last_event_of_object(self, object_id: str) -> str | None:
-        return str(
-            self.__get_event_timestamps_of_object(
-                object_id,
-            ).idxmax()
-        )
+        event_codes = self._event_codes_of_object(object_id)
+        if len(event_codes) == 0:
+            return None
+
+        # Among events sharing the latest timestamp, report the first one in table order
+        timestamps = self._event_order_keys()[0][event_codes]
+        last = np.searchsorted(timestamps, timestamps[-1], side="left")
+
+        return str(self._event_ids[event_codes[last]])
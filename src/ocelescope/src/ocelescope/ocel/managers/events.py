@@ -1,9 +1,13 @@
-from typing import cast
+from typing import Literal, cast
 
+import numpy as np
 import pandas as pd
 
-from ocelescope.ocel.constants.pm4py import ACTIVITY_COL, EID_COL, TIMESTAMP_COL
+from ocelescope.ocel.constants.pm4py import ACTIVITY_COL, EID_COL, OTYPE_COL, TIMESTAMP_COL
 from ocelescope.ocel.managers.base import BaseManager
+from ocelescope.ocel.util.append import AppendedRows, add_value_counts
+from ocelescope.ocel.util.encoding import codes
+from ocelescope.ocel.util.time_index import TimeCube, TimeIndex
 from ocelescope.util.cache import instance_lru_cache
 
 
@@ -51,7 +55,8 @@ class EventsManager(BaseManager):
         Returns:
             Series: A pandas Series indexed by activity name with occurrence counts.
         """
-        return self.df[ACTIVITY_COL].value_counts()
+        counts = self.df[ACTIVITY_COL].value_counts()
+        return counts[counts > 0]
 
     @property
     @instance_lru_cache()
@@ -86,8 +91,109 @@ class EventsManager(BaseManager):
 
         return self._ocel.attributes.get_activity_summary()
 
+    @property
+    @instance_lru_cache()
+    def time_index(self) -> TimeIndex:
+        """
+        Return the events ordered by timestamp.
+
+        Time ranges of events, the first and last timestamp, and histogram
+        bins are looked up in it by binary search instead of scanning the
+        timestamp column.
+
+        Returns:
+            TimeIndex: The row positions of the events sorted by timestamp.
+        """
+        return TimeIndex.from_timestamps(self.df[TIMESTAMP_COL])
+
+    @property
+    @instance_lru_cache()
+    def activity_cube(self) -> TimeCube:
+        """
+        Return the event counts per activity, rolled up for any time window.
+
+        Returns:
+            TimeCube: Block counts of the events in time order, grouped by activity.
+        """
+        activities = self.df[ACTIVITY_COL]
+        return TimeCube.from_groups(
+            self.time_index.times,
+            codes(activities)[self.time_index.order],
+            activities.cat.categories,
+        )
+
+    @property
+    @instance_lru_cache()
+    def object_type_cube(self) -> TimeCube:
+        """
+        Return the event counts per related object type, rolled up for any time window.
+
+        An event counts once for every object type it is related to, no
+        matter to how many objects of that type.
+
+        Returns:
+            TimeCube: Block counts of the events in time order, grouped by the
+            types of their objects.
+        """
+        relations = self._ocel.ocel.relations
+        object_types = relations[OTYPE_COL].cat.categories
+        event_ids = self.df[EID_COL]
+        size = max(len(object_types), 1)
+
+        # Rank of each event id in time order (-1 for unknown ids and missing timestamps)
+        ranks = np.full(len(event_ids.cat.categories) + 1, -1, dtype=np.int64)
+        ranks[codes(event_ids)[self.time_index.order]] = np.arange(len(self.time_index))
+        ranks[-1] = -1
+
+        related = ranks[codes(relations[EID_COL])]
+        type_codes = codes(relations[OTYPE_COL])
+        valid = (related >= 0) & (type_codes >= 0)
+        # Sorting the unique pairs puts them in time order
+        pairs = np.unique(related[valid] * size + type_codes[valid])
+
+        return TimeCube.from_groups(
+            self.time_index.times[pairs // size], pairs % size, object_types
+        )
+
+    def histogram(
+        self,
+        bins: pd.DatetimeIndex,
+        by: Literal["activity", "object_type"] = "activity",
+    ) -> pd.DataFrame:
+        """
+        Count the events per time window and activity or related object type.
+
+        Windows are the intervals between consecutive bin edges, closed on
+        the right like in ``pd.cut``; the first one also includes its left
+        edge. Counts are looked up in `activity_cube` or `object_type_cube`,
+        so a histogram does not scan the events.
+
+        Args:
+            bins (pd.DatetimeIndex): Increasing window edges.
+            by (Literal["activity", "object_type"]): What to count the events by.
+
+        Returns:
+            DataFrame: The counts, with one row per window and one column per
+            activity or object type.
+        """
+        cube = self.activity_cube if by == "activity" else self.object_type_cube
+        # Naive bins are read as UTC, like naive timestamps
+        return pd.DataFrame(cube.counts(bins.as_unit("ns").asi8), columns=cube.labels)
+
     def get_event_timestamp(self, event_id: str):
         """
         Returns the timestamp of the passed event.
         """
         return str(self.df.loc[self.df[EID_COL].eq(event_id), TIMESTAMP_COL].iloc[0])
+
+    def _append(self, rows: AppendedRows):
+        activities = rows.tables["events"][ACTIVITY_COL]
+        added = activities.dropna().unique().tolist()
+
+        self._carry_over(
+            {
+                "activities": lambda cached: sorted(set(cached).union(added)),
+                "activity_counts": lambda cached: add_value_counts(cached, activities),
+                "time_index": lambda cached: cached.appended(rows.tables["events"][TIMESTAMP_COL]),
+            }
+        )
@@ -40,7 +40,10 @@ class ExecutionsManager(BaseManager):
         if object_types is not None:
             e2o = e2o.loc[e2o[OTYPE_COL].isin(object_types)]
 
-        executions = e2o.groupby(by=OID_COL).agg(
+        # Aggregate the list columns as plain objects, so they are not cast back to categoricals
+        e2o = e2o.astype({ACTIVITY_COL: object, EID_COL: object})
+
+        executions = e2o.groupby(by=OID_COL, observed=True).agg(
             **{
                 EXECUTION_OTYPE_COL: (OTYPE_COL, "first"),
                 EXECUTION_ACT_LIST_COL: (ACTIVITY_COL, list),
@@ -62,7 +65,7 @@ class ExecutionsManager(BaseManager):
         )
 
         executions[EXECUTION_VARIANT_ID_COL] = (
-            executions[EXECUTION_OTYPE_COL]
+            executions[EXECUTION_OTYPE_COL].astype(str)
             + "_"
             + executions[EXECUTION_ACT_LIST_COL].apply(hash_string_list)
         )
@@ -73,7 +76,7 @@ class ExecutionsManager(BaseManager):
         executions = self.get_object_executions(object_types)
 
         variants = (
-            executions.groupby(by=[EXECUTION_VARIANT_ID_COL])
+            executions.groupby(by=[EXECUTION_VARIANT_ID_COL], observed=True)
             .agg(
                 **{
                     VARIANT_OTYPE_COL: (EXECUTION_OTYPE_COL, "first"),
@@ -1,16 +1,28 @@
+from collections.abc import Iterable
+from typing import Literal
+
+import numpy as np
 import pandas as pd
 
 from ocelescope.ocel.constants.pm4py import (
+    O2O_QUALIFIER,
     O2O_SOURCE_ID,
     O2O_SOURCE_TYPE,
     O2O_TARGET_ID,
     O2O_TARGET_TYPE,
+    OID_COL,
+    OTYPE_COL,
 )
 from ocelescope.ocel.managers.base import BaseManager
 from ocelescope.ocel.models.relations import RelationCountSummary
+from ocelescope.ocel.util.append import AppendedRows
+from ocelescope.ocel.util.csr import CSRIndex
+from ocelescope.ocel.util.encoding import codes, lookup, to_code, to_codes
 from ocelescope.ocel.util.relations import SUMMARY_DIRECTION, summarize_o2o_counts
 from ocelescope.util.cache import instance_lru_cache
 
+NEIGHBOR_DIRECTION = Literal["source", "target", "both"]
+
 
 class O2OManager(BaseManager):
     """
@@ -61,20 +73,23 @@ class O2OManager(BaseManager):
             - O2O_SOURCE_TYPE
             - O2O_TARGET_TYPE
 
-        These are obtained by joining against the object manager’s
-        `type_by_id` Series.
+        These are obtained by looking up the encoded object ids in the
+        objects table.
 
         Returns:
             DataFrame: A type-enriched O2O relation table.
         """
-        type_by_id: pd.Series = self._ocel.objects.type_by_id
+        objects = self._ocel.objects.df
+        ids, types = objects[OID_COL], objects[OTYPE_COL]
 
-        df = self.df.copy()
+        df = self.df
 
-        df = df.join(type_by_id.rename(O2O_SOURCE_TYPE), on=O2O_SOURCE_ID)
-        df = df.join(type_by_id.rename(O2O_TARGET_TYPE), on=O2O_TARGET_ID)
-
-        return df
+        return df.assign(
+            **{
+                O2O_SOURCE_TYPE: lookup(df[O2O_SOURCE_ID], ids, types),
+                O2O_TARGET_TYPE: lookup(df[O2O_TARGET_ID], ids, types),
+            }
+        )
 
     @instance_lru_cache()
     def summary(self, direction: SUMMARY_DIRECTION = "source") -> list[RelationCountSummary]:
@@ -95,3 +110,182 @@ class O2OManager(BaseManager):
                 A list of structured relation count summaries.
         """
         return summarize_o2o_counts(self._ocel.ocel, direction)
+
+    # ---------------------------------------------------------
+    # Adjacency Indices & Neighbourhood Queries
+    # ---------------------------------------------------------
+    @property
+    @instance_lru_cache()
+    def forward_index(self) -> CSRIndex:
+        """
+        Return a CSR index from source objects to their target objects.
+
+        Rows and targets are object id codes; each edge carries its qualifier
+        code as label.
+
+        Returns:
+            CSRIndex: The source → targets adjacency index.
+        """
+        df = self.df
+
+        return CSRIndex.from_codes(
+            sources=codes(df[O2O_SOURCE_ID]),
+            targets=codes(df[O2O_TARGET_ID]),
+            size=len(df[O2O_SOURCE_ID].cat.categories),
+            labels=codes(df[O2O_QUALIFIER]),
+        )
+
+    @property
+    @instance_lru_cache()
+    def reverse_index(self) -> CSRIndex:
+        """
+        Return a CSR index from target objects to their source objects.
+
+        Returns:
+            CSRIndex: The target → sources adjacency index.
+        """
+        df = self.df
+
+        return CSRIndex.from_codes(
+            sources=codes(df[O2O_TARGET_ID]),
+            targets=codes(df[O2O_SOURCE_ID]),
+            size=len(df[O2O_TARGET_ID].cat.categories),
+            labels=codes(df[O2O_QUALIFIER]),
+        )
+
+    def _append(self, rows: AppendedRows):
+        o2o = rows.tables["o2o"]
+        sources, targets = codes(o2o[OID_COL]), codes(o2o[f"{OID_COL}_2"])
+        labels = codes(o2o[O2O_QUALIFIER])
+        size, remap = rows.size("object_id"), rows.remaps["object_id"]
+        qualifier_remap = rows.remaps["qualifier"]
+
+        def extend(sources: np.ndarray, targets: np.ndarray):
+            return lambda cached: cached.remapped(size, remap, remap, qualifier_remap).appended(
+                sources, targets, rows.offsets["o2o"], labels=labels
+            )
+
+        self._carry_over(
+            {
+                "forward_index": extend(sources, targets),
+                "reverse_index": extend(targets, sources),
+            }
+        )
+
+    def get_relations_of_objects(
+        self, object_ids: Iterable[str], direction: SUMMARY_DIRECTION = "source"
+    ) -> pd.DataFrame:
+        """
+        Return all O2O relations in which the given objects take part.
+
+        Args:
+            object_ids (Iterable[str]): Object IDs to look up.
+            direction (SUMMARY_DIRECTION, optional): Whether the objects are
+                the ``"source"`` or the ``"target"`` of the returned relations.
+                Defaults to ``"source"``.
+
+        Returns:
+            DataFrame: The matching rows of `df`, grouped by object.
+        """
+        index = self.forward_index if direction == "source" else self.reverse_index
+        object_codes = to_codes(list(object_ids), self.df[O2O_SOURCE_ID])
+
+        return self.df.iloc[index.edges[index.positions(object_codes)]]
+
+    def _indices(self, direction: NEIGHBOR_DIRECTION) -> list[CSRIndex]:
+        return {
+            "source": [self.forward_index],
+            "target": [self.reverse_index],
+            "both": [self.forward_index, self.reverse_index],
+        }[direction]
+
+    def _neighbor_codes(
+        self, object_codes: np.ndarray, qualifier: str | None, direction: NEIGHBOR_DIRECTION
+    ) -> np.ndarray:
+        qualifier_code = (
+            to_code(qualifier, self.df[O2O_QUALIFIER]) if qualifier is not None else None
+        )
+        # -1 is also the label of relations without a qualifier
+        if qualifier_code == -1:
+            return np.empty(0, dtype=self.forward_index.targets.dtype)
+
+        neighbors = []
+        for index in self._indices(direction):
+            positions = index.positions(object_codes)
+            if qualifier_code is not None and index.labels is not None:
+                positions = positions[index.labels[positions] == qualifier_code]
+            neighbors.append(index.targets[positions])
+
+        return np.concatenate(neighbors)
+
+    def neighbors(
+        self,
+        object_id: str,
+        qualifier: str | None = None,
+        direction: NEIGHBOR_DIRECTION = "source",
+    ) -> list[str]:
+        """
+        Return the objects directly related to an object.
+
+        Args:
+            object_id (str): The object to start from.
+            qualifier (str | None, optional): Only follow relations with this
+                qualifier. Defaults to all qualifiers.
+            direction (NEIGHBOR_DIRECTION, optional): Follow relations where the
+                object is the ``"source"`` (its targets), the ``"target"`` (its
+                sources), or ``"both"``. Defaults to ``"source"``.
+
+        Returns:
+            list[str]: The related object IDs in relation order, without duplicates.
+        """
+        object_code = to_code(object_id, self.df[O2O_SOURCE_ID])
+        if object_code < 0:
+            return []
+
+        neighbor_codes = pd.unique(
+            self._neighbor_codes(np.array([object_code]), qualifier, direction)
+        )
+
+        return self.df[O2O_SOURCE_ID].cat.categories.take(neighbor_codes).tolist()
+
+    def expand(
+        self,
+        object_ids: Iterable[str],
+        hops: int = 1,
+        qualifier: str | None = None,
+        direction: NEIGHBOR_DIRECTION = "both",
+    ) -> dict[str, int]:
+        """
+        Return the k-hop neighbourhood of a set of objects.
+
+        The expansion runs breadth-first over the O2O relations, processing a
+        whole frontier per hop.
+
+        Args:
+            object_ids (Iterable[str]): The objects to start from (hop 0).
+            hops (int, optional): Maximum number of relations to follow. Defaults to 1.
+            qualifier (str | None, optional): Only follow relations with this
+                qualifier. Defaults to all qualifiers.
+            direction (NEIGHBOR_DIRECTION, optional): Which relation direction
+                to follow, see `neighbors`. Defaults to ``"both"``.
+
+        Returns:
+            dict[str, int]: Every reached object ID mapped to its hop distance.
+        """
+        categories = self.df[O2O_SOURCE_ID].cat.categories
+        distance = np.full(len(categories), -1, dtype=np.int64)
+
+        frontier = to_codes(list(object_ids), self.df[O2O_SOURCE_ID])
+        frontier = np.unique(frontier[frontier >= 0])
+        distance[frontier] = 0
+
+        for hop in range(1, hops + 1):
+            if len(frontier) == 0:
+                break
+            reached = self._neighbor_codes(frontier, qualifier, direction)
+            frontier = np.unique(reached[distance[reached] < 0])
+            distance[frontier] = hop
+
+        reached = np.flatnonzero(distance >= 0)
+
+        return dict(zip(categories.take(reached).tolist(), distance[reached].tolist()))
@@ -4,6 +4,8 @@ import pandas as pd
 
 from ocelescope.ocel.constants.pm4py import OID_COL, OTYPE_COL, TIMESTAMP_COL
 from ocelescope.ocel.managers.base import BaseManager
+from ocelescope.ocel.util.append import AppendedRows, add_value_counts
+from ocelescope.ocel.util.attributes import latest_object_attributes
 from ocelescope.util.cache import instance_lru_cache
 
 
@@ -15,6 +17,7 @@ class ObjectsManager(BaseManager):
     - the objects table
     - the object_changes table
     - object types and counts
+    - the latest value of every object attribute
     - object attribute names
     - per-object lookup helpers such as type-by-id
 
@@ -61,7 +64,8 @@ class ObjectsManager(BaseManager):
         Returns:
             Series: A pandas Series indexed by object type with occurrence counts.
         """
-        return self.df[OTYPE_COL].value_counts()
+        counts = self.df[OTYPE_COL].value_counts()
+        return counts[counts > 0]
 
     @property
     @instance_lru_cache()
@@ -74,6 +78,34 @@ class ObjectsManager(BaseManager):
         """
         return cast(pd.Series, self.df[[OID_COL, OTYPE_COL]].set_index(OID_COL)[OTYPE_COL])
 
+    @property
+    @instance_lru_cache()
+    def latest_attributes(self) -> pd.DataFrame:
+        """
+        Return the latest value of every attribute of every object.
+
+        Built once per OCEL and shared by everything that needs the current
+        state of the objects, such as object attribute filters.
+
+        Returns:
+            DataFrame: A pandas DataFrame with the rows and index of the objects
+            table and one column per object attribute, holding the attribute's
+            last value in the object changes (by timestamp) or the object's own
+            value if it never changed.
+        """
+        return latest_object_attributes(self.df, self.changes)
+
+    def _append(self, rows: AppendedRows):
+        types = rows.tables["objects"][OTYPE_COL]
+        added = types.dropna().unique().tolist()
+
+        self._carry_over(
+            {
+                "types": lambda cached: sorted(set(cached).union(added)),
+                "counts": lambda cached: add_value_counts(cached, types),
+            }
+        )
+
     def has_types(self, types: Iterable[str]) -> bool:
         """
         Check whether all provided object types exist in the OCEL.
@@ -188,7 +220,7 @@ class ObjectsManager(BaseManager):
 
         changes.sort_values([OID_COL, TIMESTAMP_COL])
 
-        changes[attr_cols] = changes.groupby(OID_COL)[attr_cols].ffill()
+        changes[attr_cols] = changes.groupby(OID_COL, observed=True)[attr_cols].ffill()
 
         return (
             changes.assign(_nn=changes.notna().sum(axis=1))
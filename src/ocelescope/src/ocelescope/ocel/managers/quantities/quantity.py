@@ -1,5 +1,6 @@
+from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 import pandas as pd
 
@@ -12,6 +13,7 @@ from ocelescope.ocel.constants.quantity import (
 )
 from ocelescope.ocel.managers.base import BaseManager
 from ocelescope.ocel.managers.quantities.util.io import (
+    quantity_extension_payload,
     write_quantity_extension,
 )
 
@@ -38,7 +40,7 @@ class QuantityManager(BaseManager):
     ):
         super().__init__(ocel)
 
-        self.oqty, self.qop, self.properties = (
+        self._oqty, self._qop, self.properties = (
             tables
             if tables is not None
             else (
@@ -48,8 +50,30 @@ class QuantityManager(BaseManager):
             )
         )
 
-        self.qop = self.qop.loc[self._cleaned_qop_mask].reset_index(drop=True)
-        self.oqty = self.oqty.loc[self._cleaned_oqty_mask].reset_index(drop=True)
+    # Zero quantities are dropped on first access rather than in the constructor
+
+    @cached_property
+    def oqty(self) -> pd.DataFrame:
+        return self._oqty.loc[self._oqty[QEL_QUANTITY].ne(0)].reset_index(drop=True)
+
+    @cached_property
+    def qop(self) -> pd.DataFrame:
+        return self._qop.loc[self._qop[QEL_QUANTITY].ne(0)].reset_index(drop=True)
+
+    @property
+    def tables(self) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """Return the quantity tables, for handing them on to a derived OCEL.
+
+        Tables that were already cleaned or assigned to `oqty` or `qop` are
+        returned as such, the others as passed in, so the derived OCEL defers
+        cleaning them as well.
+        """
+        # cached_property keeps computed and assigned values in the instance dict
+        return (
+            self.__dict__.get("oqty", self._oqty),
+            self.__dict__.get("qop", self._qop),
+            self.properties,
+        )
 
     def is_populated(self) -> bool:
         return any(not df.empty for df in [self.oqty, self.qop, self.properties])
@@ -72,6 +96,26 @@ class QuantityManager(BaseManager):
                 self.properties,
             )
 
+    def export_payload(self, path: Path) -> Any | None:
+        """Serialize the quantity extension for embedding it into an exported log.
+
+        Args:
+            path: Path of the exported JSON, XML, or SQLite log.
+
+        Returns:
+            The payload for the log writer, or None if there are no quantities to write.
+        """
+
+        if self.oqty.empty and self.qop.empty:
+            return None
+
+        return quantity_extension_payload(
+            path,
+            self.oqty.loc[self._cleaned_oqty_mask],
+            self.qop.loc[self._cleaned_qop_mask],
+            self.properties,
+        )
+
     @property
     def _cleaned_oqty_mask(self):
         return self.oqty[QEL_QUANTITY].ne(0)
@@ -502,9 +546,9 @@ class QuantityManager(BaseManager):
 
         it_entity_id_pairs = pd.merge(it_entity_id_pairs, id_to_type_map, on=id_col)
 
-        return it_entity_id_pairs.groupby([QEL_ITEM_TYPE, type_col]).agg(count=(id_col, "nunique"))[
-            "count"
-        ]
+        return it_entity_id_pairs.groupby([QEL_ITEM_TYPE, type_col], observed=True).agg(
+            count=(id_col, "nunique")
+        )["count"]
 
     @property
     def it_object_type_count(self) -> pd.Series:
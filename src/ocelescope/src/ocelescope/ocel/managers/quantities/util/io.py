@@ -1,13 +1,25 @@
+import mmap
 import os
+import re
 import sqlite3
 import xml.etree.ElementTree as etree
+from collections.abc import Iterator
+from contextlib import closing
+from io import BytesIO
 from pathlib import Path
+from typing import Any
+from xml.sax.saxutils import escape
 
+import numpy as np
 import orjson
 import pandas as pd
 
 from ocelescope.ocel.constants.pm4py import EID_COL, OID_COL
 from ocelescope.ocel.constants.quantity import OQTY_COLUMNS, QOP_COLUMNS
+from ocelescope.ocel.util.io import write_sqlite_table, xml_attribute
+from ocelescope.ocel.util.snapshot import read_snapshot_table, write_snapshot_table
+from ocelescope.ocel.util.sqlite import connect_readonly, read_sqlite_table, sqlite_tables
+from ocelescope.ocel.util.streaming import JSONStream
 from ocelescope.util.pandas import coerce_series, infer_column_dtype
 
 from .constants import (
@@ -41,140 +53,217 @@ from .constants import (
     inverse_keymap,
 )
 
-
-# TODO: This is also a bit inefficient
-def write_extension_to_xml(
-    path: Path, oqty: pd.DataFrame, qop: pd.DataFrame, item_properties: pd.DataFrame
-):
-    quantity_extension = etree.Element(XML_QUANTITY_EXTENSION)
-
-    # Quantity Operations
-    operations = etree.Element(XML_OPERATIONS)
-    for _, row in qop.iterrows():
-        operation = etree.SubElement(
-            operations,
-            XML_OPERATION,
-            {XML_EVENT_ID: str(row[EID_COL]), XML_OBJECT_ID: str(row[OID_COL])},
+EXPORT_CHUNK_SIZE = 100_000
+
+
+def _xml_escaped(values: pd.Series, attribute: bool = True) -> np.ndarray:
+    """Render a column as escaped XML text, escaping each distinct value only once."""
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    return np.array(
+        [xml_attribute(value) if attribute else escape(str(value)) for value in uniques],
+        dtype=object,
+    )[codes]
+
+
+def quantity_extension_to_xml(
+    oqty: pd.DataFrame,
+    qop: pd.DataFrame,
+    item_properties: pd.DataFrame,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Serialize the quantity extension element as a sequence of XML text chunks.
+
+    Operations and object quantities are rendered column-wise, ``chunk_size``
+    rows at a time, so no element tree is built and the chunks can be written
+    straight to the output stream.
+    """
+    yield f"<{XML_QUANTITY_EXTENSION}><{XML_OPERATIONS}>"
+    for start in range(0, len(qop), chunk_size):
+        chunk = qop.iloc[start : start + chunk_size]
+        yield "".join(
+            f'<{XML_OPERATION} {XML_EVENT_ID}="'
+            + _xml_escaped(chunk[EID_COL])
+            + f'" {XML_OBJECT_ID}="'
+            + _xml_escaped(chunk[OID_COL])
+            + f'"><{XML_ITEM} {XML_ITEM_TYPE}="'
+            + _xml_escaped(chunk[QEL_ITEM_TYPE])
+            + '">'
+            + _xml_escaped(chunk[QEL_QUANTITY], attribute=False)
+            + f"</{XML_ITEM}></{XML_OPERATION}>"
         )
-        item = etree.SubElement(operation, XML_ITEM, {XML_ITEM_TYPE: str(row[QEL_ITEM_TYPE])})
-        item.text = str(row[QEL_QUANTITY])
-    quantity_extension.append(operations)
-
-    # Object Quantities
-    object_quantities = etree.Element(XML_QUANTITIES)
-    for _, row in oqty.iterrows():
-        quantity = etree.SubElement(
-            object_quantities,
-            XML_QUANTITY,
-            {
-                XML_OBJECT_ID: str(row[OID_COL]),
-                XML_QUANTITY_TYPE: str(row[QEL_ITEM_TYPE]),
-            },
+    yield f"</{XML_OPERATIONS}><{XML_QUANTITIES}>"
+
+    for start in range(0, len(oqty), chunk_size):
+        chunk = oqty.iloc[start : start + chunk_size]
+        yield "".join(
+            f'<{XML_QUANTITY} {XML_OBJECT_ID}="'
+            + _xml_escaped(chunk[OID_COL])
+            + f'" {XML_QUANTITY_TYPE}="'
+            + _xml_escaped(chunk[QEL_ITEM_TYPE])
+            + '">'
+            + _xml_escaped(chunk[QEL_QUANTITY], attribute=False)
+            + f"</{XML_QUANTITY}>"
         )
-        quantity.text = str(row[QEL_QUANTITY])
-
-    quantity_extension.append(object_quantities)
+    yield f"</{XML_QUANTITIES}><{XML_PROPERTIES}>"
 
-    # Item Properties
+    # One row per item type, so this table stays small
     column_type_map = {
         str(col_name): infer_column_dtype(col_values)
         for col_name, col_values in item_properties.drop(
             columns=[QEL_ITEM_TYPE], errors="ignore"
         ).items()
     }
+    for _, row in item_properties.iterrows():
+        properties = "".join(
+            f'<{XML_PROPERTY} {XML_PROPERTY_NAME}="{xml_attribute(property_name)}"'
+            f' {XML_PROPERTY_TYPE}="{column_type_map[str(property_name)]}">'
+            f"{escape(str(value))}</{XML_PROPERTY}>"
+            for property_name, value in row.dropna().drop(labels=[QEL_ITEM_TYPE]).items()
+        )
+        yield (
+            f'<{XML_PROPERTIES_TYPE} {XML_PROPERTIES_TYPE_NAME}="'
+            f'{xml_attribute(row[QEL_ITEM_TYPE])}">{properties}</{XML_PROPERTIES_TYPE}>'
+        )
+    yield f"</{XML_PROPERTIES}></{XML_QUANTITY_EXTENSION}>"
 
-    item_properties_tree = etree.Element(XML_PROPERTIES)
 
-    for _, row in item_properties.iterrows():
-        item_type_root = etree.SubElement(
-            item_properties_tree,
-            XML_PROPERTIES_TYPE,
-            {XML_PROPERTIES_TYPE_NAME: row[QEL_ITEM_TYPE]},
+def write_extension_to_xml(
+    path: Path, oqty: pd.DataFrame, qop: pd.DataFrame, item_properties: pd.DataFrame
+):
+    """Append the quantity extension to the root element of an exported XML log.
+
+    The closing tag of the root is located from the end of the file, so the
+    log itself is neither parsed nor rewritten: the file is cut before that
+    tag, the extension is streamed in and the tag is written back.
+    """
+    with open(path, "r+b") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            end = data.rfind(b"</")
+            tail = data[end:] if end != -1 else b""
+        if not re.fullmatch(rb"</[^<>]+>\s*", tail):
+            raise ValueError(f"Could not find the closing tag of the log root in {path}")
+
+        file.seek(end)
+        file.truncate()
+        file.writelines(
+            chunk.encode("utf-8") for chunk in quantity_extension_to_xml(oqty, qop, item_properties)
         )
-        for property_name, value in row.dropna().drop(labels=[QEL_ITEM_TYPE]).items():
-            property = etree.SubElement(
-                item_type_root,
-                XML_PROPERTY,
-                {
-                    XML_PROPERTY_NAME: str(property_name),
-                    XML_PROPERTY_TYPE: column_type_map[str(property_name)],
-                },
-            )
-            property.text = str(value)
+        file.write(tail)
 
-    quantity_extension.append(item_properties_tree)
 
-    # Export
-    log = etree.parse(path)
-    log.getroot().append(quantity_extension)
-    log.write(path, xml_declaration=True, encoding="UTF-8")
+_TAG_DELIMITERS = (b" ", b"\t", b"\n", b"\r", b"/", b">")
 
 
-def read_extension_from_xml(path: Path) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-    tree = etree.parse(path)
-    root = tree.getroot()
+def _xml_quantity_extension(path: Path) -> bytes | None:
+    """Cut the quantity extension element out of an XML log without parsing the log.
+
+    The extension is written as the last child of the log root, so its start
+    tag is searched backwards from the end of the memory-mapped file. The XML
+    declaration is kept, so the fragment is decoded with the file's encoding.
+    """
+    tag = f"<{XML_QUANTITY_EXTENSION}".encode()
+    close = f"</{XML_QUANTITY_EXTENSION}>".encode()
+
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return None
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            start = data.rfind(tag)
+            while start != -1 and data[start + len(tag) : start + len(tag) + 1] not in (
+                _TAG_DELIMITERS
+            ):
+                start = data.rfind(tag, 0, start)
+            if start == -1:
+                return None
+
+            end = data.find(close, start)
+            # A self-closing (empty) extension has no closing tag
+            end = data.find(b">", start) + 1 if end == -1 else end + len(close)
+
+            declaration = re.match(rb"(?:\xef\xbb\xbf)?<\?xml[^>]*\?>", data[:256])
+            return (declaration.group(0) if declaration else b"") + data[start:end]
+
+
+def _count_elements(fragment: bytes, tag: str) -> int:
+    """Upper bound for the number of ``tag`` elements, used to preallocate columns."""
+    pattern = re.compile(b"<" + re.escape(tag.encode()) + rb"[\s/>]")
+    return sum(1 for _ in pattern.finditer(fragment))
+
 
-    quantity_ext = root.find(XML_QUANTITY_EXTENSION)
-    if quantity_ext is None:
+def _allocate(size: int, columns: list[str]) -> dict[str, np.ndarray]:
+    return {
+        column: np.empty(size, dtype=float if column == QEL_QUANTITY else object)
+        for column in columns
+    }
+
+
+def _to_frame(data: dict[str, np.ndarray], rows: int, columns: list[str]) -> pd.DataFrame:
+    if rows == 0:
+        return pd.DataFrame(columns=columns)
+    return pd.DataFrame({column: data[column][:rows] for column in columns})
+
+
+def read_extension_from_xml(path: Path) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    fragment = _xml_quantity_extension(path)
+    if fragment is None:
         return (
             pd.DataFrame(columns=OQTY_COLUMNS),
             pd.DataFrame(columns=QOP_COLUMNS),
             pd.DataFrame(columns=[QEL_ITEM_TYPE]),
         )
 
-    operations_data = []
-    operations_elem = quantity_ext.find(XML_OPERATIONS)
-    if operations_elem is not None:
-        for op in operations_elem.findall(XML_OPERATION):
-            eid = op.attrib.get(XML_EVENT_ID, "")
-            oid = op.attrib.get(XML_OBJECT_ID, "")
-            item_elem = op.find(XML_ITEM)
-            if item_elem is not None:
-                item_type = item_elem.attrib.get(XML_ITEM_TYPE, "")
-                quantity = item_elem.text or ""
-                operations_data.append(
-                    {
-                        EID_COL: eid,
-                        OID_COL: oid,
-                        QEL_ITEM_TYPE: item_type,
-                        QEL_QUANTITY: float(quantity),
-                    }
-                )
-
-    # Read quantities
-    quantities_data = []
-    quantities_elem = quantity_ext.find(XML_QUANTITIES)
-    if quantities_elem is not None:
-        for q in quantities_elem.findall(XML_QUANTITY):
-            oid = q.attrib.get(XML_OBJECT_ID, "")
-            item_type = q.attrib.get(XML_QUANTITY_TYPE, "")
-            quantity = q.text or ""
-            quantities_data.append(
-                {
-                    OID_COL: oid,
-                    QEL_ITEM_TYPE: item_type,
-                    QEL_QUANTITY: float(quantity),
-                }
-            )
-
-    # Read properties
-    property_tree = quantity_ext.find(XML_PROPERTIES)
-
+    operations = _allocate(_count_elements(fragment, XML_OPERATION), QOP_COLUMNS)
+    quantities = _allocate(_count_elements(fragment, XML_QUANTITY), OQTY_COLUMNS)
+    operation_count = quantity_count = 0
     item_property_data = []
-    if property_tree is not None:
-        for item_type in property_tree.findall(XML_PROPERTIES_TYPE):
+
+    # Records are consumed as soon as they are complete and dropped from the tree afterwards
+    stack: list[etree.Element] = []
+    for event, element in etree.iterparse(BytesIO(fragment), events=("start", "end")):
+        if event == "start":
+            stack.append(element)
+            continue
+
+        stack.pop()
+        if len(stack) != 2:
+            continue
+
+        container = stack[-1]
+        record = (container.tag, element.tag)
+        if record == (XML_OPERATIONS, XML_OPERATION):
+            item_elem = element.find(XML_ITEM)
+            if item_elem is not None:
+                operations[EID_COL][operation_count] = element.attrib.get(XML_EVENT_ID, "")
+                operations[OID_COL][operation_count] = element.attrib.get(XML_OBJECT_ID, "")
+                operations[QEL_ITEM_TYPE][operation_count] = item_elem.attrib.get(XML_ITEM_TYPE, "")
+                operations[QEL_QUANTITY][operation_count] = float(item_elem.text or "")
+                operation_count += 1
+        elif record == (XML_QUANTITIES, XML_QUANTITY):
+            quantities[OID_COL][quantity_count] = element.attrib.get(XML_OBJECT_ID, "")
+            quantities[QEL_ITEM_TYPE][quantity_count] = element.attrib.get(XML_QUANTITY_TYPE, "")
+            quantities[QEL_QUANTITY][quantity_count] = float(element.text or "")
+            quantity_count += 1
+        elif record == (XML_PROPERTIES, XML_PROPERTIES_TYPE):
             item_property_data.append(
                 {
-                    QEL_ITEM_TYPE: item_type.attrib[XML_PROPERTIES_TYPE_NAME],
+                    QEL_ITEM_TYPE: element.attrib[XML_PROPERTIES_TYPE_NAME],
                     **{
                         property_element.attrib[XML_PROPERTY_NAME]: property_element.text
-                        for property_element in item_type.findall(XML_PROPERTY)
+                        for property_element in element.findall(XML_PROPERTY)
                     },
                 }
             )
+        else:
+            continue
 
-    oqty_df = pd.DataFrame(quantities_data, columns=OQTY_COLUMNS)
-    qop_df = pd.DataFrame(operations_data, columns=QOP_COLUMNS)
+        if len(container) > 0 and container[0] is element:
+            del container[0]
+        else:
+            element.clear()
+
+    oqty_df = _to_frame(quantities, quantity_count, OQTY_COLUMNS)
+    qop_df = _to_frame(operations, operation_count, QOP_COLUMNS)
     property_df = (
         pd.DataFrame(item_property_data)
         if len(item_property_data) > 0
@@ -184,42 +273,107 @@ def read_extension_from_xml(path: Path) -> tuple[pd.DataFrame, pd.DataFrame, pd.
     return oqty_df, qop_df, property_df
 
 
-def read_extension_from_json(path: Path) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-    with open(path, "rb") as f:
-        json = orjson.loads(f.read())
-
-        quantityExtension = json.get(
-            JSON_QUANTITY_EXTENSION, {JSON_OPERATIONS: [], JSON_QUANTITIES: [], JSON_PROPERTIES: []}
-        )
+def quantity_tables_from_json(
+    quantity_extension: dict | None,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    quantity_extension = quantity_extension or {
+        JSON_OPERATIONS: [],
+        JSON_QUANTITIES: [],
+        JSON_PROPERTIES: [],
+    }
 
-        oqty: pd.DataFrame = pd.DataFrame.from_records(
-            data=quantityExtension.get(JSON_QUANTITIES, []),
-            columns=[JSON_KEYMAP[OID_COL], JSON_KEYMAP[QEL_ITEM_TYPE], JSON_KEYMAP[QEL_QUANTITY]],
-        ).rename(columns=inverse_keymap(JSON_KEYMAP))
-
-        qop: pd.DataFrame = pd.DataFrame.from_records(
-            data=quantityExtension.get(JSON_OPERATIONS, []),
-            columns=[
-                JSON_KEYMAP[EID_COL],
-                JSON_KEYMAP[OID_COL],
-                JSON_KEYMAP[QEL_ITEM_TYPE],
-                JSON_KEYMAP[QEL_QUANTITY],
-            ],
-        ).rename(columns=inverse_keymap(JSON_KEYMAP))
-
-        properties: pd.DataFrame = (
-            (
-                pd.DataFrame.from_records(
-                    data=quantityExtension[JSON_PROPERTIES],
-                ).rename(columns=inverse_keymap(JSON_KEYMAP))
-            )
-            if len(quantityExtension.get(JSON_PROPERTIES, [])) > 0
-            else pd.DataFrame(columns=[QEL_ITEM_TYPE])
+    oqty: pd.DataFrame = pd.DataFrame.from_records(
+        data=quantity_extension.get(JSON_QUANTITIES, []),
+        columns=[JSON_KEYMAP[OID_COL], JSON_KEYMAP[QEL_ITEM_TYPE], JSON_KEYMAP[QEL_QUANTITY]],
+    ).rename(columns=inverse_keymap(JSON_KEYMAP))
+
+    qop: pd.DataFrame = pd.DataFrame.from_records(
+        data=quantity_extension.get(JSON_OPERATIONS, []),
+        columns=[
+            JSON_KEYMAP[EID_COL],
+            JSON_KEYMAP[OID_COL],
+            JSON_KEYMAP[QEL_ITEM_TYPE],
+            JSON_KEYMAP[QEL_QUANTITY],
+        ],
+    ).rename(columns=inverse_keymap(JSON_KEYMAP))
+
+    properties: pd.DataFrame = (
+        (
+            pd.DataFrame.from_records(
+                data=quantity_extension[JSON_PROPERTIES],
+            ).rename(columns=inverse_keymap(JSON_KEYMAP))
         )
+        if len(quantity_extension.get(JSON_PROPERTIES, [])) > 0
+        else pd.DataFrame(columns=[QEL_ITEM_TYPE])
+    )
 
     return (oqty, qop, properties)
 
 
+def _json_quantity_extension(path: Path) -> dict | None:
+    """Decode only the quantity extension member of a JSON log.
+
+    The extension is written as the last member of the log object, so its key
+    is searched backwards from the end of the memory-mapped file and only the
+    value behind it is decoded. If the key turns out not to be that member,
+    the whole document is decoded instead.
+    """
+    key = f'"{JSON_QUANTITY_EXTENSION}"'.encode()
+
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return None
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            offset = data.rfind(key)
+        if offset == -1:
+            return None
+
+        file.seek(offset + len(key))
+        stream = JSONStream(file)
+        try:
+            stream.expect(":")
+            quantity_extension = stream.value()
+            stream.expect("}")
+            if stream.peek() == "":
+                return quantity_extension
+        except ValueError:
+            pass
+
+        file.seek(0)
+        return orjson.loads(file.read()).get(JSON_QUANTITY_EXTENSION)
+
+
+def read_extension_from_json(path: Path) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    return quantity_tables_from_json(_json_quantity_extension(path))
+
+
+def quantity_extension_to_json(
+    oqty: pd.DataFrame,
+    qop: pd.DataFrame,
+    item_properties: pd.DataFrame,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> dict[str, Any]:
+    """Build the JSON quantity extension for a streaming export.
+
+    Object quantities and operations are returned as iterators that convert
+    ``chunk_size`` rows to records at a time.
+    """
+
+    def records(frame: pd.DataFrame) -> Iterator[dict[str, Any]]:
+        renamed = frame.rename(columns=JSON_KEYMAP)
+        for start in range(0, len(renamed), chunk_size):
+            yield from renamed.iloc[start : start + chunk_size].to_dict(orient="records")
+
+    return {
+        JSON_QUANTITIES: records(oqty),
+        JSON_OPERATIONS: records(qop),
+        JSON_PROPERTIES: orjson.loads(
+            item_properties.rename(columns=JSON_KEYMAP).to_json(orient="records", date_format="iso")
+        ),
+    }
+
+
 def write_extension_to_json(
     path: Path, oqty: pd.DataFrame, qop: pd.DataFrame, item_properties: pd.DataFrame
 ):
@@ -246,27 +400,41 @@ def write_extension_to_json(
     os.replace(tmp, path)
 
 
+def quantity_extension_to_sqlite(
+    oqty: pd.DataFrame, qop: pd.DataFrame, item_properties: pd.DataFrame
+) -> dict[str, pd.DataFrame]:
+    return {
+        SQL_QUANTITIES: oqty.rename(columns=SQL_KEYMAP),
+        SQL_OPERATIONS: qop.rename(columns=SQL_KEYMAP),
+        SQL_ITEM_PROPERTIES: item_properties.rename(columns=SQL_KEYMAP),
+    }
+
+
 def write_extension_to_sqlite(
     path: Path, oqty: pd.DataFrame, qop: pd.DataFrame, item_properties: pd.DataFrame
 ):
-    with sqlite3.connect(path) as conn:
-        oqty.rename(columns=SQL_KEYMAP).to_sql(SQL_QUANTITIES, conn, index=False)
-        qop.rename(columns=SQL_KEYMAP).to_sql(SQL_OPERATIONS, conn, index=False)
-        item_properties.rename(columns=SQL_KEYMAP).to_sql(SQL_ITEM_PROPERTIES, conn, index=False)
+    with closing(sqlite3.connect(path)) as conn, conn:
+        for table, frame in quantity_extension_to_sqlite(oqty, qop, item_properties).items():
+            write_sqlite_table(
+                conn,
+                table,
+                frame,
+                indices=[
+                    SQL_KEYMAP[column]
+                    for column in (EID_COL, OID_COL)
+                    if SQL_KEYMAP[column] in frame.columns
+                ],
+            )
 
 
 def read_table_from_sqlite(conn: sqlite3.Connection, table_name: str, fallback_columns: list[str]):
-    query_string = "SELECT * FROM {table_name}"
-    try:
-        return pd.read_sql_query(
-            query_string.format(table_name=table_name), conn, index_col=None
-        ).rename(columns=inverse_keymap(SQL_KEYMAP))
-    except Exception:
+    if table_name not in sqlite_tables(conn):
         return pd.DataFrame(columns=fallback_columns)
+    return read_sqlite_table(conn, table_name).rename(columns=inverse_keymap(SQL_KEYMAP))
 
 
 def read_extension_from_sqlite(path: Path) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-    with sqlite3.connect(path) as conn:
+    with closing(connect_readonly(path)) as conn:
         oqty, qop, item_properties = [
             read_table_from_sqlite(conn, table_name, fallback_columns)
             for table_name, fallback_columns in [
@@ -279,6 +447,22 @@ def read_extension_from_sqlite(path: Path) -> tuple[pd.DataFrame, pd.DataFrame,
     return oqty, qop, item_properties
 
 
+def write_extension_to_snapshot(
+    path: Path, oqty: pd.DataFrame, qop: pd.DataFrame, item_properties: pd.DataFrame
+):
+    write_snapshot_table(path, "oqty", oqty)
+    write_snapshot_table(path, "qop", qop)
+    write_snapshot_table(path, "item_properties", item_properties)
+
+
+def read_extension_from_snapshot(path: Path) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    return (
+        read_snapshot_table(path, "oqty", OQTY_COLUMNS),
+        read_snapshot_table(path, "qop", QOP_COLUMNS),
+        read_snapshot_table(path, "item_properties", [QEL_ITEM_TYPE]),
+    )
+
+
 def read_quantity_extension(path: Path) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
 
     match path.suffix:
@@ -288,12 +472,42 @@ def read_quantity_extension(path: Path) -> tuple[pd.DataFrame, pd.DataFrame, pd.
             oqty, qop, item_properties = read_extension_from_json(path)
         case ".sqlite":
             oqty, qop, item_properties = read_extension_from_sqlite(path)
+        case ".parquetocel" | ".arrowocel":
+            oqty, qop, item_properties = read_extension_from_snapshot(path)
         case _:
             raise ValueError(f"Unsupported extension: {path.suffix}")
 
     return oqty, qop, item_properties.apply(coerce_series)
 
 
+def read_quantity_extension_from_json(
+    quantity_extension: dict | None,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Build the quantity tables from an already parsed JSON quantity extension."""
+    oqty, qop, item_properties = quantity_tables_from_json(quantity_extension)
+    return oqty, qop, item_properties.apply(coerce_series)
+
+
+def quantity_extension_payload(
+    path: Path, oqty: pd.DataFrame, qop: pd.DataFrame, item_properties: pd.DataFrame
+) -> Any:
+    """Serialize the quantity extension for embedding it into an exported log.
+
+    Returns the root members to add for JSON logs, the XML chunks of the
+    extension element for XML logs, and the tables to add for SQLite logs.
+    """
+
+    match path.suffix:
+        case ".xmlocel" | ".xml":
+            return quantity_extension_to_xml(oqty, qop, item_properties)
+        case ".jsonocel" | ".json":
+            return {JSON_QUANTITY_EXTENSION: quantity_extension_to_json(oqty, qop, item_properties)}
+        case ".sqlite":
+            return quantity_extension_to_sqlite(oqty, qop, item_properties)
+        case _:
+            raise ValueError(f"Unsupported extension: {path.suffix}")
+
+
 def write_quantity_extension(
     path: Path, oqty: pd.DataFrame, qop: pd.DataFrame, item_properties: pd.DataFrame
 ):
@@ -309,5 +523,9 @@ def write_quantity_extension(
             return write_extension_to_sqlite(
                 path, oqty=oqty, qop=qop, item_properties=item_properties
             )
+        case ".parquetocel" | ".arrowocel":
+            return write_extension_to_snapshot(
+                path, oqty=oqty, qop=qop, item_properties=item_properties
+            )
         case _:
             raise ValueError(f"Unsupported extension: {path.suffix}")
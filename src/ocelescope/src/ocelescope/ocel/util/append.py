@@ -0,0 +1,396 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from pm4py.objects.ocel.obj import OCEL
+
+from ocelescope.ocel.util.encoding import (
+    EncodingDomain,
+    _shared_dtype,
+    codes,
+    encoded_columns,
+    extend_dtype,
+    recode,
+)
+
+APPENDABLE_TABLES = ("events", "objects", "relations", "o2o", "object_changes")
+
+
+@dataclass(frozen=True)
+class AppendedRows:
+    """Rows appended to the tables of an encoded log.
+
+    Attributes:
+        tables: The appended rows of every appendable table, encoded like the
+            log (empty for tables nothing was appended to).
+        offsets: Table position of the first appended row per table.
+        dtypes: The (extended) dictionary of every encoding domain.
+        remaps: Per encoding domain, the map from old to new codes if extending
+            the dictionary moved existing codes (None otherwise).
+        sizes: Dictionary size of every encoding domain before the append.
+    """
+
+    tables: dict[str, pd.DataFrame]
+    offsets: dict[str, int]
+    dtypes: dict[EncodingDomain, pd.CategoricalDtype]
+    remaps: dict[EncodingDomain, np.ndarray | None]
+    sizes: dict[EncodingDomain, int]
+
+    def size(self, domain: EncodingDomain) -> int:
+        """Return the dictionary size of an encoding domain after the append."""
+        return len(self.dtypes[domain].categories)
+
+    def fresh(self, domain: EncodingDomain) -> np.ndarray:
+        """Return a boolean table over the new codes marking the values added by the append.
+
+        The extra trailing slot stays False, so indexing with code -1 yields False.
+        """
+        return _fresh(self.size(domain), self.remaps[domain], self.sizes[domain])
+
+
+def _fresh(size: int, remap: np.ndarray | None, previous_size: int) -> np.ndarray:
+    """Mark the codes of a grown dictionary whose values it did not hold before (see `AppendedRows.fresh`)."""
+    fresh = np.ones(size + 1, dtype=bool)
+    if remap is None:
+        fresh[:previous_size] = False
+    else:
+        fresh[remap] = False
+    fresh[-1] = False
+    return fresh
+
+
+def add_value_counts(counts: pd.Series, values: pd.Series) -> pd.Series:
+    """Add the counts of an appended encoded column to its ``value_counts`` (zero counts dropped).
+
+    Only the (small) dictionary of the column is touched, not the log's rows.
+    """
+    column_codes = codes(values)
+    totals = np.bincount(column_codes[column_codes >= 0], minlength=len(values.cat.categories))
+    np.add.at(
+        totals,
+        values.cat.categories.get_indexer(counts.index.to_numpy(dtype=object)),
+        counts.to_numpy(),
+    )
+
+    totals = pd.Series(
+        totals,
+        index=pd.CategoricalIndex(
+            pd.Categorical.from_codes(np.arange(len(totals)), dtype=values.dtype),
+            name=values.name,
+        ),
+        name=counts.name,
+    ).sort_values(ascending=False, kind="stable")
+    return totals[totals > 0]
+
+
+def _required_columns(ocel: OCEL) -> dict[str, list[str]]:
+    eid, oid = ocel.event_id_column, ocel.object_id_column
+    return {
+        "events": [eid, ocel.event_activity, ocel.event_timestamp],
+        "objects": [oid, ocel.object_type_column],
+        "relations": [eid, oid],
+        "o2o": [oid, f"{oid}_2"],
+        "object_changes": [oid, ocel.event_timestamp],
+    }
+
+
+def _timestamps_like(values: pd.Series, like: pd.Series) -> pd.Series:
+    """Parse timestamps (naive ones are UTC) into the timestamp type of an existing column."""
+    if not pd.api.types.is_datetime64_any_dtype(like.dtype):
+        return pd.to_datetime(values)
+
+    timestamps = pd.to_datetime(values, utc=True)
+    tz = getattr(like.dtype, "tz", None)
+    timestamps = timestamps.dt.tz_convert(tz) if tz is not None else timestamps.dt.tz_localize(None)
+    return timestamps.astype(like.dtype)
+
+
+def _rows_of(keys: pd.Series, ids: pd.Series, offset: int) -> np.ndarray:
+    """Return the table position of the row matching each encoded key (-1 if none).
+
+    Keys are matched against the appended rows (from ``offset`` on) first,
+    which only sorts their codes. The rows before ``offset`` are looked up
+    through a code-indexed table, and only for keys not found among the
+    appended ones.
+    """
+    key_codes = codes(keys)
+    appended, first = np.unique(codes(ids)[offset:], return_index=True)
+    rows = np.full(len(key_codes), -1, dtype=np.int64)
+    if len(appended) > 0:
+        positions = np.minimum(np.searchsorted(appended, key_codes), len(appended) - 1)
+        matched = (appended[positions] == key_codes) & (key_codes >= 0)
+        rows[matched] = first[positions[matched]] + offset
+
+    missing = np.flatnonzero((rows < 0) & (key_codes >= 0))
+    if len(missing) > 0 and offset > 0:
+        table = np.full(len(ids.cat.categories) + 1, -1, dtype=np.int64)
+        table[codes(ids)[:offset]] = np.arange(offset)
+        table[-1] = -1
+        rows[missing] = table[key_codes[missing]]
+
+    return rows
+
+
+def _listed(values: pd.Series, limit: int = 5) -> str:
+    """Format the first few distinct values of a column for an error message."""
+    distinct = values.dropna().astype(str).unique()
+    listed = ", ".join(distinct[:limit])
+    return f"{listed}, ..." if len(distinct) > limit else listed
+
+
+def _check_new_ids(batch: pd.Series, ids: pd.Series, fresh: np.ndarray, name: str):
+    """Raise if a batch's ids are missing, repeated, or already held by the table.
+
+    Ids the append added to the dictionary cannot be in the table, so only
+    the others are looked up among the table's rows.
+    """
+    batch_codes = codes(batch)
+    if (batch_codes < 0).any():
+        raise ValueError(f"Rows appended to {name} lack an id")
+
+    taken = pd.Index(batch_codes).duplicated()
+    known = ~fresh[batch_codes]
+    if known.any():
+        held = np.zeros(len(fresh), dtype=bool)
+        held[codes(ids)] = True
+        held[-1] = False
+        taken |= known & held[batch_codes]
+    if taken.any():
+        raise ValueError(f"Rows appended to {name} repeat the ids {_listed(batch[taken])}")
+
+
+def _check_references(keys: pd.Series, ids: pd.Series, offset: int, name: str, target: str):
+    """Raise if a batch refers to ids that are missing from the (grown) ``target`` table."""
+    unknown = _rows_of(keys, ids, offset) < 0
+    if unknown.any():
+        listed = _listed(keys[unknown])
+        raise ValueError(
+            f"Rows appended to {name} refer to {target} that do not exist"
+            + (f": {listed}" if listed else "")
+        )
+
+
+def _take(values: pd.Series, rows: np.ndarray, index: pd.Index) -> pd.Series:
+    """Gather values by table position, with a missing value for position -1."""
+    if len(values) == 0:
+        return pd.Series(index=index, dtype=values.dtype, name=values.name)
+
+    taken = values.iloc[np.maximum(rows, 0)].set_axis(index)
+    return taken.where(pd.Series(rows >= 0, index=index))
+
+
+def _fill(
+    batch: pd.DataFrame, key: str, table: pd.DataFrame, offset: int, columns: list[str]
+) -> pd.DataFrame:
+    """Add the given columns to a batch if missing, copied from the rows of ``table`` with matching keys."""
+    columns = [column for column in columns if column not in batch.columns]
+    if not columns:
+        return batch
+
+    rows = _rows_of(batch[key], table[key], offset)
+    return batch.assign(
+        **{
+            column: _take(table[column], rows, batch.index)
+            if column in table.columns
+            else pd.Series(None, index=batch.index, dtype=object)
+            for column in columns
+        }
+    )
+
+
+def _concat(table: pd.DataFrame, batch: pd.DataFrame, encoded: set[str]) -> pd.DataFrame:
+    """Append the rows of a batch to a table, both encoded with the same dictionaries.
+
+    The ``encoded`` columns are concatenated on their codes, so they keep the
+    shared dtype without pandas comparing the dictionaries; all other columns
+    are concatenated by pandas, which unifies their types.
+    """
+    encoded = {column for column in encoded if column in table.columns or column in batch.columns}
+    index = pd.RangeIndex(len(table) + len(batch))
+    plain = pd.concat(
+        [
+            table.drop(columns=[column for column in encoded if column in table.columns]),
+            batch.drop(columns=[column for column in encoded if column in batch.columns]),
+        ],
+        ignore_index=True,
+    ).set_axis(index)
+
+    columns: dict[str, pd.Series] = {}
+    for column in [*table.columns, *[c for c in batch.columns if c not in table.columns]]:
+        if column not in encoded:
+            columns[column] = plain[column]
+            continue
+        dtype = (table[column] if column in table.columns else batch[column]).dtype
+        parts = [
+            codes(frame[column]) if column in frame.columns else np.full(len(frame), -1)
+            for frame in (table, batch)
+        ]
+        columns[column] = pd.Series(
+            pd.Categorical.from_codes(np.concatenate(parts), dtype=dtype, validate=False),
+            index=index,
+        )
+
+    return pd.DataFrame(columns, index=index)
+
+
+def append_rows(ocel: OCEL, batches: dict[str, pd.DataFrame]) -> tuple[OCEL, AppendedRows]:
+    """Append batches of rows to the tables of a dictionary-encoded pm4py OCEL.
+
+    The log itself is not modified; a new pm4py OCEL holding the grown tables
+    is returned, so views of the log keep seeing it as it was.
+
+    Every encoding domain's dictionary is extended by the new values only
+    (see `extend_dtype`). Relations and object changes may leave out the
+    activity, timestamp, and object type columns; they are taken from the
+    events and objects they refer to, looked up among the appended rows first.
+
+    Raises:
+        ValueError: If a batch lacks a column it cannot be appended without,
+            appends an event or object id the log already holds (or holds one
+            twice), or refers to events or objects neither the log nor the
+            batches hold.
+    """
+    required = _required_columns(ocel)
+    for name, batch in batches.items():
+        if name not in APPENDABLE_TABLES:
+            raise ValueError(f"Cannot append to the {name} table")
+        missing = [column for column in required[name] if column not in batch.columns]
+        if missing:
+            raise ValueError(f"Rows appended to {name} lack the columns {', '.join(missing)}")
+
+    tables = {name: getattr(ocel, name) for name in APPENDABLE_TABLES}
+    batches = {
+        name: batches[name].reset_index(drop=True)
+        if name in batches
+        else tables[name].iloc[:0].reset_index(drop=True)
+        for name in APPENDABLE_TABLES
+    }
+    for name in ("relations", "o2o"):
+        if ocel.qualifier not in batches[name].columns:
+            batches[name] = batches[name].assign(**{ocel.qualifier: None})
+    for name in ("events", "object_changes"):
+        batch, timestamp = batches[name], ocel.event_timestamp
+        if timestamp in tables[name].columns and len(batch) > 0:
+            batches[name] = batch.assign(
+                **{timestamp: _timestamps_like(batch[timestamp], tables[name][timestamp])}
+            )
+
+    dtypes: dict[EncodingDomain, pd.CategoricalDtype] = {}
+    remaps: dict[EncodingDomain, np.ndarray | None] = {}
+    sizes: dict[EncodingDomain, int] = {}
+    for domain, columns in encoded_columns(ocel).items():
+        present = [(table, column) for table, column in columns if column in tables[table].columns]
+        added = [(table, column) for table, column in columns if column in batches[table].columns]
+        if not present and not added:
+            continue
+
+        # Logs are encoded, so this is the shared dtype of the present columns
+        dtype = _shared_dtype(
+            [tables[table][column] for table, column in present]
+            or [batches[table][column] for table, column in added]
+        )
+        sizes[domain] = len(dtype.categories)
+        values = [batches[table][column] for table, column in added]
+        dtypes[domain], remaps[domain], added_codes = extend_dtype(
+            dtype,
+            pd.concat([value.astype(object) for value in values], ignore_index=True)
+            if values
+            else pd.Series([], dtype=object),
+        )
+
+        for table, column in present:
+            existing = tables[table][column]
+            if existing.dtype is dtypes[domain]:
+                continue
+            tables[table] = tables[table].assign(
+                **{
+                    column: recode(existing, dtypes[domain], remaps[domain])
+                    if existing.dtype is dtype
+                    else existing.astype(dtypes[domain])
+                }
+            )
+        for (table, column), column_codes in zip(
+            added, np.split(added_codes, np.cumsum([len(value) for value in values])[:-1])
+        ):
+            batches[table] = batches[table].assign(
+                **{
+                    column: pd.Categorical.from_codes(
+                        column_codes, dtype=dtypes[domain], validate=False
+                    )
+                }
+            )
+
+    encoded = {
+        name: {
+            column
+            for columns in encoded_columns(ocel).values()
+            for table, column in columns
+            if table == name
+        }
+        for name in APPENDABLE_TABLES
+    }
+    eid, oid, otype = ocel.event_id_column, ocel.object_id_column, ocel.object_type_column
+    for name, column, domain in (("events", eid, "event_id"), ("objects", oid, "object_id")):
+        if len(batches[name]) > 0:
+            _check_new_ids(
+                batches[name][column],
+                tables[name][column],
+                _fresh(len(dtypes[domain].categories), remaps[domain], sizes[domain]),
+                name,
+            )
+
+    offsets = {name: len(table) for name, table in tables.items()}
+    for name in ("events", "objects"):
+        if len(batches[name]) > 0:
+            tables[name] = _concat(tables[name], batches[name], encoded[name])
+
+    targets = {"events": eid, "objects": oid}
+    for name, column, target in (
+        ("relations", eid, "events"),
+        ("relations", oid, "objects"),
+        ("o2o", oid, "objects"),
+        ("o2o", f"{oid}_2", "objects"),
+        ("object_changes", oid, "objects"),
+    ):
+        if len(batches[name]) > 0:
+            _check_references(
+                batches[name][column],
+                tables[target][targets[target]],
+                offsets[target],
+                name,
+                target,
+            )
+
+    batches["relations"] = _fill(
+        batches["relations"],
+        eid,
+        tables["events"],
+        offsets["events"],
+        [ocel.event_activity, ocel.event_timestamp],
+    )
+    for name in ("relations", "object_changes"):
+        batches[name] = _fill(batches[name], oid, tables["objects"], offsets["objects"], [otype])
+    # Filled timestamps have the type of the events', which the relations' may differ from
+    relations, timestamp = batches["relations"], ocel.event_timestamp
+    if timestamp in tables["relations"].columns and len(relations) > 0:
+        batches["relations"] = relations.assign(
+            **{timestamp: _timestamps_like(relations[timestamp], tables["relations"][timestamp])}
+        )
+    for name in ("relations", "o2o", "object_changes"):
+        if len(batches[name]) > 0:
+            tables[name] = _concat(tables[name], batches[name], encoded[name])
+
+    grown = OCEL(
+        **tables,
+        e2e=ocel.e2e,
+        globals=ocel.globals,
+        parameters=ocel.parameters,
+    )
+    appended = AppendedRows(
+        tables={name: tables[name].iloc[offsets[name] :] for name in APPENDABLE_TABLES},
+        offsets=offsets,
+        dtypes=dtypes,
+        remaps=remaps,
+        sizes=sizes,
+    )
+    return grown, appended
@@ -1,29 +1,52 @@
+import numpy as np
 import pandas as pd
-import pm4py
-from pm4py.objects.ocel.obj import OCEL
 
-from ocelescope.ocel.constants.pm4py import ACTIVITY_COL, OTYPE_COL
+from ocelescope.ocel.constants.pm4py import ACTIVITY_COL, OID_COL, OTYPE_COL, TIMESTAMP_COL
+from ocelescope.ocel.util.encoding import codes
+from ocelescope.ocel.util.time_index import _nanoseconds
 from ocelescope.util.pandas import ValueType, infer_column_dtype
 
 
-def get_objects_with_object_changes(ocel: OCEL):
-    object_changes = ocel.object_changes
+def latest_object_attributes(objects: pd.DataFrame, object_changes: pd.DataFrame) -> pd.DataFrame:
+    """Return the latest value of every attribute of every object.
 
-    grouped = object_changes.groupby([ocel.object_id_column, ocel.object_type_column])
-    last_changes = grouped.last().reset_index()
-
-    attribute_names = pm4py.ocel_get_attribute_names(ocel)
-    available_cols = last_changes.columns.tolist()
-    selected_cols = [ocel.object_id_column] + [
-        col for col in attribute_names if col in available_cols
+    The result has the objects table's rows and index and one column per
+    object attribute. An attribute's latest value is its last non-null value
+    in ``object_changes`` (by timestamp, ties in table order), or the
+    object's own value if it never changed. Changes are matched to objects
+    by their id codes, so no table is joined or hashed.
+    """
+    names = [column for column in objects.columns if not column.startswith("ocel:")]
+    changed = [
+        column
+        for column in object_changes.columns
+        if not column.startswith("ocel:") and column != "@@cumcount"
     ]
+    latest = {name: objects[name] for name in names}
+    if not changed or len(object_changes) == 0:
+        return pd.DataFrame(latest, index=objects.index)
 
-    object_changes_filtered = last_changes[selected_cols]
+    # Object table position of every change (-1 for unknown objects)
+    positions = np.full(len(objects[OID_COL].cat.categories) + 1, -1, dtype=np.int64)
+    positions[codes(objects[OID_COL])] = np.arange(len(objects))
+    positions[-1] = -1
+    change_rows = positions[codes(object_changes[OID_COL])]
+    order = np.argsort(_nanoseconds(object_changes[TIMESTAMP_COL])[0], kind="stable")
+    order = order[change_rows[order] >= 0]
 
-    object_changes_filtered = object_changes_filtered.set_index(ocel.object_id_column)
-    objects = ocel.objects.set_index(ocel.object_id_column)
+    for name in changed:
+        values = object_changes[name]
+        present = order[values.notna().to_numpy()[order]][::-1]
+        # The first of an object's changes in reverse time order is its latest one
+        rows, last = np.unique(change_rows[present], return_index=True)
+        if len(rows) == 0:
+            continue
+        updates = pd.Series(
+            values.iloc[present[last]].to_numpy(), index=objects.index[rows], name=name
+        ).reindex(objects.index)
+        latest[name] = updates if name not in latest else updates.combine_first(latest[name])
 
-    return objects.fillna(object_changes_filtered).reset_index()
+    return pd.DataFrame(latest, index=objects.index)
 
 
 def summarize_attribute_values(attr_name: str, attr_table: pd.DataFrame):
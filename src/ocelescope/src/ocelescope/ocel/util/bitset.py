@@ -0,0 +1,65 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class Bitset:
+    """A boolean mask over the rows of a table, packed eight rows per byte.
+
+    Bit ``i`` belongs to the row at position ``i``, so bitsets of one table
+    combine without any index alignment, and combining them touches an
+    eighth of the memory of boolean arrays. Padding bits of the last byte
+    are always zero.
+    """
+
+    bits: np.ndarray
+    size: int
+
+    @staticmethod
+    def from_mask(mask: np.ndarray) -> "Bitset":
+        """Pack a boolean array (or anything ``np.asarray`` turns into one)."""
+        mask = np.asarray(mask, dtype=bool)
+        return Bitset(bits=np.packbits(mask), size=len(mask))
+
+    @staticmethod
+    def full(size: int, value: bool = True) -> "Bitset":
+        """Return a bitset with all rows set to ``value``."""
+        return Bitset.from_mask(np.full(size, value, dtype=bool))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _check(self, other: "Bitset"):
+        if other.size != self.size:
+            raise ValueError(f"Cannot combine bitsets over {self.size} and {other.size} rows")
+
+    def __and__(self, other: "Bitset") -> "Bitset":
+        self._check(other)
+        return Bitset(bits=self.bits & other.bits, size=self.size)
+
+    def __or__(self, other: "Bitset") -> "Bitset":
+        self._check(other)
+        return Bitset(bits=self.bits | other.bits, size=self.size)
+
+    def __invert__(self) -> "Bitset":
+        bits = ~self.bits
+        if self.size % 8:
+            bits[-1] &= np.uint8((0xFF << (8 - self.size % 8)) & 0xFF)
+        return Bitset(bits=bits, size=self.size)
+
+    def to_mask(self) -> np.ndarray:
+        """Unpack into a boolean array over the rows."""
+        return np.unpackbits(self.bits, count=self.size).view(bool)
+
+    def count(self) -> int:
+        """Return the number of set rows."""
+        return int(np.bitwise_count(self.bits).sum(dtype=np.int64))
+
+    def any(self) -> bool:
+        """Whether any row is set."""
+        return bool(self.bits.any())
+
+    def all(self) -> bool:
+        """Whether all rows are set."""
+        return self.count() == self.size
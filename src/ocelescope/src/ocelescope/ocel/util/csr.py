@@ -0,0 +1,158 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class CSRIndex:
+    """Compressed sparse row adjacency over integer-coded relation rows.
+
+    The relations of source code ``i`` are stored in
+    ``targets[offsets[i]:offsets[i + 1]]``; ``edges`` holds the matching row
+    positions in the underlying relation table, so any further column of a
+    relation can be gathered with ``table.iloc[edges[...]]``. ``labels``
+    optionally carries a per-edge code such as the relation qualifier.
+    """
+
+    offsets: np.ndarray
+    targets: np.ndarray
+    edges: np.ndarray
+    labels: np.ndarray | None = None
+
+    @staticmethod
+    def from_codes(
+        sources: np.ndarray,
+        targets: np.ndarray,
+        size: int,
+        order: list[np.ndarray] | None = None,
+        labels: np.ndarray | None = None,
+    ) -> "CSRIndex":
+        """Build the index from parallel source/target code arrays.
+
+        Args:
+            sources: Source codes per relation row (-1 marks a missing source).
+            targets: Target codes per relation row.
+            size: Number of distinct source codes (the dictionary size).
+            order: Optional sort keys (most significant first) that order the
+                relations within each row. Relation table order is kept otherwise.
+            labels: Optional per-row codes (e.g. qualifiers) stored alongside each edge.
+        """
+        valid = np.flatnonzero((sources >= 0) & (targets >= 0))
+        keys = [key[valid] for key in reversed(order or [])]
+        edges = valid[np.lexsort([*keys, sources[valid]])]
+
+        counts = np.bincount(sources[edges], minlength=size)
+        offsets = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        return CSRIndex(
+            offsets=offsets,
+            targets=targets[edges],
+            edges=edges,
+            labels=labels[edges] if labels is not None else None,
+        )
+
+    def remapped(
+        self,
+        size: int,
+        rows: np.ndarray | None = None,
+        targets: np.ndarray | None = None,
+        labels: np.ndarray | None = None,
+    ) -> "CSRIndex":
+        """Move the index to extended dictionaries.
+
+        Args:
+            size: The new number of source codes.
+            rows: Map from old to new source codes (None if unchanged). The map
+                has to keep the order of the codes, as extending a sorted
+                dictionary does.
+            targets: Map from old to new target codes (None if unchanged).
+            labels: Map from old to new label codes (None if unchanged).
+        """
+        degrees = np.zeros(size, dtype=np.int64)
+        if rows is None:
+            degrees[: self.size] = self.degree()
+        else:
+            degrees[rows] = self.degree()
+        offsets = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(degrees, out=offsets[1:])
+
+        return CSRIndex(
+            offsets=offsets,
+            targets=self.targets if targets is None else targets[self.targets],
+            edges=self.edges,
+            labels=self.labels if labels is None or self.labels is None else labels[self.labels],
+        )
+
+    def appended(
+        self,
+        sources: np.ndarray,
+        targets: np.ndarray,
+        first_edge: int,
+        order: list[np.ndarray] | None = None,
+        labels: np.ndarray | None = None,
+    ) -> "CSRIndex":
+        """Add relation rows appended to the underlying table.
+
+        The new relations of each source code follow its existing ones; among
+        themselves they are ordered like in `from_codes`. Codes have to be
+        within the current dictionary sizes (see `remapped`).
+
+        Args:
+            sources: Source codes per appended relation row.
+            targets: Target codes per appended relation row.
+            first_edge: Table position of the first appended row.
+            order: Optional sort keys for the appended relations (see `from_codes`).
+            labels: Optional per-row codes of the appended relations.
+        """
+        added = CSRIndex.from_codes(sources, targets, self.size, order, labels)
+        old_degrees, new_degrees = self.degree(), added.degree()
+
+        offsets = self.offsets + added.offsets
+        # Old relations shift by the new relations of all preceding rows, new
+        # ones are placed behind the old relations of their row
+        old_positions = np.arange(len(self.targets)) + np.repeat(added.offsets[:-1], old_degrees)
+        new_positions = np.arange(len(added.targets)) + np.repeat(self.offsets[1:], new_degrees)
+
+        def merge(old: np.ndarray, new: np.ndarray) -> np.ndarray:
+            merged = np.empty(len(old) + len(new), dtype=np.result_type(old, new))
+            merged[old_positions] = old
+            merged[new_positions] = new
+            return merged
+
+        return CSRIndex(
+            offsets=offsets,
+            targets=merge(self.targets, added.targets),
+            edges=merge(self.edges, added.edges + first_edge),
+            labels=merge(self.labels, added.labels)
+            if self.labels is not None and added.labels is not None
+            else None,
+        )
+
+    @property
+    def size(self) -> int:
+        return len(self.offsets) - 1
+
+    def degree(self, codes: np.ndarray | None = None) -> np.ndarray:
+        """Return the number of relations per source code (or per given codes)."""
+        degrees = np.diff(self.offsets)
+        return degrees if codes is None else degrees[codes]
+
+    def positions(self, codes: np.ndarray) -> np.ndarray:
+        """Return the CSR positions of all relations of the given source codes.
+
+        Negative codes (unknown sources) contribute no relations.
+        """
+        codes = np.asarray(codes, dtype=np.int64)
+        codes = codes[(codes >= 0) & (codes < self.size)]
+        starts = self.offsets[codes]
+        lengths = self.offsets[codes + 1] - starts
+
+        shift = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        return shift + np.arange(int(lengths.sum()), dtype=np.int64)
+
+    def row(self, code: int) -> slice:
+        """Return the CSR slice of a single source code."""
+        if code < 0 or code >= self.size:
+            return slice(0, 0)
+        return slice(int(self.offsets[code]), int(self.offsets[code + 1]))
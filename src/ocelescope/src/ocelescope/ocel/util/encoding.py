@@ -0,0 +1,292 @@
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+from pm4py.objects.ocel.obj import OCEL
+
+EncodingDomain = Literal["event_id", "object_id", "activity", "object_type", "qualifier"]
+
+
+def encoded_columns(ocel: OCEL) -> dict[EncodingDomain, list[tuple[str, str]]]:
+    """Return the (table, column) pairs that share one dictionary per encoding domain."""
+    eid, oid = ocel.event_id_column, ocel.object_id_column
+    activity, otype, qualifier = ocel.event_activity, ocel.object_type_column, ocel.qualifier
+
+    return {
+        "event_id": [("events", eid), ("relations", eid)],
+        "object_id": [
+            ("objects", oid),
+            ("relations", oid),
+            ("o2o", oid),
+            ("o2o", f"{oid}_2"),
+            ("object_changes", oid),
+        ],
+        "activity": [("events", activity), ("relations", activity)],
+        "object_type": [("objects", otype), ("relations", otype), ("object_changes", otype)],
+        "qualifier": [("relations", qualifier), ("o2o", qualifier)],
+    }
+
+
+def _shared_dtype(columns: list[pd.Series]) -> pd.CategoricalDtype:
+    dtypes = [column.dtype for column in columns]
+    first = dtypes[0]
+    if isinstance(first, pd.CategoricalDtype) and all(dtype == first for dtype in dtypes[1:]):
+        return first
+
+    values = np.concatenate(
+        [
+            np.asarray(
+                column.cat.categories
+                if isinstance(column.dtype, pd.CategoricalDtype)
+                else column.dropna().unique(),
+                dtype=object,
+            )
+            for column in columns
+        ]
+    )
+    categories = pd.Index(pd.unique(values)) if len(values) > 0 else pd.Index([], dtype=str)
+
+    # Sorted categories keep code order equal to value order, so sorting and
+    # grouping on encoded columns behaves like on the original strings.
+    try:
+        categories = categories.sort_values()
+    except TypeError:
+        pass
+
+    return pd.CategoricalDtype(categories)
+
+
+def encode_ocel(ocel: OCEL) -> OCEL:
+    """Dictionary-encode the identifier, activity, type, and qualifier columns in place.
+
+    All columns of one domain (e.g. object ids in objects, relations, o2o, and
+    object_changes) share a single sorted ``CategoricalDtype``, so their integer
+    codes are directly comparable across tables. Already encoded logs are left
+    untouched, which makes the call cheap for filtered copies of an encoded log.
+    """
+    for columns in encoded_columns(ocel).values():
+        present = [
+            (table, column) for table, column in columns if column in getattr(ocel, table).columns
+        ]
+        if not present:
+            continue
+
+        dtype = _shared_dtype([getattr(ocel, table)[column] for table, column in present])
+        for table, column in present:
+            frame: pd.DataFrame = getattr(ocel, table)
+            if frame[column].dtype is dtype:
+                continue
+            setattr(ocel, table, frame.assign(**{column: frame[column].astype(dtype)}))
+
+    return ocel
+
+
+def _search_sorted(categories: pd.Index, values: np.ndarray) -> np.ndarray:
+    """Return the left insertion points of ``values`` in sorted ``categories``.
+
+    A sample of about ``len(values)`` evenly spaced categories (including the
+    last one) narrows each value down to one gap between samples, then a
+    binary search over all values at once finishes within the gaps. Only the
+    sampled and probed categories are gathered, so this costs
+    O(len(values) * log(len(categories))) instead of converting the whole
+    dictionary like ``Index.searchsorted`` does for Arrow-backed strings.
+    """
+    size = len(categories)
+    if size == 0:
+        return np.zeros(len(values), dtype=np.int64)
+
+    sampled = np.arange(0, size, max(1, size // max(len(values), 1)), dtype=np.int64)
+    if sampled[-1] != size - 1:
+        sampled = np.append(sampled, size - 1)
+    gaps = np.searchsorted(categories.take(sampled).to_numpy(dtype=object), values)
+    # Values past the last category get an empty range, so they need no search
+    low = np.where(gaps > 0, np.append(-1, sampled)[gaps] + 1, 0)
+    high = np.append(sampled, size)[gaps]
+    while True:
+        active = np.flatnonzero(low < high)
+        if len(active) == 0:
+            return low
+        middle = (low[active] + high[active]) // 2
+        below = categories.take(middle).to_numpy(dtype=object) < values[active]
+        low[active[below]] = middle[below] + 1
+        high[active[~below]] = middle[~below]
+
+
+def _find(categories: pd.Index, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return the insertion points of ``values`` in sorted ``categories`` and which are present."""
+    positions = _search_sorted(categories, values)
+    found = positions < len(categories)
+    found[found] = categories.take(positions[found]).to_numpy(dtype=object) == values[found]
+    return positions, found
+
+
+def _hashed_extension(
+    categories: pd.Index, uniques: np.ndarray, sort: bool
+) -> tuple[pd.CategoricalDtype, np.ndarray | None, np.ndarray]:
+    merged = categories.append(pd.Index(uniques[categories.get_indexer(pd.Index(uniques)) < 0]))
+    if sort:
+        try:
+            merged = merged.sort_values()
+        except TypeError:
+            pass
+    remap = merged.get_indexer(categories) if len(merged) > len(categories) else None
+    if remap is not None and np.array_equal(remap, np.arange(len(categories))):
+        remap = None
+
+    dtype = pd.CategoricalDtype(merged) if len(merged) > len(categories) else None
+    return dtype, remap, merged.get_indexer(pd.Index(uniques))
+
+
+def extend_dtype(
+    dtype: pd.CategoricalDtype, values: pd.Series
+) -> tuple[pd.CategoricalDtype, np.ndarray | None, np.ndarray]:
+    """Add the values missing from a dictionary to it and encode the values.
+
+    Sorted dictionaries stay sorted. Against large dictionaries, the values
+    are located by binary search and merged in, so the dictionary is neither
+    hashed nor re-sorted; dictionaries no larger than the batch are simply
+    rebuilt. Dictionaries whose values cannot be compared get the new values
+    appended.
+
+    Returns:
+        The extended dtype (``dtype`` itself if nothing was added), an array
+        mapping each old code to its new code (None if no code moved), and the
+        codes of ``values`` in the extended dictionary (-1 for missing values).
+    """
+    categories = dtype.categories
+    value_codes, uniques = pd.factorize(values.to_numpy(dtype=object))
+    uniques = np.asarray(uniques, dtype=object)
+
+    searchable = len(categories) > len(uniques)
+    if searchable:
+        try:
+            order = np.argsort(uniques)
+            positions, found = _find(categories, uniques[order])
+        except TypeError:
+            searchable = False
+    if not searchable:
+        # Small dictionaries are cheaper to hash, and unsortable ones have to be
+        extended, remap, codes = _hashed_extension(
+            categories, uniques, sort=len(categories) <= len(uniques)
+        )
+        return extended or dtype, remap, np.append(codes, -1)[value_codes]
+
+    # Each new value goes behind the new values sorting before it
+    fresh = ~found
+    fresh_codes = positions + np.cumsum(fresh) - 1
+    remap = None
+    if fresh.any() and positions[fresh][0] < len(categories):
+        # Every old code moves up by the number of new values inserted before it
+        size = len(categories)
+        remap = np.arange(size) + np.searchsorted(positions[fresh], np.arange(size), side="right")
+    # Fresh values past the end have no old code, the gather is only padded for them
+    sorted_codes = np.where(
+        fresh, fresh_codes, positions if remap is None else np.append(remap, -1)[positions]
+    )
+
+    codes = np.empty(len(uniques), dtype=np.int64)
+    codes[order] = sorted_codes
+    codes = np.append(codes, -1)[value_codes]
+    if not fresh.any():
+        return dtype, None, codes
+
+    merged = categories.append(pd.Index(uniques[order][fresh]))
+    if remap is not None:
+        layout = np.empty(len(merged), dtype=np.int64)
+        layout[remap] = np.arange(len(categories))
+        layout[fresh_codes[fresh]] = np.arange(len(categories), len(merged))
+        merged = merged.take(layout)
+
+    return _merged_dtype(merged), remap, codes
+
+
+def _merged_dtype(categories: pd.Index) -> pd.CategoricalDtype:
+    """Build the dtype of a merged dictionary, which is unique by construction.
+
+    Validating the categories would hash the whole dictionary again, so
+    pandas' unvalidated constructor is used where it exists.
+    """
+    from_fastpath = getattr(pd.CategoricalDtype, "_from_fastpath", None)
+    if from_fastpath is None:
+        return pd.CategoricalDtype(categories)
+    return from_fastpath(categories, ordered=False)
+
+
+def recode(
+    column: pd.Series, dtype: pd.CategoricalDtype, remap: np.ndarray | None = None
+) -> pd.Series:
+    """Move an encoded column to an extended dictionary, translating its codes through ``remap``."""
+    column_codes = codes(column)
+    if remap is not None:
+        column_codes = np.append(remap, -1)[column_codes]
+    return pd.Series(
+        pd.Categorical.from_codes(column_codes, dtype=dtype, validate=False),
+        index=column.index,
+        name=column.name,
+    )
+
+
+def codes(column: pd.Series) -> np.ndarray:
+    """Return the integer category codes of an encoded column (-1 for missing values)."""
+    return column.cat.codes.to_numpy()
+
+
+def lookup(keys: pd.Series, ids: pd.Series, values: pd.Series) -> pd.Series:
+    """Map ``keys`` through the ``ids -> values`` relation.
+
+    When keys, ids, and values are dictionary-encoded this is a single gather
+    over the integer codes instead of a hash join on strings. Keys without a
+    matching id are mapped to a missing value.
+    """
+    if (
+        isinstance(keys.dtype, pd.CategoricalDtype)
+        and keys.dtype == ids.dtype
+        and isinstance(values.dtype, pd.CategoricalDtype)
+    ):
+        value_codes = codes(values)
+        table = np.full(len(keys.cat.categories) + 1, -1, dtype=value_codes.dtype)
+        table[codes(ids)] = value_codes
+        table[-1] = -1
+
+        return pd.Series(
+            pd.Categorical.from_codes(table[codes(keys)], dtype=values.dtype),
+            index=keys.index,
+            name=values.name,
+        )
+
+    mapping = pd.Series(values.to_numpy(), index=ids.to_numpy())
+    mapping = mapping[~mapping.index.duplicated(keep="last")]
+
+    return pd.Series(
+        mapping.reindex(keys.to_numpy()).to_numpy(),
+        index=keys.index,
+        name=values.name,
+        dtype=values.dtype,
+    )
+
+
+def to_code(value, column: pd.Series) -> int:
+    """Translate a single raw value into the category code of an encoded column (-1 if unknown)."""
+    try:
+        return int(column.cat.categories.get_loc(value))
+    except KeyError:
+        return -1
+
+
+def to_codes(values, column: pd.Series) -> np.ndarray:
+    """Translate raw values into the category codes of an encoded column (-1 if unknown)."""
+    return column.cat.categories.get_indexer(
+        pd.Index(np.atleast_1d(np.asarray(values, dtype=object)))
+    )
+
+
+def is_in(column: pd.Series, values) -> np.ndarray:
+    """Mark the rows of an encoded column holding one of the given raw values.
+
+    The codes are checked against a lookup table over the dictionary, so
+    no value is hashed or compared per row.
+    """
+    table = np.zeros(len(column.cat.categories) + 1, dtype=bool)
+    wanted = to_codes(values, column)
+    table[wanted[wanted >= 0]] = True
+    return table[codes(column)]
@@ -0,0 +1,112 @@
+import hashlib
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import orjson
+import pandas as pd
+from pm4py.objects.ocel.obj import OCEL
+from pydantic import BaseModel
+
+from ocelescope.ocel.util.view import OCEL_TABLES
+
+_DIGEST_SIZE = 16
+
+
+def _digest(*parts: bytes) -> Any:
+    hasher = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+    for part in parts:
+        # Length prefixes keep the boundaries between parts unambiguous
+        hasher.update(len(part).to_bytes(8, "little"))
+        hasher.update(part)
+    return hasher
+
+
+def _canonical(value: Any) -> bytes:
+    return orjson.dumps(
+        value, option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY, default=str
+    )
+
+
+def table_fingerprint(frame: pd.DataFrame) -> bytes:
+    """Hash the columns and the row values of a table.
+
+    Rows are hashed in order, columns by name, as readers do not agree on
+    the order of attribute columns. Each column is hashed in one vectorized
+    pass; categorical columns hash like the values they encode, so the
+    encoding does not change the result.
+    """
+    columns = sorted(frame.columns, key=str)
+    hasher = _digest(_canonical([str(column) for column in columns]))
+    for column in columns:
+        hasher.update(pd.util.hash_pandas_object(frame[column], index=False).to_numpy().tobytes())
+    return hasher.digest()
+
+
+def ocel_fingerprint(ocel: OCEL, quantity_tables: Iterable[pd.DataFrame] | None = None) -> str:
+    """Hash the tables of a pm4py OCEL and its (non-empty) quantity tables."""
+    tables = [getattr(ocel, name) for name in OCEL_TABLES]
+    quantities = list(quantity_tables or [])
+    # Logs without quantities hash the same whether or not empty tables were given
+    if any(len(table) > 0 for table in quantities):
+        tables += quantities
+    return _digest(*(table_fingerprint(table) for table in tables)).hexdigest()
+
+
+def _filter_config(filter: BaseModel) -> list:
+    return [
+        f"{type(filter).__module__}.{type(filter).__qualname__}",
+        filter.model_dump(mode="json"),
+    ]
+
+
+def filter_key(filter: BaseModel) -> bytes:
+    """Serialize a filter's class and configuration canonically, equal for equal filters."""
+    return _canonical(_filter_config(filter))
+
+
+def pipeline_fingerprint(filters: Iterable[BaseModel]) -> bytes:
+    """Hash a filter pipeline from the filters' classes and configurations."""
+    return _digest(_canonical([_filter_config(filter) for filter in filters])).digest()
+
+
+def derived_fingerprint(source: str, *parts: bytes) -> str:
+    """Combine the fingerprint of a source log with hashes of what was derived from it."""
+    return _digest(bytes.fromhex(source), *parts).hexdigest()
+
+
+class LazyFingerprint:
+    """Compute a fingerprint on first use and share it between related logs.
+
+    Views hold the fingerprint of their source and combine it with their
+    filter pipeline, so a source log is hashed at most once no matter how
+    many views are derived from it. The computation is released once done.
+    """
+
+    def __init__(self, compute: Callable[[], str], *sources: "LazyFingerprint"):
+        self._compute: Callable[[], str] | None = compute
+        # The fingerprints the computation combines, none if it hashes tables
+        self._sources = sources
+        self._value: str | None = None
+
+    @classmethod
+    def derived(cls, source: "LazyFingerprint", *parts: bytes) -> "LazyFingerprint":
+        """Combine a source's fingerprint with hashes of what was derived from it."""
+        return cls(lambda: derived_fingerprint(source(), *parts), source)
+
+    def __call__(self) -> str:
+        # The value is stored before the computation is released, so a
+        # concurrent call either computes it as well or finds the value
+        compute = self._compute
+        if compute is not None:
+            self._value = compute()
+            self._compute, self._sources = None, ()
+        return self._value  # type: ignore[return-value]
+
+    def peek(self) -> str | None:
+        """Return the fingerprint if no table has to be hashed for it, None otherwise."""
+        if self._compute is None:
+            return self._value
+        sources = self._sources
+        if sources and all(source.peek() is not None for source in sources):
+            return self()
+        return None
@@ -1,21 +1,785 @@
 from __future__ import annotations
 
-import json
-import xml.dom.minidom
+import os
+import sqlite3
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
+from typing import Any, BinaryIO, Literal
+from xml.sax.saxutils import escape
 
+import numpy as np
+import orjson
+import pandas as pd
+from pm4py.objects.ocel.obj import OCEL
 
-def pretty_print_json(path: Path) -> None:
-    """Re-write a JSON file with 2-space indentation."""
-    data = json.loads(path.read_text(encoding="utf-8"))
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+from ocelescope.ocel.util.csr import CSRIndex
+from ocelescope.ocel.util.encoding import codes
+from ocelescope.ocel.util.sqlite import (
+    SQL_CHANGED_FIELD,
+    SQL_ID,
+    SQL_TIME,
+    SQL_TYPE,
+    SQL_TYPE_MAP,
+    bulk_write,
+    create_indices,
+    create_table,
+    insert_rows,
+    type_table_names,
+)
 
+AttributeType = Literal["string", "integer", "float", "boolean", "time"]
 
-def pretty_print_xml(path: Path) -> None:
-    """Re-write an XML file with 2-space indentation."""
-    raw = path.read_bytes()
-    dom = xml.dom.minidom.parseString(raw)
-    pretty = dom.toprettyxml(indent="  ")
-    # minidom prepends a redundant <?xml?> declaration and inserts blank lines
-    lines = [line for line in pretty.splitlines() if line.strip()]
-    path.write_text("\n".join(lines), encoding="utf-8")
+WRITE_CHUNK_SIZE = 10_000
+
+_XML_ATTRIBUTE_ENTITIES = {'"': "&quot;", "\r": "&#13;", "\n": "&#10;", "\t": "&#09;"}
+
+# Attribute values of the object table have no time of their own, OCEL 2.0 uses the epoch
+_INITIAL_TIME = pd.Series(pd.to_datetime([0], unit="ns"))
+
+
+def xml_attribute(value: Any) -> str:
+    """Escape a value for use inside a double-quoted XML attribute."""
+    return escape(str(value), _XML_ATTRIBUTE_ENTITIES)
+
+
+def _format_times(values: pd.Series, xml: bool) -> list[str]:
+    """Format timestamps as ISO 8601 in UTC with 0, 3, 6, or 9 fractional digits."""
+    # Without ``cache``, pandas would probe every value for duplicates in Python
+    values = (
+        pd.to_datetime(values, utc=True, cache=False).dt.tz_localize(None).astype("datetime64[ns]")
+    )
+    instants = values.to_numpy()
+
+    seconds = np.datetime_as_string(instants.astype("datetime64[s]"), unit="s").tolist()
+    fractions = (instants.view(np.int64) % 1_000_000_000).tolist()
+    zone = "+00:00" if xml else "Z"
+
+    return [
+        second
+        + (
+            ""
+            if fraction == 0
+            else f".{fraction // 1_000_000:03d}"
+            if fraction % 1_000_000 == 0
+            else f".{fraction // 1_000:06d}"
+            if fraction % 1_000 == 0
+            else f".{fraction:09d}"
+        )
+        + zone
+        for second, fraction in zip(seconds, fractions)
+    ]
+
+
+def _attribute_type(values: pd.Series) -> AttributeType:
+    dtype = values.dtype
+    if pd.api.types.is_bool_dtype(dtype):
+        return "boolean"
+    if pd.api.types.is_integer_dtype(dtype):
+        return "integer"
+    if pd.api.types.is_float_dtype(dtype):
+        return "float"
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "time"
+    if pd.api.types.is_object_dtype(dtype):
+        match pd.api.types.infer_dtype(values, skipna=True):
+            case "boolean":
+                return "boolean"
+            case "integer":
+                return "integer"
+            case "floating" | "mixed-integer-float" | "decimal":
+                return "float"
+            case "datetime" | "datetime64":
+                return "time"
+    return "string"
+
+
+def _serialize_value(value: Any, attribute_type: AttributeType, xml: bool) -> Any:
+    match attribute_type:
+        case "integer":
+            return str(int(value)) if xml else int(value)
+        case "float":
+            return repr(float(value)) if xml else float(value)
+        case "boolean":
+            return ("true" if value else "false") if xml else bool(value)
+        case _:
+            return escape(str(value)) if xml else str(value)
+
+
+def _serialize(values: pd.Series, attribute_type: AttributeType, xml: bool) -> np.ndarray:
+    """Serialize an attribute column for export, with None for missing values."""
+    present = values.notna().to_numpy()
+    serialized = np.full(len(values), None, dtype=object)
+    if not present.any():
+        return serialized
+
+    if attribute_type == "time":
+        serialized[present] = _format_times(values[present], xml)
+    else:
+        serialized[present] = [
+            _serialize_value(value, attribute_type, xml) for value in values[present].tolist()
+        ]
+    return serialized
+
+
+def _category_labels(column: pd.Series, convert: Callable[[Any], str] = str) -> np.ndarray:
+    """Convert the categories of an encoded column, with a trailing None picked by code -1."""
+    categories = column.cat.categories.to_numpy(dtype=object)
+    return np.array([*map(convert, categories), None], dtype=object)
+
+
+def _labels(column: pd.Series, xml: bool) -> np.ndarray:
+    """Serialize an identifier column, converting each category only once."""
+    convert = xml_attribute if xml else str
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return _category_labels(column, convert)[codes(column)]
+
+    present = column.notna().to_numpy()
+    labels = np.full(len(column), None, dtype=object)
+    labels[present] = [convert(value) for value in column[present].tolist()]
+    return labels
+
+
+def _positions(keys: pd.Series, ids: pd.Series) -> np.ndarray:
+    """Return the row position of each key within ``ids`` (-1 if it is missing)."""
+    if isinstance(keys.dtype, pd.CategoricalDtype) and keys.dtype == ids.dtype:
+        table = np.full(len(ids.cat.categories) + 1, -1, dtype=np.int64)
+        table[codes(ids)] = np.arange(len(ids))
+        table[-1] = -1
+        return table[codes(keys)]
+
+    rows = pd.Series(np.arange(len(ids)), index=ids.to_numpy(dtype=object))
+    rows = rows[~rows.index.duplicated(keep="last")]
+    return rows.reindex(keys.to_numpy(dtype=object)).fillna(-1).to_numpy(dtype=np.int64)
+
+
+def _grouped(positions: np.ndarray, size: int) -> CSRIndex:
+    """Group table rows by the row position of their source record."""
+    return CSRIndex.from_codes(positions, np.arange(len(positions)), size)
+
+
+class _LogWriter:
+    """Serialize the records of a pm4py OCEL for the OCEL 2.0 JSON or XML format.
+
+    Identifiers, timestamps, and attribute values are serialized column by
+    column up front; records are then assembled ``chunk_size`` at a time, so
+    only one chunk of records exists at any point.
+    """
+
+    def __init__(self, ocel: OCEL, xml: bool, chunk_size: int = WRITE_CHUNK_SIZE):
+        self.ocel = ocel
+        self.xml = xml
+        self.chunk_size = chunk_size
+
+        eid, oid = ocel.event_id_column, ocel.object_id_column
+        self.fixed_event_columns = [eid, ocel.event_activity, ocel.event_timestamp]
+        self.fixed_object_columns = [oid, ocel.object_type_column]
+        self.event_attributes = [
+            column for column in ocel.events.columns if column not in self.fixed_event_columns
+        ]
+        self.object_attributes = [
+            column for column in ocel.objects.columns if column not in self.fixed_object_columns
+        ]
+        self.changed_attributes = [
+            column
+            for column in ocel.object_changes.columns
+            if column in self.object_attributes
+            and ocel.changed_field in ocel.object_changes.columns
+        ]
+
+        self.event_types = {
+            column: _attribute_type(ocel.events[column].dropna())
+            for column in self.event_attributes
+        }
+        self.object_types = {
+            column: _attribute_type(
+                pd.concat(
+                    [ocel.objects[column].dropna()]
+                    + (
+                        [ocel.object_changes[column].dropna()]
+                        if column in self.changed_attributes
+                        else []
+                    )
+                )
+            )
+            for column in self.object_attributes
+        }
+
+    def event_type_declarations(self) -> list[tuple[str, list[tuple[str, AttributeType]]]]:
+        events = self.ocel.events
+        present = (
+            events[self.event_attributes]
+            .notna()
+            .groupby(events[self.ocel.event_activity], observed=True)
+            .any()
+        )
+        return [
+            (
+                str(activity),
+                [(column, self.event_types[column]) for column in present.columns if row[column]],
+            )
+            for activity, row in present.iterrows()
+        ]
+
+    def object_type_declarations(self) -> list[tuple[str, list[tuple[str, AttributeType]]]]:
+        otype = self.ocel.object_type_column
+        objects, changes = self.ocel.objects, self.ocel.object_changes
+
+        present = (
+            objects[self.object_attributes].notna().groupby(objects[otype].astype(object)).any()
+        )
+        if self.changed_attributes and len(changes) > 0:
+            changed = (
+                pd.DataFrame(
+                    {
+                        column: changes[column].notna()
+                        & changes[self.ocel.changed_field].eq(column)
+                        for column in self.changed_attributes
+                    }
+                )
+                .groupby(changes[otype].astype(object))
+                .any()
+            )
+            index = present.index.union(changed.index)
+            present = present.reindex(index, fill_value=False) | changed.reindex(
+                index=index, columns=present.columns, fill_value=False
+            )
+
+        return [
+            (
+                str(object_type),
+                [(column, self.object_types[column]) for column in present.columns if row[column]],
+            )
+            for object_type, row in present.sort_index().iterrows()
+        ]
+
+    def _relationships(
+        self, table: pd.DataFrame, source: str, target: str, ids: pd.Series
+    ) -> tuple[CSRIndex, np.ndarray, np.ndarray]:
+        grouped = _grouped(_positions(table[source], ids), len(ids))
+        rows = table.iloc[grouped.edges]
+        return (
+            grouped,
+            _labels(rows[target], self.xml),
+            _labels(rows[self.ocel.qualifier], self.xml),
+        )
+
+    def events(self) -> Iterator[dict[str, Any]]:
+        """Yield one record per event, with its attribute values and object relationships."""
+        ocel = self.ocel
+        events = ocel.events
+        eid = ocel.event_id_column
+
+        relations, related_objects, qualifiers = self._relationships(
+            ocel.relations, eid, ocel.object_id_column, events[eid]
+        )
+
+        for start in range(0, len(events), self.chunk_size):
+            chunk = events.iloc[start : start + self.chunk_size]
+            attributes = self._attributes(chunk, self.event_attributes, self.event_types)
+
+            for row, (event_id, activity, time) in enumerate(
+                zip(
+                    _labels(chunk[eid], self.xml),
+                    _labels(chunk[ocel.event_activity], self.xml),
+                    _format_times(chunk[ocel.event_timestamp], self.xml),
+                )
+            ):
+                edges = relations.row(start + row)
+                yield {
+                    "id": event_id,
+                    "type": activity,
+                    "time": time,
+                    "attributes": attributes[row],
+                    "relationships": list(zip(related_objects[edges], qualifiers[edges])),
+                }
+
+    def objects(self) -> Iterator[dict[str, Any]]:
+        """Yield one record per object, with its attribute values and changes and its
+        object-to-object relationships."""
+        ocel = self.ocel
+        objects = ocel.objects
+        oid = ocel.object_id_column
+
+        o2o, related_objects, qualifiers = self._relationships(
+            ocel.o2o, oid, f"{oid}_2", objects[oid]
+        )
+        changed, change_names, change_values, change_times = self._changes()
+
+        initial_time = _format_times(_INITIAL_TIME, self.xml)[0]
+        for start in range(0, len(objects), self.chunk_size):
+            chunk = objects.iloc[start : start + self.chunk_size]
+            attributes = self._attributes(chunk, self.object_attributes, self.object_types)
+
+            for row, (object_id, object_type) in enumerate(
+                zip(
+                    _labels(chunk[oid], self.xml),
+                    _labels(chunk[ocel.object_type_column], self.xml),
+                )
+            ):
+                edges = o2o.row(start + row)
+                change_rows = changed.row(start + row)
+                yield {
+                    "id": object_id,
+                    "type": object_type,
+                    "attributes": [(name, value, initial_time) for name, value in attributes[row]]
+                    + list(
+                        zip(
+                            change_names[change_rows],
+                            change_values[change_rows],
+                            change_times[change_rows],
+                        )
+                    ),
+                    "relationships": list(zip(related_objects[edges], qualifiers[edges])),
+                }
+
+    def _attributes(
+        self, chunk: pd.DataFrame, columns: list[str], types: dict[str, AttributeType]
+    ) -> list[list[tuple[str, Any]]]:
+        """Collect the present attribute values of each row as ``(name, value)`` pairs."""
+        rows: list[list[tuple[str, Any]]] = [[] for _ in range(len(chunk))]
+        for column in columns:
+            name = xml_attribute(column) if self.xml else str(column)
+            values = _serialize(chunk[column], types[column], self.xml)
+            for row in np.flatnonzero(np.not_equal(values, None)):
+                rows[row].append((name, values[row]))
+        return rows
+
+    def _changes(self) -> tuple[CSRIndex, np.ndarray, np.ndarray, np.ndarray]:
+        """Group the attribute changes by object, keeping only changes with a value."""
+        ocel = self.ocel
+        changes = ocel.object_changes
+        oid = ocel.object_id_column
+
+        values = np.full(len(changes), None, dtype=object)
+        if self.changed_attributes:
+            fields = changes[ocel.changed_field].to_numpy(dtype=object)
+            for column in self.changed_attributes:
+                rows = fields == column
+                if rows.any():
+                    values[rows] = _serialize(
+                        changes[column][rows], self.object_types[column], self.xml
+                    )
+
+        present = np.flatnonzero(np.not_equal(values, None))
+        positions = np.full(len(changes), -1, dtype=np.int64)
+        positions[present] = _positions(changes[oid].iloc[present], ocel.objects[oid])
+        grouped = _grouped(positions, len(ocel.objects))
+
+        rows = changes.iloc[grouped.edges]
+        names = (
+            _labels(rows[ocel.changed_field], self.xml)
+            if len(rows) > 0
+            else np.array([], dtype=object)
+        )
+        times = np.array(
+            _format_times(rows[ocel.event_timestamp], self.xml) if len(rows) > 0 else [],
+            dtype=object,
+        )
+        return grouped, names, values[grouped.edges], times
+
+
+class _JSONStreamWriter:
+    """Write JSON values to a binary stream.
+
+    Mappings are written member by member and iterators as arrays element by
+    element, so large arrays can be produced lazily. Any other value is
+    serialized as a whole. Indentation follows ``json.dumps(indent=2)``.
+    """
+
+    def __init__(self, file: BinaryIO, compact: bool = False):
+        self.file = file
+        self.compact = compact
+
+    def _newline(self, depth: int) -> bytes:
+        return b"" if self.compact else b"\n" + b"  " * depth
+
+    def _dumps(self, value: Any, depth: int) -> bytes:
+        if self.compact:
+            return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY)
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY).replace(
+            b"\n", self._newline(depth)
+        )
+
+    def write(self, value: Any, depth: int = 0):
+        if isinstance(value, dict):
+            self._container(
+                b"{",
+                b"}",
+                (
+                    (self._dumps(str(key), depth + 1) + (b":" if self.compact else b": "), member)
+                    for key, member in value.items()
+                ),
+                depth,
+            )
+        elif isinstance(value, Iterator):
+            self._container(b"[", b"]", ((b"", item) for item in value), depth)
+        else:
+            self.file.write(self._dumps(value, depth))
+
+    def _container(
+        self, opening: bytes, closing: bytes, entries: Iterable[tuple[bytes, Any]], depth: int
+    ):
+        self.file.write(opening)
+        empty = True
+        for prefix, value in entries:
+            self.file.write((b"" if empty else b",") + self._newline(depth + 1) + prefix)
+            self.write(value, depth + 1)
+            empty = False
+        self.file.write((b"" if empty else self._newline(depth)) + closing)
+
+
+def _json_records(writer: _LogWriter) -> dict[str, Any]:
+    return {
+        "eventTypes": [
+            {"name": name, "attributes": [{"name": n, "type": t} for n, t in attributes]}
+            for name, attributes in writer.event_type_declarations()
+        ],
+        "objectTypes": [
+            {"name": name, "attributes": [{"name": n, "type": t} for n, t in attributes]}
+            for name, attributes in writer.object_type_declarations()
+        ],
+        "events": (
+            {
+                **event,
+                "attributes": [{"name": n, "value": v} for n, v in event["attributes"]],
+                "relationships": [
+                    {"objectId": o, "qualifier": q} for o, q in event["relationships"]
+                ],
+            }
+            for event in writer.events()
+        ),
+        "objects": (
+            {
+                **obj,
+                "attributes": [{"name": n, "value": v, "time": t} for n, v, t in obj["attributes"]],
+                "relationships": [{"objectId": o, "qualifier": q} for o, q in obj["relationships"]],
+            }
+            for obj in writer.objects()
+        ),
+    }
+
+
+def write_ocel_json(
+    ocel: OCEL, path: Path, members: dict[str, Any] | None = None, compact: bool = False
+):
+    """Write a pm4py OCEL as an OCEL 2.0 JSON file in a single pass.
+
+    Events and objects are streamed in chunks, and ``members`` (e.g. the
+    quantity extension or extension payloads) are appended to the root object
+    in order. Values of ``members`` may contain iterators, which are written
+    as arrays without collecting them first. The file is indented with two
+    spaces unless ``compact`` is set, and replaced atomically.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as file:
+        _JSONStreamWriter(file, compact=compact).write(
+            {**_json_records(_LogWriter(ocel, xml=False)), **(members or {})}
+        )
+        file.write(b"\n")
+    os.replace(tmp, path)
+
+
+def _xml_element(tag: str, attributes: str, children: list[str], newline: str) -> str:
+    if not children:
+        return f"{newline}<{tag}{attributes}/>"
+    return f"{newline}<{tag}{attributes}>{''.join(children)}{newline}</{tag}>"
+
+
+def _xml_chunks(writer: _LogWriter, elements: Iterable[str], compact: bool) -> Iterator[str]:
+    def newline(depth: int) -> str:
+        return "" if compact else "\n" + "  " * depth
+
+    def types(tag: str, declarations: list[tuple[str, list[tuple[str, AttributeType]]]]) -> str:
+        return _xml_element(
+            f"{tag}s",
+            "",
+            [
+                _xml_element(
+                    tag,
+                    f' name="{xml_attribute(name)}"',
+                    [
+                        _xml_element(
+                            "attributes",
+                            "",
+                            [
+                                f'{newline(4)}<attribute name="{xml_attribute(n)}" type="{t}"/>'
+                                for n, t in attributes
+                            ],
+                            newline(3),
+                        )
+                    ],
+                    newline(2),
+                )
+                for name, attributes in declarations
+            ],
+            newline(1),
+        )
+
+    def relationships(record: dict[str, Any]) -> str:
+        return _xml_element(
+            "objects",
+            "",
+            [
+                f'{newline(4)}<relationship object-id="{o}" qualifier="{q}"/>'
+                for o, q in record["relationships"]
+            ],
+            newline(3),
+        )
+
+    yield '<?xml version="1.0" encoding="UTF-8"?>' + ("" if compact else "\n") + "<log>"
+    yield types("object-type", writer.object_type_declarations())
+    yield types("event-type", writer.event_type_declarations())
+
+    yield f"{newline(1)}<objects>"
+    for obj in writer.objects():
+        attributes = [
+            f'{newline(4)}<attribute name="{n}" time="{t}">{v}</attribute>'
+            for n, v, t in obj["attributes"]
+        ]
+        yield (
+            f'{newline(2)}<object id="{obj["id"]}" type="{obj["type"]}">'
+            f"{_xml_element('attributes', '', attributes, newline(3))}"
+            f"{relationships(obj)}{newline(2)}</object>"
+        )
+    yield f"{newline(1)}</objects>{newline(1)}<events>"
+    for event in writer.events():
+        attributes = [
+            f'{newline(4)}<attribute name="{n}">{v}</attribute>' for n, v in event["attributes"]
+        ]
+        yield (
+            f'{newline(2)}<event id="{event["id"]}" type="{event["type"]}"'
+            f' time="{event["time"]}">'
+            f"{_xml_element('attributes', '', attributes, newline(3))}"
+            f"{relationships(event)}{newline(2)}</event>"
+        )
+    yield f"{newline(1)}</events>"
+
+    for element in elements:
+        yield newline(1) + element
+    yield f"{newline(0)}</log>\n"
+
+
+def write_ocel_xml(ocel: OCEL, path: Path, elements: Iterable[str] = (), compact: bool = False):
+    """Write a pm4py OCEL as an OCEL 2.0 XML file in a single pass.
+
+    Objects and events are streamed in chunks, and the serialized
+    ``elements`` (e.g. the quantity extension or extension payloads) are
+    appended to the log root in order. The file is indented with two spaces
+    unless ``compact`` is set, and replaced atomically.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as file:
+        file.writelines(_xml_chunks(_LogWriter(ocel, xml=True), elements, compact))
+    os.replace(tmp, path)
+
+
+_SQL_TYPES: dict[AttributeType, str] = {
+    "string": "TEXT",
+    "integer": "INTEGER",
+    "float": "REAL",
+    "boolean": "BOOLEAN",
+    "time": "TIMESTAMP",
+}
+
+
+def _bindable(
+    values: pd.Series, attribute_type: AttributeType
+) -> Callable[[slice | np.ndarray], list[Any]]:
+    """Return a converter of row ranges of a column into Python values SQLite can bind.
+
+    Missing values become None. The categories of encoded columns are
+    converted once, so each chunk only gathers their labels.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        labels, value_codes = _category_labels(values), codes(values)
+        return lambda rows: labels[value_codes[rows]].tolist()
+    return lambda rows: _serialize(values.iloc[rows], attribute_type, xml=False).tolist()
+
+
+def _size(rows: slice | np.ndarray) -> int:
+    return rows.stop - rows.start if isinstance(rows, slice) else len(rows)
+
+
+def _constant(value: Any) -> Callable[[slice | np.ndarray], list]:
+    return lambda rows: [value] * _size(rows)
+
+
+def _sqlite_rows(
+    frame: pd.DataFrame,
+    columns: list[tuple[str, AttributeType]],
+    rows: np.ndarray | None = None,
+    defaults: dict[str, Any] | None = None,
+    chunk_size: int = WRITE_CHUNK_SIZE,
+) -> Iterator[tuple]:
+    """Yield the rows of ``frame`` (or the rows at the given positions) as tuples of bindable values.
+
+    Columns are converted ``chunk_size`` rows at a time. Columns missing
+    from the frame take their value from ``defaults`` (None otherwise).
+    """
+    converters = [
+        _bindable(frame[column], attribute_type)
+        if column in frame.columns
+        else _constant((defaults or {}).get(column))
+        for column, attribute_type in columns
+    ]
+    size = len(frame) if rows is None else len(rows)
+    for start in range(0, size, chunk_size):
+        chunk = (
+            slice(start, min(start + chunk_size, size))
+            if rows is None
+            else rows[start : start + chunk_size]
+        )
+        yield from zip(*(convert(chunk) for convert in converters))
+
+
+def write_sqlite_table(
+    conn: sqlite3.Connection, table: str, frame: pd.DataFrame, indices: Iterable[str] = ()
+):
+    """(Re)create a table from a DataFrame, declaring the column types from its values."""
+    columns = [(column, _attribute_type(frame[column].dropna())) for column in frame.columns]
+    create_table(conn, table, [(str(column), _SQL_TYPES[t]) for column, t in columns])
+    insert_rows(conn, table, len(columns), _sqlite_rows(frame, columns))
+    create_indices(conn, table, indices)
+
+
+def _rows_by_type(types: pd.Series) -> dict[str, np.ndarray]:
+    """Return the row positions of each type, in table order."""
+    type_codes, uniques = pd.factorize(types, sort=True)
+    order = np.argsort(type_codes, kind="stable")
+    bounds = np.searchsorted(type_codes[order], np.arange(len(uniques) + 1))
+    return {
+        str(ocel_type): order[bounds[code] : bounds[code + 1]]
+        for code, ocel_type in enumerate(uniques)
+    }
+
+
+def write_ocel_sqlite(
+    ocel: OCEL,
+    path: Path,
+    tables: dict[str, pd.DataFrame] | None = None,
+    chunk_size: int = WRITE_CHUNK_SIZE,
+):
+    """Write a pm4py OCEL as an OCEL 2.0 SQLite database.
+
+    All tables, including the additional ``tables`` (e.g. the quantity
+    extension), are bulk inserted in a single transaction, and the
+    identifier and type columns are indexed once their table is filled. The
+    database is built next to ``path`` and replaces it when complete.
+    """
+    writer = _LogWriter(ocel, xml=False)
+    eid, oid = ocel.event_id_column, ocel.object_id_column
+    events, objects, changes = ocel.events, ocel.objects, ocel.object_changes
+
+    event_types = writer.event_type_declarations()
+    object_types = writer.object_type_declarations()
+    event_tables = type_table_names(name for name, _ in event_types)
+    object_tables = type_table_names(name for name, _ in object_types)
+
+    with bulk_write(path) as conn:
+        for table, frame, columns in [
+            ("event", events, [(SQL_ID, eid), (SQL_TYPE, ocel.event_activity)]),
+            ("object", objects, [(SQL_ID, oid), (SQL_TYPE, ocel.object_type_column)]),
+            (
+                "event_object",
+                ocel.relations,
+                [
+                    ("ocel_event_id", eid),
+                    ("ocel_object_id", oid),
+                    ("ocel_qualifier", ocel.qualifier),
+                ],
+            ),
+            (
+                "object_object",
+                ocel.o2o,
+                [
+                    ("ocel_source_id", oid),
+                    ("ocel_target_id", f"{oid}_2"),
+                    ("ocel_qualifier", ocel.qualifier),
+                ],
+            ),
+        ]:
+            create_table(conn, table, [(name, "TEXT") for name, _ in columns])
+            insert_rows(
+                conn,
+                table,
+                len(columns),
+                _sqlite_rows(
+                    frame, [(column, "string") for _, column in columns], chunk_size=chunk_size
+                ),
+            )
+            create_indices(conn, table, [name for name, _ in columns if name != "ocel_qualifier"])
+
+        for prefix, names in (("event", event_tables), ("object", object_tables)):
+            create_table(conn, f"{prefix}_map_type", [(SQL_TYPE, "TEXT"), (SQL_TYPE_MAP, "TEXT")])
+            insert_rows(conn, f"{prefix}_map_type", 2, names.items())
+
+        event_rows = _rows_by_type(events[ocel.event_activity])
+        for event_type, attributes in event_types:
+            table = f"event_{event_tables[event_type]}"
+            create_table(
+                conn,
+                table,
+                [(SQL_ID, "TEXT"), (SQL_TIME, "TIMESTAMP")]
+                + [(str(name), _SQL_TYPES[t]) for name, t in attributes],
+            )
+            insert_rows(
+                conn,
+                table,
+                2 + len(attributes),
+                _sqlite_rows(
+                    events,
+                    [(eid, "string"), (ocel.event_timestamp, "time"), *attributes],
+                    event_rows[event_type],
+                    chunk_size=chunk_size,
+                ),
+            )
+            create_indices(conn, table, [SQL_ID])
+
+        # Attribute values of the object table come first, followed by their changes
+        object_rows = [
+            (
+                objects,
+                _rows_by_type(objects[ocel.object_type_column]),
+                _format_times(_INITIAL_TIME, xml=False)[0],
+            ),
+            (changes, _rows_by_type(changes[ocel.object_type_column]), None),
+        ]
+        for object_type, attributes in object_types:
+            table = f"object_{object_tables[object_type]}"
+            create_table(
+                conn,
+                table,
+                [(SQL_ID, "TEXT"), (SQL_TIME, "TIMESTAMP"), (SQL_CHANGED_FIELD, "TEXT")]
+                + [(str(name), _SQL_TYPES[t]) for name, t in attributes],
+            )
+            for frame, rows, initial_time in object_rows:
+                insert_rows(
+                    conn,
+                    table,
+                    3 + len(attributes),
+                    _sqlite_rows(
+                        frame,
+                        [
+                            (oid, "string"),
+                            (ocel.event_timestamp, "time"),
+                            (ocel.changed_field, "string"),
+                            *attributes,
+                        ],
+                        rows.get(object_type, np.array([], dtype=np.int64)),
+                        defaults={ocel.event_timestamp: initial_time},
+                        chunk_size=chunk_size,
+                    ),
+                )
+            create_indices(conn, table, [SQL_ID])
+
+        for table, frame in (tables or {}).items():
+            write_sqlite_table(
+                conn,
+                table,
+                frame,
+                indices=[
+                    column
+                    for column in ("ocel_event_id", "ocel_object_id")
+                    if column in frame.columns
+                ],
+            )
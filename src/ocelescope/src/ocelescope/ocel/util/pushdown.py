@@ -0,0 +1,111 @@
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import cached_property
+from typing import Any
+
+import pandas as pd
+
+# Bounds are widened by this margin wherever timestamps are compared with
+# less than nanosecond precision, so that no row a filter keeps is skipped
+TIME_MARGIN = pd.Timedelta(seconds=1)
+
+
+def _intersect(a: frozenset[str] | None, b: frozenset[str] | None):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return a & b
+
+
+def _latest(a: pd.Timestamp | None, b: pd.Timestamp | None):
+    return b if a is None else a if b is None else max(a, b)
+
+
+def _earliest(a: pd.Timestamp | None, b: pd.Timestamp | None):
+    return b if a is None else a if b is None else min(a, b)
+
+
+def utc_timestamp(value: Any) -> pd.Timestamp:
+    """Convert a timestamp to UTC, treating naive timestamps as UTC."""
+    timestamp = pd.Timestamp(value)
+    return timestamp.tz_localize("UTC") if timestamp.tz is None else timestamp.tz_convert("UTC")
+
+
+@dataclass(frozen=True)
+class ReadPredicate:
+    """Row-local conditions that readers can check while loading a log.
+
+    A predicate only describes which events and objects are worth loading.
+    Readers may keep rows it rejects (e.g. timestamps they cannot compare
+    while reading), but never skip a row it accepts, so the filters it was
+    derived from still have to be applied to the loaded log.
+
+    Attributes:
+        activities: Activities of the events to keep (all if None).
+        excluded_activities: Activities of the events to skip.
+        object_types: Types of the objects to keep (all if None).
+        excluded_object_types: Types of the objects to skip.
+        start: Earliest event timestamp to keep (UTC).
+        end: Latest event timestamp to keep (UTC).
+    """
+
+    activities: frozenset[str] | None = None
+    excluded_activities: frozenset[str] = frozenset()
+    object_types: frozenset[str] | None = None
+    excluded_object_types: frozenset[str] = frozenset()
+    start: pd.Timestamp | None = None
+    end: pd.Timestamp | None = None
+
+    def __and__(self, other: "ReadPredicate") -> "ReadPredicate":
+        return ReadPredicate(
+            activities=_intersect(self.activities, other.activities),
+            excluded_activities=self.excluded_activities | other.excluded_activities,
+            object_types=_intersect(self.object_types, other.object_types),
+            excluded_object_types=self.excluded_object_types | other.excluded_object_types,
+            start=_latest(self.start, other.start),
+            end=_earliest(self.end, other.end),
+        )
+
+    @property
+    def filters_times(self) -> bool:
+        return self.start is not None or self.end is not None
+
+    @property
+    def filters_events(self) -> bool:
+        return self.activities is not None or bool(self.excluded_activities) or self.filters_times
+
+    @property
+    def filters_objects(self) -> bool:
+        return self.object_types is not None or bool(self.excluded_object_types)
+
+    def keeps_activity(self, activity: Any) -> bool:
+        return (
+            self.activities is None or activity in self.activities
+        ) and activity not in self.excluded_activities
+
+    def keeps_object_type(self, object_type: Any) -> bool:
+        return (
+            self.object_types is None or object_type in self.object_types
+        ) and object_type not in self.excluded_object_types
+
+    @cached_property
+    def _bounds(self) -> tuple[datetime | None, datetime | None]:
+        return (
+            (self.start - TIME_MARGIN).to_pydatetime() if self.start is not None else None,
+            (self.end + TIME_MARGIN).to_pydatetime() if self.end is not None else None,
+        )
+
+    def keeps_time(self, value: Any) -> bool:
+        """Check an ISO 8601 timestamp (naive ones are UTC), keeping values that cannot be parsed."""
+        if not self.filters_times:
+            return True
+        try:
+            timestamp = datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            return True
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=UTC)
+
+        start, end = self._bounds
+        return (start is None or timestamp >= start) and (end is None or timestamp <= end)
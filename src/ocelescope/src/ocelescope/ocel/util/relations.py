@@ -4,41 +4,28 @@ import pandas as pd
 from pm4py.objects.ocel.obj import OCEL
 
 from ocelescope.ocel.models.relations import RelationCountSummary
+from ocelescope.ocel.util.encoding import lookup
 
 SUMMARY_DIRECTION = Literal["source", "target"]
 
 
 def getO2OWithTypes(ocel, direction: SUMMARY_DIRECTION = "source"):
-    o2o_with_types = pd.merge(
-        ocel.o2o,
-        ocel.objects[[ocel.object_id_column, ocel.object_type_column]],
-        how="left",
-    )
-    o2o_with_types = pd.merge(
-        o2o_with_types,
-        ocel.objects[[ocel.object_id_column, ocel.object_type_column]],
-        how="left",
-        left_on=f"{ocel.object_id_column}_2",
-        right_on=ocel.object_id_column,
-        suffixes=["", "_new"],  # type:ignore
-    )
-    o2o_with_types = o2o_with_types[
-        [
-            ocel.object_id_column,
-            f"{ocel.object_id_column}_2",
-            ocel.qualifier,
-            ocel.object_type_column,
-            f"{ocel.object_type_column}_new",
-        ]
-    ]
-    rename_map = {
-        ocel.object_id_column: direction,
-        f"{ocel.object_id_column}_2": "target" if direction == "source" else "source",
-        ocel.qualifier: "qualifier",
-        ocel.object_type_column: f"{direction}_type",
-        f"{ocel.object_type_column}_new": f"{'target' if direction == 'source' else 'source'}_type",
-    }
-    return o2o_with_types.rename(columns=rename_map)  # type:ignore
+    other = "target" if direction == "source" else "source"
+    o2o = ocel.o2o
+    source_ids = o2o[ocel.object_id_column]
+    target_ids = o2o[f"{ocel.object_id_column}_2"]
+    object_ids = ocel.objects[ocel.object_id_column]
+    object_types = ocel.objects[ocel.object_type_column]
+
+    return pd.DataFrame(
+        {
+            direction: source_ids,
+            other: target_ids,
+            "qualifier": o2o[ocel.qualifier],
+            f"{direction}_type": lookup(source_ids, object_ids, object_types),
+            f"{other}_type": lookup(target_ids, object_ids, object_types),
+        }
+    ).reset_index(drop=True)
 
 
 def summarize_relation_counts(
@@ -50,14 +37,18 @@ def summarize_relation_counts(
     source_df: pd.DataFrame,
 ) -> list[RelationCountSummary]:
     grouped_relations = (
-        relation_table.groupby([source_id_col, qualifier_col, source_type_col, target_type_col])
+        relation_table.groupby(
+            [source_id_col, qualifier_col, source_type_col, target_type_col], observed=True
+        )
         .size()
         .reset_index()
         .rename(columns={0: "count"})
     )
 
     summary = (
-        grouped_relations.groupby([qualifier_col, source_type_col, target_type_col])["count"]
+        grouped_relations.groupby([qualifier_col, source_type_col, target_type_col], observed=True)[
+            "count"
+        ]
         .agg(["min", "max", "sum"])
         .reset_index()
         .rename(columns={"min": "min_count", "max": "max_count"})
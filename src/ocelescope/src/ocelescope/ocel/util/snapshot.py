@@ -0,0 +1,323 @@
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import Literal
+
+import orjson
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from pm4py.objects.ocel.obj import OCEL, Parameters
+
+from ocelescope.ocel.util.pushdown import TIME_MARGIN, ReadPredicate
+
+SnapshotFormat = Literal["parquet", "arrow"]
+
+SNAPSHOT_SUFFIXES: dict[str, SnapshotFormat] = {
+    ".parquetocel": "parquet",
+    ".arrowocel": "arrow",
+}
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_MANIFEST = "manifest.json"
+
+OCEL_TABLES = ["events", "objects", "relations", "o2o", "object_changes", "e2e"]
+QUANTITY_TABLES = ["oqty", "qop", "item_properties"]
+
+# pm4py column name attributes and the parameters that set them
+_COLUMN_PARAMETERS = {
+    "event_id_column": Parameters.EVENT_ID,
+    "event_activity": Parameters.EVENT_ACTIVITY,
+    "event_timestamp": Parameters.EVENT_TIMESTAMP,
+    "object_id_column": Parameters.OBJECT_ID,
+    "object_type_column": Parameters.OBJECT_TYPE,
+    "qualifier": Parameters.QUALIFIER,
+    "changed_field": Parameters.CHANGED_FIELD,
+}
+
+
+def snapshot_format(path: Path) -> SnapshotFormat:
+    try:
+        return SNAPSHOT_SUFFIXES[path.suffix]
+    except KeyError:
+        raise ValueError(f"Unsupported snapshot extension: {path.suffix}") from None
+
+
+def _table_path(path: Path, name: str) -> Path:
+    return path / f"{name}.{snapshot_format(path)}"
+
+
+def _arrow_compatible(frame: pd.DataFrame) -> pd.DataFrame:
+    """Stringify object columns holding values of mixed types, which Arrow cannot store."""
+    mixed = {}
+    for column in frame.select_dtypes(include="object").columns:
+        try:
+            pa.array(frame[column], from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            mixed[column] = frame[column].map(lambda value: value if pd.isna(value) else str(value))
+
+    return frame.assign(**mixed) if mixed else frame
+
+
+def write_snapshot_table(path: Path, name: str, frame: pd.DataFrame):
+    """Write a single table of a snapshot, replacing it atomically."""
+    target = _table_path(path, name)
+    tmp = target.with_suffix(target.suffix + ".tmp")
+    frame = _arrow_compatible(frame.reset_index(drop=True))
+
+    match snapshot_format(path):
+        case "parquet":
+            frame.to_parquet(tmp, index=False)
+        case "arrow":
+            # Uncompressed, so the file can be memory-mapped when reading
+            frame.to_feather(tmp, compression="uncompressed")
+
+    os.replace(tmp, target)
+
+
+# Builds the row filter of a table from its schema (None to read all rows)
+RowFilter = Callable[[pa.Schema], pc.Expression | None]
+
+
+def _schema(target: Path, snapshot: SnapshotFormat) -> pa.Schema:
+    if snapshot == "parquet":
+        return pq.read_schema(target)
+    with pa.memory_map(str(target), "r") as source:
+        return pa.ipc.open_file(source).schema
+
+
+def read_snapshot_table(
+    path: Path,
+    name: str,
+    fallback_columns: list[str] | None = None,
+    memory_map: bool = False,
+    where: RowFilter | None = None,
+) -> pd.DataFrame:
+    """Read a single table of a snapshot.
+
+    Missing tables are returned as empty frames with ``fallback_columns``.
+    With ``memory_map``, Arrow tables are mapped instead of read: column
+    buffers that pandas can use as-is (e.g. category codes and timestamps
+    without missing values) stay backed by the file, so processes opening the
+    same snapshot share that memory through the page cache. Such columns are
+    read-only.
+
+    Rows are filtered by the expression ``where`` builds for the table's
+    schema before they are converted to pandas. Parquet skips row groups
+    whose statistics rule out any match, Arrow tables are mapped and only the
+    matching rows are copied.
+    """
+    target = _table_path(path, name)
+    if not target.exists():
+        return pd.DataFrame(columns=fallback_columns or [])
+
+    snapshot = snapshot_format(path)
+    expression = where(_schema(target, snapshot)) if where is not None else None
+
+    match snapshot:
+        case "parquet":
+            return pd.read_parquet(target, filters=expression)
+        case "arrow" if expression is not None:
+            with pa.memory_map(str(target), "r") as source:
+                table = pa.ipc.open_file(source).read_all().filter(expression)
+            return table.to_pandas(split_blocks=memory_map)
+        case "arrow" if memory_map:
+            with pa.memory_map(str(target), "r") as source:
+                table = pa.ipc.open_file(source).read_all()
+            return table.to_pandas(split_blocks=True)
+        case "arrow":
+            return pd.read_feather(target)
+
+
+def write_snapshot(ocel: OCEL, path: Path):
+    """Write a pm4py OCEL as a columnar snapshot directory.
+
+    Every table is stored as its own Parquet (``.parquetocel``) or Arrow IPC
+    (``.arrowocel``) file, so dtypes including the categorical encoding and
+    timezone-aware timestamps survive the round trip without any per-row
+    conversion. Column names and globals go to a JSON manifest, which is
+    written last so that an interrupted write is never read as complete.
+    Quantity tables are added by the quantity extension writer.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+
+    manifest = path / SNAPSHOT_MANIFEST
+    manifest.unlink(missing_ok=True)
+    for name in QUANTITY_TABLES:
+        _table_path(path, name).unlink(missing_ok=True)
+
+    for name in OCEL_TABLES:
+        write_snapshot_table(path, name, getattr(ocel, name))
+
+    manifest.write_bytes(
+        orjson.dumps(
+            {
+                "version": SNAPSHOT_VERSION,
+                "format": snapshot_format(path),
+                "columns": {
+                    attribute: getattr(ocel, attribute) for attribute in _COLUMN_PARAMETERS
+                },
+                "globals": ocel.globals or {},
+            },
+            default=str,
+        )
+    )
+
+
+def _membership(
+    column: str, values: frozenset[str] | None, excluded: frozenset[str]
+) -> pc.Expression | None:
+    expression = None
+    if values is not None:
+        expression = pc.is_in(pc.field(column), value_set=pa.array(sorted(values), pa.string()))
+    if excluded:
+        kept = ~pc.is_in(pc.field(column), value_set=pa.array(sorted(excluded), pa.string()))
+        expression = kept if expression is None else expression & kept
+    return expression
+
+
+def _time_range(schema: pa.Schema, column: str, predicate: ReadPredicate) -> pc.Expression | None:
+    if not predicate.filters_times or column not in schema.names:
+        return None
+
+    arrow_type = schema.field(column).type
+
+    def bound(timestamp: pd.Timestamp) -> pa.Scalar:
+        # Whole seconds, so the bound is representable in any timestamp unit
+        return pa.scalar(
+            timestamp if arrow_type.tz is not None else timestamp.tz_localize(None),
+            type=arrow_type,
+        )
+
+    expression = pc.field(column).is_null()
+    in_range = None
+    if predicate.start is not None:
+        in_range = pc.field(column) >= bound((predicate.start - TIME_MARGIN).floor("s"))
+    if predicate.end is not None:
+        before_end = pc.field(column) <= bound((predicate.end + TIME_MARGIN).ceil("s"))
+        in_range = before_end if in_range is None else in_range & before_end
+    return expression | in_range
+
+
+def _conjunction(*expressions: pc.Expression | None) -> pc.Expression | None:
+    expression = None
+    for condition in expressions:
+        if condition is not None:
+            expression = condition if expression is None else expression & condition
+    return expression
+
+
+def _predicate_filter(
+    predicate: ReadPredicate, columns: dict[str, str], events: bool, objects: bool
+) -> RowFilter:
+    """Filter rows by the activities and timestamps and/or object types of the predicate."""
+
+    activity, timestamp = columns["event_activity"], columns["event_timestamp"]
+    object_type = columns["object_type_column"]
+
+    def where(schema: pa.Schema) -> pc.Expression | None:
+        conditions = []
+        if events:
+            if activity in schema.names:
+                conditions.append(
+                    _membership(activity, predicate.activities, predicate.excluded_activities)
+                )
+            conditions.append(_time_range(schema, timestamp, predicate))
+        if objects and object_type in schema.names:
+            conditions.append(
+                _membership(object_type, predicate.object_types, predicate.excluded_object_types)
+            )
+        return _conjunction(*conditions)
+
+    return where
+
+
+def _holds(arrow_type: pa.DataType, value_type: pa.DataType) -> bool:
+    if pa.types.is_dictionary(arrow_type):
+        arrow_type = arrow_type.value_type
+    return arrow_type == value_type
+
+
+def _ids_filter(frame: pd.DataFrame, id_column: str, columns: list[str]) -> RowFilter:
+    """Filter rows whose ``columns`` all hold an id of the rows in ``frame``."""
+    ids = pa.array(pd.unique(frame[id_column].to_numpy(dtype=object)))
+
+    def where(schema: pa.Schema) -> pc.Expression | None:
+        return _conjunction(
+            *(
+                pc.is_in(pc.field(column), value_set=ids)
+                for column in columns
+                # Ids of other types (e.g. in empty tables) are left unfiltered
+                if column in schema.names and _holds(schema.field(column).type, ids.type)
+            )
+        )
+
+    return where
+
+
+def read_snapshot(
+    path: Path, memory_map: bool = False, predicate: ReadPredicate | None = None
+) -> OCEL:
+    """Read a pm4py OCEL from a snapshot directory written by :func:`write_snapshot`.
+
+    ``memory_map`` maps Arrow snapshots instead of reading them, see
+    :func:`read_snapshot_table`. With a ``predicate``, events and relations
+    are filtered by activity and timestamp, objects, relations and object
+    changes by object type, and O2O and E2E relations by the ids of the
+    loaded objects and events, all before the rows are converted to pandas.
+    """
+    manifest_path = path / SNAPSHOT_MANIFEST
+    if not manifest_path.exists():
+        raise ValueError(f"Not a complete OCEL snapshot: {path}")
+
+    manifest = orjson.loads(manifest_path.read_bytes())
+    if manifest.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version: {manifest.get('version')}")
+
+    if predicate is None:
+        tables = {
+            name: read_snapshot_table(path, name, memory_map=memory_map) for name in OCEL_TABLES
+        }
+    else:
+        columns = manifest["columns"]
+        tables = {
+            name: read_snapshot_table(
+                path,
+                name,
+                memory_map=memory_map,
+                where=_predicate_filter(
+                    predicate,
+                    columns,
+                    events=name in ("events", "relations"),
+                    objects=name in ("objects", "relations", "object_changes"),
+                ),
+            )
+            for name in ("events", "objects", "relations", "object_changes")
+        }
+        eid, oid = columns["event_id_column"], columns["object_id_column"]
+        tables["o2o"] = read_snapshot_table(
+            path,
+            "o2o",
+            memory_map=memory_map,
+            where=_ids_filter(tables["objects"], oid, [oid, f"{oid}_2"])
+            if predicate.filters_objects
+            else None,
+        )
+        tables["e2e"] = read_snapshot_table(
+            path,
+            "e2e",
+            memory_map=memory_map,
+            where=_ids_filter(tables["events"], eid, [eid, f"{eid}_2"])
+            if predicate.filters_events
+            else None,
+        )
+
+    return OCEL(
+        **tables,
+        globals=manifest["globals"],
+        parameters={
+            parameter: manifest["columns"][attribute]
+            for attribute, parameter in _COLUMN_PARAMETERS.items()
+        },
+    )
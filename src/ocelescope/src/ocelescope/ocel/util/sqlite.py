@@ -0,0 +1,633 @@
+import gc
+import os
+import re
+import sqlite3
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Any, TypeVar
+
+import numpy as np
+import pandas as pd
+from pm4py.objects.ocel.obj import OCEL
+
+from ocelescope.ocel.constants.pm4py import (
+    ACTIVITY_COL,
+    E2O_QUALIFIER,
+    EID_COL,
+    O2O_QUALIFIER,
+    OBJECT_CHANGED_FIELD,
+    OID_COL,
+    OTYPE_COL,
+    TIMESTAMP_COL,
+)
+from ocelescope.ocel.util.pushdown import TIME_MARGIN, ReadPredicate
+from ocelescope.ocel.util.view import OCEL_TABLES
+
+SQLITE_CHUNK_SIZE = 50_000
+
+# Column names of the OCEL 2.0 SQLite schema
+SQL_ID = "ocel_id"
+SQL_TYPE = "ocel_type"
+SQL_TYPE_MAP = "ocel_type_map"
+SQL_TIME = "ocel_time"
+SQL_CHANGED_FIELD = "ocel_changed_field"
+
+_ROWID = "_rowid_"
+
+_T = TypeVar("_T")
+
+_NON_ALPHANUMERIC = re.compile(r"[^0-9a-zA-Z]+")
+
+# The database is built in a temporary file, so neither a journal nor syncs are needed
+_BULK_PRAGMAS = (
+    "journal_mode = OFF",
+    "synchronous = OFF",
+    "locking_mode = EXCLUSIVE",
+    "temp_store = MEMORY",
+    "cache_size = -262144",
+)
+
+
+def quote_identifier(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def connect_readonly(path: Path) -> sqlite3.Connection:
+    """Open a read-only connection that may be handed over to another thread."""
+    return sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False)
+
+
+@contextmanager
+def bulk_write(path: Path) -> Iterator[sqlite3.Connection]:
+    """Build a new SQLite database in one transaction and move it to ``path`` when done.
+
+    The database is written to a temporary file with journaling and syncing
+    turned off, which is safe because an interrupted write never replaces
+    ``path``. The statistics for the query planner are gathered before the
+    commit (from a sample of each index), so the file is ready to be queried.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.unlink(missing_ok=True)
+
+    conn = sqlite3.connect(tmp, isolation_level=None)
+    try:
+        for pragma in _BULK_PRAGMAS:
+            conn.execute(f"PRAGMA {pragma}")
+        conn.execute("BEGIN")
+        yield conn
+        # Sampled statistics are enough for the planner and keep ANALYZE fast on large logs
+        conn.execute("PRAGMA analysis_limit = 1000")
+        conn.execute("ANALYZE")
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.close()
+        tmp.unlink(missing_ok=True)
+        raise
+    conn.close()
+    os.replace(tmp, path)
+
+
+def create_table(conn: sqlite3.Connection, table: str, columns: list[tuple[str, str]]):
+    """(Re)create a table from ``(name, declared type)`` pairs."""
+    conn.execute(f"DROP TABLE IF EXISTS {quote_identifier(table)}")
+    conn.execute(
+        f"CREATE TABLE {quote_identifier(table)} ("
+        + ", ".join(f"{quote_identifier(name)} {sql_type}" for name, sql_type in columns)
+        + ")"
+    )
+
+
+def insert_rows(conn: sqlite3.Connection, table: str, width: int, rows: Iterable[tuple]):
+    conn.executemany(
+        f"INSERT INTO {quote_identifier(table)} VALUES ({', '.join('?' * width)})", rows
+    )
+
+
+def create_indices(conn: sqlite3.Connection, table: str, columns: Iterable[str]):
+    for column in columns:
+        conn.execute(
+            f"CREATE INDEX {quote_identifier(f'{table}_{column}')} "
+            f"ON {quote_identifier(table)} ({quote_identifier(column)})"
+        )
+
+
+def type_table_names(types: Iterable[str]) -> dict[str, str]:
+    """Map OCEL types to the names of their per-type tables (without prefix).
+
+    Follows ``pm4py``'s naming: words are capitalized and joined, characters
+    other than ASCII letters and digits are dropped, and names that collide
+    (ignoring case) get a numeric suffix.
+    """
+    names: dict[str, str] = {}
+    used: set[str] = set()
+    for ocel_type in types:
+        base = _NON_ALPHANUMERIC.sub("", "".join(map(str.capitalize, ocel_type.split(" "))))
+        base = base[:100] or "Type"
+        name, suffix = base, 2
+        while name.casefold() in used:
+            name, suffix = f"{base}_{suffix}", suffix + 1
+        used.add(name.casefold())
+        names[ocel_type] = name
+    return names
+
+
+def sqlite_tables(conn: sqlite3.Connection) -> set[str]:
+    return {name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+
+
+def table_columns(conn: sqlite3.Connection, table: str) -> list[str]:
+    return list(declared_types(conn, table))
+
+
+def declared_types(conn: sqlite3.Connection, table: str) -> dict[str, str]:
+    """Return the declared (upper-cased) type of each column of a table."""
+    return {
+        row[1]: row[2].upper()
+        for row in conn.execute(f"PRAGMA table_info({quote_identifier(table)})")
+    }
+
+
+def _typed(values: tuple) -> np.ndarray:
+    """Turn the values of one column chunk into a numpy array of the narrowest fitting type.
+
+    SQLite returns every value in its storage class, so integer columns
+    without NULLs become int64, numeric columns float64 (NULL as NaN) and
+    everything else an object array.
+    """
+    types = set(map(type, values))
+    if types == {int}:
+        try:
+            return np.array(values, dtype=np.int64)
+        except OverflowError:
+            return np.array(values, dtype=object)
+    if types and types <= {int, float, type(None)}:
+        return np.array(values, dtype=np.float64)
+    return np.array(values, dtype=object)
+
+
+def _declared(
+    values: np.ndarray, declared_type: str
+) -> np.ndarray | pd.api.extensions.ExtensionArray:
+    """Restore the column types SQLite has no storage class for."""
+    if values.dtype == np.float64 and declared_type in ("INTEGER", "BOOLEAN"):
+        missing = np.isnan(values)
+        if not missing.any() or not np.array_equal(values[~missing], np.round(values[~missing])):
+            return values
+        return pd.array(values, dtype="boolean" if declared_type == "BOOLEAN" else "Int64")
+    if values.dtype == np.int64 and declared_type == "BOOLEAN":
+        return values.astype(bool)
+    if values.dtype == object and declared_type in ("TIMESTAMP", "DATETIME"):
+        try:
+            return pd.to_datetime(values, utc=True, format="ISO8601").array
+        except (ValueError, TypeError):
+            return values
+    return values
+
+
+def read_sqlite_table(
+    conn: sqlite3.Connection,
+    table: str,
+    columns: list[str] | None = None,
+    text_columns: Iterable[str] = (),
+    chunk_size: int = SQLITE_CHUNK_SIZE,
+    where: str = "",
+    parameters: Sequence[Any] = (),
+) -> pd.DataFrame:
+    """Read a SQLite table into a DataFrame through a chunked cursor.
+
+    Rows are fetched ``chunk_size`` at a time and converted into typed column
+    chunks right away, so no intermediate list of row tuples for the whole
+    table is ever built. Declared ``BOOLEAN`` and ``TIMESTAMP`` columns are
+    restored as booleans and UTC timestamps, and ``INTEGER`` columns with
+    NULLs become nullable integers.
+
+    Args:
+        conn: The connection to read from.
+        table: Name of the table.
+        columns: Columns to select (all by default).
+        text_columns: Columns that are cast to text by SQLite, e.g. identifiers
+            that may have been stored as numbers.
+        chunk_size: Number of rows per fetched chunk.
+        where: An SQL condition the selected rows have to satisfy.
+        parameters: Values of the placeholders in ``where``.
+    """
+    text_columns = set(text_columns)
+    types = declared_types(conn, table)
+    selected = columns if columns is not None else list(types)
+    projection = ", ".join(
+        f"CAST({quote_identifier(column)} AS TEXT) AS {quote_identifier(column)}"
+        if column in text_columns
+        else quote_identifier(column)
+        for column in selected
+    )
+    # Filtered reads scan the table as well, so the rows come in the same order
+    cursor = conn.execute(
+        f"SELECT {projection} FROM {quote_identifier(table)}"
+        + (f" NOT INDEXED WHERE {where}" if where else ""),
+        parameters,
+    )
+
+    chunks: dict[str, list[np.ndarray]] = {column: [] for column in selected}
+    while rows := cursor.fetchmany(chunk_size):
+        for column, values in zip(selected, zip(*rows)):
+            chunks[column].append(_typed(values))
+
+    return pd.DataFrame(
+        {
+            column: _declared(np.concatenate(parts), types.get(column, ""))
+            if parts
+            else np.empty(0, dtype=object)
+            for column, parts in chunks.items()
+        },
+        columns=selected,
+    )
+
+
+def _read_concurrently(
+    path: Path, reads: list[Callable[[sqlite3.Connection], _T]], max_workers: int | None
+) -> list[_T]:
+    """Run independent table reads on separate connections, keeping their order.
+
+    SQLite releases the GIL while stepping through a statement, so the reads
+    overlap on the database side even though the conversion into columns
+    is serialized.
+    """
+
+    def run(read: Callable[[sqlite3.Connection], _T]) -> _T:
+        with closing(connect_readonly(path)) as conn:
+            return read(conn)
+
+    # The fetched rows are short-lived tuples without reference cycles, so
+    # collecting while millions of them are allocated only costs time
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        if max_workers == 1 or len(reads) <= 1:
+            return [run(read) for read in reads]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(run, reads))
+    finally:
+        if collecting:
+            gc.enable()
+
+
+def _type_tables(conn: sqlite3.Connection, prefix: str) -> list[tuple[str, str]]:
+    """Return (type, table name) pairs of the per-type event or object tables, ordered by type."""
+    return sorted(
+        (ocel_type, f"{prefix}_{type_map}")
+        for ocel_type, type_map in conn.execute(
+            f"SELECT {SQL_TYPE}, {SQL_TYPE_MAP} FROM {prefix}_map_type"
+        )
+    )
+
+
+def _timestamps(values: pd.Series) -> pd.Series:
+    return pd.to_datetime(values, utc=True, format="ISO8601")
+
+
+def _by_time(frame: pd.DataFrame, positions: np.ndarray) -> pd.DataFrame:
+    """Order rows by timestamp, ties by their row position within their type table."""
+    order = np.lexsort((positions, frame[TIMESTAMP_COL].dt.tz_localize(None).to_numpy()))
+    return frame.iloc[order].reset_index(drop=True)
+
+
+def _positions(frames: list[pd.DataFrame]) -> np.ndarray:
+    """Return the rows' positions within their tables, popping the rowids of filtered reads."""
+    return np.concatenate(
+        [
+            frame.pop(_ROWID).to_numpy(dtype=np.int64)
+            if _ROWID in frame.columns
+            else np.arange(len(frame))
+            for frame in frames
+        ]
+        or [np.empty(0, dtype=int)]
+    )
+
+
+def _type_table_reader(
+    table: str,
+    type_column: str,
+    ocel_type: str,
+    columns: list[str],
+    id_column: str,
+    where: str = "",
+    parameters: Sequence[Any] = (),
+) -> Callable[[sqlite3.Connection], pd.DataFrame]:
+    def read(conn: sqlite3.Connection) -> pd.DataFrame:
+        # Rows skipped by a filter would shift the positions breaking timestamp ties
+        frame = read_sqlite_table(
+            conn,
+            table,
+            columns + [_ROWID] if where else columns,
+            text_columns=[SQL_ID],
+            where=where,
+            parameters=parameters,
+        )
+        return frame.rename(columns={SQL_ID: id_column, SQL_TIME: TIMESTAMP_COL}).assign(
+            **{type_column: ocel_type}
+        )
+
+    return read
+
+
+def _where(conditions: list[tuple[str, list[Any]]]) -> tuple[str, list[Any]]:
+    """Join (condition, parameters) pairs into a single conjunction."""
+    return " AND ".join(f"({sql})" for sql, _ in conditions), [
+        parameter for _, parameters in conditions for parameter in parameters
+    ]
+
+
+def _membership(
+    column: str, values: frozenset[str] | None, excluded: frozenset[str]
+) -> tuple[str, list[Any]]:
+    conditions = []
+    if values is not None:
+        conditions.append((f"{column} IN ({', '.join('?' * len(values))})", sorted(values)))
+    if excluded:
+        conditions.append(
+            (
+                f"{column} IS NULL OR {column} NOT IN ({', '.join('?' * len(excluded))})",
+                sorted(excluded),
+            )
+        )
+    return _where(conditions)
+
+
+def _time_range(predicate: ReadPredicate) -> tuple[str, list[Any]]:
+    """Condition on the time range of the predicate, widened by a margin for SQLite's precision."""
+    instant = f"julianday({SQL_TIME})"
+    conditions = []
+    if predicate.start is not None:
+        conditions.append((f"{instant} >= julianday(?)", [predicate.start - TIME_MARGIN]))
+    if predicate.end is not None:
+        conditions.append((f"{instant} <= julianday(?)", [predicate.end + TIME_MARGIN]))
+    if not conditions:
+        return "", []
+
+    sql, parameters = _where(conditions)
+    # Timestamps SQLite cannot parse are left to the filters
+    return f"{instant} IS NULL OR ({sql})", [
+        timestamp.strftime("%Y-%m-%d %H:%M:%S") for timestamp in parameters
+    ]
+
+
+def _id_in_tables(
+    column: str, tables: list[str], where: str, parameters: list[Any]
+) -> tuple[str, list[Any]]:
+    """Condition on ``column`` holding an id of any of the tables' rows satisfying ``where``."""
+    selects = [
+        f"SELECT {SQL_ID} FROM {quote_identifier(table)}" + (f" WHERE {where}" if where else "")
+        for table in tables
+    ]
+    if not selects:
+        return "0", []
+
+    # Stay below SQLite's default limit of 500 terms per compound select
+    groups = [selects[start : start + 250] for start in range(0, len(selects), 250)]
+    return " OR ".join(
+        f"{column} IN ({' UNION ALL '.join(group)})" for group in groups
+    ), parameters * len(selects)
+
+
+def _concat(frames: list[pd.DataFrame], columns: list[str]) -> pd.DataFrame:
+    frames = [frame for frame in frames if len(frame.columns) > 0]
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+
+
+def _known(frame: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    """Drop rows with missing or empty identifiers."""
+    valid = np.ones(len(frame), dtype=bool)
+    for column in columns:
+        valid &= (frame[column].fillna("") != "").to_numpy()
+    return frame if valid.all() else frame[valid].reset_index(drop=True)
+
+
+def read_ocel_sqlite(
+    path: Path,
+    tables: Iterable[str] | None = None,
+    predicate: ReadPredicate | None = None,
+    chunk_size: int = SQLITE_CHUNK_SIZE,
+    max_workers: int | None = None,
+) -> OCEL:
+    """Read an OCEL 2.0 SQLite log.
+
+    The per-type event and object tables as well as the relation tables are
+    independent, so they are read concurrently on separate read-only
+    connections, each streaming its rows through a chunked cursor into typed
+    columns. Only the columns a requested table needs are selected.
+
+    The tables follow the layout of ``pm4py``'s SQLite import: events and
+    relations are ordered by timestamp, object rows without a changed field
+    are the objects (the first row per object if there are none) and all
+    other rows are object changes.
+
+    With a ``predicate``, the tables of skipped activities and object types
+    are never read, time ranges are checked by SQLite, and only relations
+    between loaded events and objects are selected.
+
+    Args:
+        path: Path to the SQLite file.
+        tables: The OCEL tables to load (all by default). The others are
+            returned empty, e.g. ``object_changes`` can be skipped on logs
+            with a long attribute history.
+        predicate: Conditions on the events and objects to load (all by default).
+        chunk_size: Number of rows fetched per cursor chunk.
+        max_workers: Maximum number of concurrent reads (``ThreadPoolExecutor``'s
+            default if None, 1 reads sequentially).
+    """
+    selected = set(OCEL_TABLES if tables is None else tables)
+    if unknown := selected - set(OCEL_TABLES):
+        raise ValueError(f"Unknown OCEL tables: {', '.join(sorted(unknown))}")
+
+    predicate = predicate or ReadPredicate()
+    load_events = bool(selected & {"events", "relations"})
+    load_objects = bool(selected & {"objects", "object_changes"})
+
+    with closing(connect_readonly(path)) as conn:
+        existing = sqlite_tables(conn)
+        event_tables = [
+            (activity, table)
+            for activity, table in (_type_tables(conn, "event") if load_events else [])
+            if table in existing and predicate.keeps_activity(activity)
+        ]
+        object_tables = [
+            (object_type, table)
+            for object_type, table in (_type_tables(conn, "object") if load_objects else [])
+            if table in existing and predicate.keeps_object_type(object_type)
+        ]
+        event_columns = {
+            table: [
+                column
+                for column in table_columns(conn, table)
+                # Only ids and timestamps are needed to complete the relations
+                if "events" in selected or column in (SQL_ID, SQL_TIME)
+            ]
+            for _, table in event_tables
+        }
+        object_columns = {
+            table: [
+                column
+                for column in table_columns(conn, table)
+                if "object_changes" in selected or column != SQL_TIME
+            ]
+            for _, table in object_tables
+        }
+
+    time_where, time_parameters = _time_range(predicate)
+    object_where, object_parameters = _membership(
+        SQL_TYPE, predicate.object_types, predicate.excluded_object_types
+    )
+    # Relations are selected if both their event and object are loaded
+    event_condition = (
+        [
+            _id_in_tables(
+                "ocel_event_id", [table for _, table in event_tables], time_where, time_parameters
+            )
+        ]
+        if predicate.filters_events
+        else []
+    )
+
+    def object_condition(column: str) -> list[tuple[str, list[Any]]]:
+        if not predicate.filters_objects:
+            return []
+        return [
+            (f"{column} IN (SELECT {SQL_ID} FROM object WHERE {object_where})", object_parameters)
+        ]
+
+    relation_where, relation_parameters = _where(
+        event_condition + object_condition("ocel_object_id")
+    )
+    o2o_where, o2o_parameters = _where(
+        object_condition("ocel_source_id") + object_condition("ocel_target_id")
+    )
+
+    reads: list[Callable[[sqlite3.Connection], pd.DataFrame]] = [
+        *(
+            _type_table_reader(
+                table,
+                ACTIVITY_COL,
+                activity,
+                event_columns[table],
+                EID_COL,
+                where=time_where,
+                parameters=time_parameters,
+            )
+            for activity, table in event_tables
+        ),
+        *(
+            _type_table_reader(table, OTYPE_COL, object_type, object_columns[table], OID_COL)
+            for object_type, table in object_tables
+        ),
+    ]
+    if "relations" in selected:
+        reads.append(
+            lambda conn: read_sqlite_table(
+                conn,
+                "object",
+                [SQL_ID, SQL_TYPE],
+                text_columns=[SQL_ID],
+                where=object_where,
+                parameters=object_parameters,
+            ).rename(columns={SQL_ID: OID_COL, SQL_TYPE: OTYPE_COL})
+        )
+        reads.append(
+            lambda conn: read_sqlite_table(
+                conn,
+                "event_object",
+                ["ocel_event_id", "ocel_object_id", "ocel_qualifier"],
+                text_columns=["ocel_event_id", "ocel_object_id"],
+                where=relation_where,
+                parameters=relation_parameters,
+            ).rename(
+                columns={
+                    "ocel_event_id": EID_COL,
+                    "ocel_object_id": OID_COL,
+                    "ocel_qualifier": E2O_QUALIFIER,
+                }
+            )
+        )
+    if "o2o" in selected:
+        reads.append(
+            lambda conn: read_sqlite_table(
+                conn,
+                "object_object",
+                ["ocel_source_id", "ocel_target_id", "ocel_qualifier"],
+                text_columns=["ocel_source_id", "ocel_target_id", "ocel_qualifier"],
+                where=o2o_where,
+                parameters=o2o_parameters,
+            ).rename(
+                columns={
+                    "ocel_source_id": OID_COL,
+                    "ocel_target_id": f"{OID_COL}_2",
+                    "ocel_qualifier": O2O_QUALIFIER,
+                }
+            )
+        )
+
+    frames = iter(_read_concurrently(path, reads, max_workers))
+    event_frames = [next(frames) for _ in event_tables]
+    object_frames = [next(frames) for _ in object_tables]
+
+    event_positions = _positions(event_frames)
+    events = _concat(event_frames, [EID_COL, ACTIVITY_COL, TIMESTAMP_COL])
+    events[TIMESTAMP_COL] = _timestamps(events[TIMESTAMP_COL])
+    events = _known(_by_time(events, event_positions), [EID_COL])
+
+    ocel_tables: dict[str, pd.DataFrame] = {}
+    if "events" in selected:
+        ocel_tables["events"] = events
+
+    if load_objects:
+        rows = _concat(object_frames, [OID_COL, OTYPE_COL])
+        positions = _positions(object_frames)
+        known = (rows[OID_COL].fillna("") != "").to_numpy()
+        rows, positions = rows[known].reset_index(drop=True), positions[known]
+        if SQL_CHANGED_FIELD in rows.columns:
+            initial = rows[SQL_CHANGED_FIELD].isna().to_numpy()
+            if not initial.any():
+                initial = ~rows[OID_COL].duplicated().to_numpy()
+            rows = rows.rename(columns={SQL_CHANGED_FIELD: OBJECT_CHANGED_FIELD})
+        else:
+            initial = np.ones(len(rows), dtype=bool)
+
+        if "objects" in selected:
+            ocel_tables["objects"] = (
+                rows[initial]
+                .drop(columns=[OBJECT_CHANGED_FIELD, TIMESTAMP_COL], errors="ignore")
+                .reset_index(drop=True)
+            )
+        if "object_changes" in selected and not initial.all():
+            changes = rows[~initial].reset_index(drop=True)
+            changes[TIMESTAMP_COL] = _timestamps(changes[TIMESTAMP_COL])
+            ocel_tables["object_changes"] = _by_time(changes, positions[~initial])
+
+    if "relations" in selected:
+        object_types, relations = next(frames), _known(next(frames), [EID_COL, OID_COL])
+        event_rows = events.drop_duplicates(EID_COL).set_index(EID_COL)
+        object_types = object_types.drop_duplicates(OID_COL).set_index(OID_COL)[OTYPE_COL]
+        relations = pd.DataFrame(
+            {
+                EID_COL: relations[EID_COL],
+                OID_COL: relations[OID_COL],
+                E2O_QUALIFIER: relations[E2O_QUALIFIER].fillna(""),
+                ACTIVITY_COL: event_rows[ACTIVITY_COL].reindex(relations[EID_COL]).array,
+                TIMESTAMP_COL: event_rows[TIMESTAMP_COL].reindex(relations[EID_COL]).array,
+                OTYPE_COL: object_types.reindex(relations[OID_COL]).array,
+            }
+        )
+        ocel_tables["relations"] = relations.sort_values(TIMESTAMP_COL, kind="stable").reset_index(
+            drop=True
+        )
+
+    if "o2o" in selected:
+        o2o = _known(next(frames), [OID_COL, f"{OID_COL}_2"])
+        if len(o2o) > 0:
+            ocel_tables["o2o"] = o2o.assign(**{O2O_QUALIFIER: o2o[O2O_QUALIFIER].fillna("")})
+
+    return OCEL(**ocel_tables)
@@ -0,0 +1,338 @@
+import codecs
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import numpy as np
+import pandas as pd
+from pm4py.objects.ocel.obj import OCEL
+
+from ocelescope.ocel.constants.pm4py import (
+    ACTIVITY_COL,
+    E2O_QUALIFIER,
+    EID_COL,
+    O2O_QUALIFIER,
+    OBJECT_CHANGED_FIELD,
+    OID_COL,
+    OTYPE_COL,
+    TIMESTAMP_COL,
+)
+from ocelescope.ocel.util.pushdown import ReadPredicate
+
+DEFAULT_CHUNK_SIZE = 50_000
+_READ_SIZE = 1 << 20
+
+
+class JSONStream:
+    """Incremental reader over a JSON document.
+
+    Only the container structure the caller walks through (``members`` and
+    ``items``) is tokenized here; every other value is decoded as a whole by
+    the C accelerated ``json`` scanner. The text buffer only holds the value
+    currently being decoded, so memory stays bounded by the largest single
+    value instead of the file size.
+    """
+
+    def __init__(self, file: BinaryIO, read_size: int = _READ_SIZE):
+        self.file = file
+        self.read_size = read_size
+        self.decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self.scanner = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, size: int | None = None) -> bool:
+        if self.eof:
+            return False
+
+        data = self.file.read(size or self.read_size)
+        self.eof = not data
+        # Drop the consumed prefix, so the buffer never grows with the file
+        self.buffer = self.buffer[self.pos :] + self.decoder.decode(data, final=self.eof)
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character ("" at the end of the document)."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\n\r":
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self._fill():
+                return self.buffer[self.pos : self.pos + 1]
+
+    def expect(self, token: str):
+        if self.peek() != token:
+            raise ValueError(f"Expected {token!r} at offset {self.pos} of the JSON stream")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        size = self.read_size
+        while True:
+            try:
+                value, end = self.scanner.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # Grow the reads geometrically, so large values are not re-scanned too often
+                size *= 2
+                if self._fill(size):
+                    continue
+                raise
+            # A number may continue beyond the buffered text
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def _separated(self, close: str) -> Iterator[None]:
+        if self.peek() == close:
+            self.pos += 1
+            return
+        while True:
+            yield
+            match self.peek():
+                case ",":
+                    self.pos += 1
+                case token if token == close:
+                    self.pos += 1
+                    return
+                case token:
+                    raise ValueError(
+                        f"Unexpected {token!r} at offset {self.pos} of the JSON stream"
+                    )
+
+    def items(self) -> Iterator[Any]:
+        """Decode the elements of the next JSON array one at a time."""
+        self.expect("[")
+        for _ in self._separated("]"):
+            yield self.value()
+
+    def members(self) -> Iterator[str]:
+        """Iterate the keys of the next JSON object.
+
+        The caller has to consume each member's value (e.g. via ``value`` or
+        ``items``) before advancing the iterator.
+        """
+        self.expect("{")
+        for _ in self._separated("}"):
+            key = self.value()
+            self.expect(":")
+            yield key
+
+
+class _TableBuilder:
+    """Accumulate records into columnar DataFrame chunks.
+
+    Fixed columns are collected as lists, sparse attribute columns as
+    ``(rows, values)`` pairs. Every ``chunk_size`` rows, the lists are turned
+    into typed pandas columns and released.
+    """
+
+    def __init__(self, columns: list[str], chunk_size: int):
+        self.columns = columns
+        self.chunk_size = chunk_size
+        self.chunks: list[pd.DataFrame] = []
+        self._reset()
+
+    def _reset(self):
+        self.rows = 0
+        self.values: dict[str, list] = {column: [] for column in self.columns}
+        self.attributes: dict[str, tuple[list[int], list]] = {}
+
+    def add(self, *values: Any, attributes: dict[str, Any] | None = None):
+        for column, value in zip(self.columns, values):
+            self.values[column].append(value)
+        for name, value in (attributes or {}).items():
+            rows, attribute_values = self.attributes.setdefault(name, ([], []))
+            rows.append(self.rows)
+            attribute_values.append(value)
+
+        self.rows += 1
+        if self.rows >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if self.rows == 0:
+            return
+
+        attributes = {}
+        for name, (rows, values) in self.attributes.items():
+            column = np.full(self.rows, None, dtype=object)
+            column[rows] = values
+            attributes[name] = pd.Series(column).convert_dtypes()
+
+        self.chunks.append(
+            pd.DataFrame(
+                {
+                    **attributes,
+                    **{
+                        column: pd.array(values, dtype="string")
+                        for column, values in self.values.items()
+                    },
+                }
+            )
+        )
+        self._reset()
+
+    def frame(self) -> pd.DataFrame:
+        self.flush()
+        if not self.chunks:
+            return pd.DataFrame({column: pd.array([], dtype="string") for column in self.columns})
+
+        frame = (
+            pd.concat(self.chunks, ignore_index=True) if len(self.chunks) > 1 else self.chunks[0]
+        )
+        self.chunks = []
+
+        attributes = [column for column in frame.columns if column not in self.columns]
+        return frame[attributes + self.columns]
+
+
+def _timestamps(values: pd.Series) -> pd.Series:
+    """Parse ISO 8601 timestamps into naive UTC nanosecond timestamps."""
+    return (
+        pd.to_datetime(values.astype(object), utc=True, format="ISO8601")
+        .dt.tz_localize(None)
+        .astype("datetime64[ns]")
+    )
+
+
+def read_ocel_json_streaming(
+    path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE, predicate: ReadPredicate | None = None
+) -> tuple[OCEL, dict[str, Any] | None]:
+    """Read an OCEL 2.0 JSON file in a single streaming pass.
+
+    Events, objects and their relationships are decoded one record at a time
+    and collected into columnar chunks of ``chunk_size`` rows, so the raw text
+    and the parsed JSON document are never held in memory as a whole.
+
+    The tables follow the layout of the regular JSON import: events and
+    relations are ordered by timestamp, the first value of each object
+    attribute goes to the object table and all further values become object
+    changes.
+
+    With a ``predicate``, events and objects it rejects are skipped as soon
+    as they are decoded, together with their attributes and relationships.
+    Relationships to skipped objects are dropped once all objects are known.
+
+    Returns:
+        The pm4py OCEL and the raw ``quantityExtension`` member (None if the
+        file has none).
+    """
+    events = _TableBuilder([EID_COL, ACTIVITY_COL, TIMESTAMP_COL], chunk_size)
+    objects = _TableBuilder([OID_COL, OTYPE_COL], chunk_size)
+    changes = _TableBuilder([OID_COL, OTYPE_COL, OBJECT_CHANGED_FIELD, TIMESTAMP_COL], chunk_size)
+    relations = _TableBuilder([EID_COL, OID_COL, E2O_QUALIFIER], chunk_size)
+    o2o = _TableBuilder([OID_COL, f"{OID_COL}_2", O2O_QUALIFIER], chunk_size)
+    quantity_extension = None
+    predicate = predicate or ReadPredicate()
+
+    with open(path, "rb") as file:
+        stream = JSONStream(file)
+        for key in stream.members():
+            match key:
+                case "objects":
+                    for obj in stream.items():
+                        oid, otype = obj["id"], obj["type"]
+                        if not predicate.keeps_object_type(otype):
+                            continue
+                        initial = {}
+                        for attribute in obj.get("attributes") or []:
+                            name = attribute["name"]
+                            if name not in initial:
+                                initial[name] = attribute["value"]
+                            else:
+                                changes.add(
+                                    oid,
+                                    otype,
+                                    name,
+                                    attribute["time"],
+                                    attributes={name: attribute["value"]},
+                                )
+                        objects.add(oid, otype, attributes=initial)
+                        for relationship in obj.get("relationships") or []:
+                            o2o.add(oid, relationship["objectId"], relationship.get("qualifier"))
+                case "events":
+                    for event in stream.items():
+                        if not (
+                            predicate.keeps_activity(event["type"])
+                            and predicate.keeps_time(event["time"])
+                        ):
+                            continue
+                        eid = event["id"]
+                        events.add(
+                            eid,
+                            event["type"],
+                            event["time"],
+                            attributes={
+                                attribute["name"]: attribute["value"]
+                                for attribute in event.get("attributes") or []
+                            },
+                        )
+                        for relationship in event.get("relationships") or []:
+                            relations.add(
+                                eid, relationship["objectId"], relationship.get("qualifier")
+                            )
+                case "quantityExtension":
+                    quantity_extension = stream.value()
+                case _:
+                    stream.value()
+
+    objects_df = objects.frame()
+    o2o_df = o2o.frame()
+    if predicate.filters_objects:
+        # Objects may be listed after the events and relationships referring to them
+        loaded = pd.Index(objects_df[OID_COL].to_numpy(dtype=object))
+        o2o_df = o2o_df[o2o_df[f"{OID_COL}_2"].isin(loaded)].reset_index(drop=True)
+
+    events_df = events.frame()
+    events_df[TIMESTAMP_COL] = _timestamps(events_df[TIMESTAMP_COL])
+    events_df = events_df.sort_values(TIMESTAMP_COL, kind="stable").reset_index(drop=True)
+
+    # Relations inherit activity and timestamp of their event and follow the event order
+    relations_df = relations.frame()
+    if predicate.filters_objects:
+        relations_df = relations_df[relations_df[OID_COL].isin(loaded)]
+    event_rows = events_df.drop_duplicates(EID_COL).set_index(EID_COL)
+    event_positions = event_rows.index.get_indexer(relations_df[EID_COL])
+    relations_df = relations_df.iloc[np.argsort(event_positions, kind="stable")]
+    object_types = objects_df.drop_duplicates(OID_COL).set_index(OID_COL)[OTYPE_COL]
+    relations_df = pd.DataFrame(
+        {
+            EID_COL: relations_df[EID_COL].to_numpy(),
+            ACTIVITY_COL: event_rows[ACTIVITY_COL].reindex(relations_df[EID_COL]).array,
+            TIMESTAMP_COL: event_rows[TIMESTAMP_COL].reindex(relations_df[EID_COL]).array,
+            OID_COL: relations_df[OID_COL].to_numpy(),
+            OTYPE_COL: object_types.reindex(relations_df[OID_COL]).array,
+            E2O_QUALIFIER: relations_df[E2O_QUALIFIER].to_numpy(),
+        }
+    ).astype({EID_COL: "string", OID_COL: "string", E2O_QUALIFIER: "string"})
+
+    changes_df = changes.frame()
+    changes_df[TIMESTAMP_COL] = _timestamps(changes_df[TIMESTAMP_COL])
+    changes_df = changes_df.sort_values(TIMESTAMP_COL, kind="stable").reset_index(drop=True)
+    object_attributes = [column for column in objects_df.columns if column not in objects.columns]
+    changes_df = changes_df.assign(
+        **{
+            column: pd.Series(None, index=changes_df.index, dtype=object)
+            for column in object_attributes
+            if column not in changes_df.columns
+        }
+    )
+    changes_df = changes_df[
+        object_attributes
+        + [column for column in changes_df.columns if column not in object_attributes]
+    ]
+
+    return (
+        OCEL(
+            events=events_df,
+            objects=objects_df,
+            relations=relations_df,
+            o2o=o2o_df,
+            object_changes=changes_df,
+        ),
+        quantity_extension,
+    )
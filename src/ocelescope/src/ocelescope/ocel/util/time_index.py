@@ -0,0 +1,187 @@
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from ocelescope.ocel.util.pushdown import utc_timestamp
+
+
+def _nanoseconds(timestamps: pd.Series) -> tuple[np.ndarray, Any]:
+    """Return timestamps as int64 nanoseconds since the epoch (UTC) and their time zone.
+
+    Naive timestamps are read as UTC; missing ones are NaT's minimum int64.
+    """
+    if not pd.api.types.is_datetime64_any_dtype(timestamps.dtype):
+        timestamps = pd.to_datetime(timestamps, utc=True)
+    values = timestamps.array.as_unit("ns")
+    return values.asi8, getattr(timestamps.dtype, "tz", None)
+
+
+@dataclass(frozen=True)
+class TimeIndex:
+    """Table rows ordered by timestamp.
+
+    ``times`` holds the sorted timestamps as int64 nanoseconds since the
+    epoch (UTC, naive timestamps read as UTC) and ``order`` the matching row
+    positions, with ties in table order. Rows without a timestamp are left
+    out. Time ranges then map to a slice of ``order`` via ``searchsorted``.
+    """
+
+    order: np.ndarray
+    times: np.ndarray
+    size: int
+    tz: Any = None
+
+    @staticmethod
+    def from_timestamps(timestamps: pd.Series) -> "TimeIndex":
+        """Build the index over a timestamp column."""
+        values, tz = _nanoseconds(timestamps)
+        order = np.argsort(values, kind="stable")
+        # NaT is the smallest int64, so missing timestamps sort first
+        order = order[np.searchsorted(values[order], np.iinfo(np.int64).min, side="right") :]
+        return TimeIndex(order=order, times=values[order], size=len(values), tz=tz)
+
+    def appended(self, timestamps: pd.Series) -> "TimeIndex":
+        """Add rows appended to the table, given their timestamps (of the same type).
+
+        Appended rows follow existing rows with equal timestamps.
+        """
+        added = TimeIndex.from_timestamps(timestamps)
+        positions = np.searchsorted(self.times, added.times, side="right")
+        return TimeIndex(
+            order=np.insert(self.order, positions, added.order + self.size),
+            times=np.insert(self.times, positions, added.times),
+            size=self.size + added.size,
+            tz=self.tz,
+        )
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def timestamp(self, nanoseconds: int) -> pd.Timestamp:
+        """Convert nanoseconds since the epoch into a timestamp of the indexed column's type."""
+        timestamp = pd.Timestamp(nanoseconds, tz="UTC")
+        return timestamp.tz_localize(None) if self.tz is None else timestamp.tz_convert(self.tz)
+
+    @property
+    def start(self) -> pd.Timestamp | None:
+        """The earliest timestamp (None if no row has one)."""
+        return self.timestamp(int(self.times[0])) if len(self) > 0 else None
+
+    @property
+    def end(self) -> pd.Timestamp | None:
+        """The latest timestamp (None if no row has one)."""
+        return self.timestamp(int(self.times[-1])) if len(self) > 0 else None
+
+    def span(self, start: Any = None, end: Any = None) -> slice:
+        """Return the slice of ``order`` with timestamps within ``[start, end]``.
+
+        Bounds may be anything ``pd.Timestamp`` accepts; naive ones are read
+        as UTC. A missing bound leaves that side open.
+        """
+        low = (
+            0
+            if start is None
+            else int(np.searchsorted(self.times, utc_timestamp(start).value, side="left"))
+        )
+        high = (
+            len(self)
+            if end is None
+            else int(np.searchsorted(self.times, utc_timestamp(end).value, side="right"))
+        )
+        return slice(low, max(low, high))
+
+    def mask(self, start: Any = None, end: Any = None) -> np.ndarray:
+        """Return a boolean mask over the table rows with timestamps within ``[start, end]``."""
+        mask = np.zeros(self.size, dtype=bool)
+        mask[self.order[self.span(start, end)]] = True
+        return mask
+
+
+# Upper bound on the cells of a cube's block counts, so the cube stays small
+# no matter how many groups there are
+_MAX_CELLS = 1 << 20
+_MAX_BLOCKS = 4096
+
+
+@dataclass(frozen=True)
+class TimeCube:
+    """Counts of time-ordered rows per group, rolled up for any time window.
+
+    The rows (``groups`` codes, ordered by ``times``) are split into blocks
+    of ``step`` rows, and ``prefix[b]`` holds the per-group counts of all
+    blocks before block ``b``. The counts up to any time are then the prefix
+    row of the block the time falls into plus a bincount over the rest of
+    that one block, so a histogram costs one binary search per bin edge and
+    at most ``step`` rows per edge, however coarse or fine its windows are.
+    """
+
+    times: np.ndarray
+    groups: np.ndarray
+    labels: pd.Index
+    step: int
+    prefix: np.ndarray
+
+    @staticmethod
+    def from_groups(times: np.ndarray, groups: np.ndarray, labels: pd.Index) -> "TimeCube":
+        """Build the cube over rows in time order.
+
+        Args:
+            times: Sorted timestamps as int64 nanoseconds since the epoch.
+            groups: Group code per row (-1 leaves a row uncounted).
+            labels: The group labels, indexed by code.
+        """
+        size = max(len(labels), 1)
+        blocks = max(1, min(_MAX_BLOCKS, _MAX_CELLS // size, len(times)))
+        step = max(1, -(-len(times) // blocks))
+        blocks = -(-len(times) // step)
+
+        counted = groups >= 0
+        keys = np.flatnonzero(counted) // step * size + groups[counted]
+        prefix = np.zeros((blocks + 1, size), dtype=np.int64)
+        np.cumsum(
+            np.bincount(keys, minlength=blocks * size).reshape(blocks, size),
+            axis=0,
+            out=prefix[1:],
+        )
+        return TimeCube(times=times, groups=groups, labels=labels, step=step, prefix=prefix)
+
+    def _counts_before(self, positions: np.ndarray) -> np.ndarray:
+        """Return the per-group counts of the rows before each position."""
+        size = self.prefix.shape[1]
+        blocks = positions // self.step
+        starts = blocks * self.step
+        lengths = positions - starts
+
+        # Rows of each position's partial block, concatenated
+        rows = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(
+            int(lengths.sum()), dtype=np.int64
+        )
+        owners = np.repeat(np.arange(len(positions)), lengths)
+        partial = self.groups[rows]
+        counted = partial >= 0
+        rest = np.bincount(
+            owners[counted] * size + partial[counted], minlength=len(positions) * size
+        ).reshape(len(positions), size)
+        return self.prefix[blocks] + rest
+
+    def counts(self, edges: np.ndarray) -> np.ndarray:
+        """Count the rows per time window and group.
+
+        Windows are right-closed like ``pd.cut`` with ``include_lowest``:
+        window ``i`` holds the times in ``(edges[i], edges[i + 1]]``, the
+        first one also ``edges[0]``.
+
+        Args:
+            edges: Increasing window edges as int64 nanoseconds since the epoch.
+
+        Returns:
+            A ``(windows, groups)`` array of row counts.
+        """
+        if len(edges) < 2:
+            return np.zeros((0, len(self.labels)), dtype=np.int64)
+
+        positions = np.searchsorted(self.times, edges, side="right")
+        positions[0] = np.searchsorted(self.times, edges[0], side="left")
+        return np.diff(self._counts_before(positions), axis=0)[:, : len(self.labels)]
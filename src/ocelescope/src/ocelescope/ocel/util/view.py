@@ -0,0 +1,286 @@
+from copy import deepcopy
+from dataclasses import dataclass, replace
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pm4py.objects.ocel.obj import OCEL
+
+from ocelescope.ocel.util.encoding import codes
+
+OCEL_TABLES = ("events", "objects", "relations", "o2o", "object_changes", "e2e")
+
+
+@dataclass(frozen=True)
+class RowMasks:
+    """Boolean row masks selecting a sub-log from every table of a parent OCEL."""
+
+    events: np.ndarray
+    objects: np.ndarray
+    relations: np.ndarray
+    o2o: np.ndarray
+    object_changes: np.ndarray
+    e2e: np.ndarray
+
+    @staticmethod
+    def full(ocel: OCEL) -> "RowMasks":
+        return RowMasks(
+            **{table: np.ones(len(getattr(ocel, table)), dtype=bool) for table in OCEL_TABLES}
+        )
+
+    def cleared(self, *tables: str) -> "RowMasks":
+        """Return a copy in which the given tables (all if none are given) select no rows."""
+        return replace(
+            self,
+            **{table: np.zeros_like(getattr(self, table)) for table in tables or OCEL_TABLES},
+        )
+
+
+def _copy_on_write() -> bool:
+    """Whether pandas defers the copies of shallow DataFrame copies until they are modified."""
+    return int(pd.__version__.split(".")[0]) >= 3 or pd.get_option("mode.copy_on_write") is True
+
+
+class _DerivedTable:
+    """Non-data descriptor deriving a table from the parent log on first access.
+
+    The derived table is stored on the instance, so later reads and assignments
+    behave like a plain attribute of a pm4py OCEL and never reach the parent.
+    """
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, instance: "_DerivedOCEL | None", owner: type | None = None):
+        if instance is None:
+            return self
+        table = instance._derive(self.name, getattr(instance.parent, self.name))
+        instance.__dict__[self.name] = table
+        return table
+
+
+class _DerivedOCEL(OCEL):
+    events = _DerivedTable()
+    objects = _DerivedTable()
+    relations = _DerivedTable()
+    o2o = _DerivedTable()
+    object_changes = _DerivedTable()
+    e2e = _DerivedTable()
+
+    def __init__(self, parent: OCEL):
+        self.parent = parent
+
+        self.event_id_column = parent.event_id_column
+        self.object_id_column = parent.object_id_column
+        self.object_type_column = parent.object_type_column
+        self.event_activity = parent.event_activity
+        self.event_timestamp = parent.event_timestamp
+        self.qualifier = parent.qualifier
+        self.changed_field = parent.changed_field
+        self.globals = parent.globals
+        self.parameters = parent.parameters
+
+    def _derive(self, table: str, frame: pd.DataFrame) -> pd.DataFrame:
+        raise NotImplementedError
+
+    def materialize(self) -> OCEL:
+        """Return a standalone pm4py OCEL that no longer references the parent log."""
+        return OCEL(
+            **{table: getattr(self, table) for table in OCEL_TABLES},
+            globals=self.globals,
+            parameters=self.parameters,
+        )
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> OCEL:
+        # Copying the parent could copy far more than this log, only its own rows are copied
+        return deepcopy(self.materialize(), memo)
+
+
+class MaskedOCEL(_DerivedOCEL):
+    """A pm4py OCEL that is a row-masked view of a parent log.
+
+    Filtering only produces new masks, no table is copied. Each table is
+    sliced from the parent the first time it is read, so tables a caller never
+    touches are never materialized. Views of views always point to the root
+    log, with masks composed against its tables.
+    """
+
+    def __init__(self, parent: OCEL, masks: RowMasks):
+        super().__init__(parent)
+        self.masks = masks
+
+    def _derive(self, table: str, frame: pd.DataFrame) -> pd.DataFrame:
+        return frame[getattr(self.masks, table)]
+
+
+class CopyOnWriteOCEL(_DerivedOCEL):
+    """A pm4py OCEL sharing the tables of a parent log until they are modified.
+
+    Each table is handed out as a shallow copy the first time it is read.
+    pandas' copy-on-write then duplicates a column only when it is written to,
+    and replacing a whole table only rebinds it on this log. Without
+    copy-on-write (pandas < 3 with the option disabled), a table is copied on
+    its first access instead, so the parent is never modified either way.
+    """
+
+    def _derive(self, table: str, frame: pd.DataFrame) -> pd.DataFrame:
+        return frame.copy(deep=not _copy_on_write())
+
+
+def _lookup_table(keys: np.ndarray, mask: np.ndarray, size: int) -> np.ndarray:
+    """Return a boolean table over ``size`` dictionary codes marking the codes of masked rows.
+
+    The extra trailing slot stays False, so indexing with code -1 (unknown) yields False.
+    """
+    table = np.zeros(size + 1, dtype=bool)
+    table[keys[mask]] = True
+    table[-1] = False
+    return table
+
+
+def _codes_in(column: pd.Series, dtype: pd.CategoricalDtype) -> np.ndarray:
+    if column.dtype is dtype or column.dtype == dtype:
+        return codes(column)
+    return dtype.categories.get_indexer(pd.Index(column.to_numpy(dtype=object)))
+
+
+def _lift(base: np.ndarray, index: pd.Index, values: pd.Series) -> np.ndarray:
+    """Lift a mask over the rows selected by ``base`` to a mask over all parent rows."""
+    if not values.index.equals(index):
+        values = values.reindex(index, fill_value=False)
+
+    mask = np.zeros_like(base)
+    mask[base] = values.to_numpy(dtype=bool)
+    return mask
+
+
+def propagate_event_filtering(ocel: OCEL, masks: RowMasks, selected: np.ndarray) -> RowMasks:
+    """Mask-based equivalent of ``pm4py``'s event filtering and its propagation.
+
+    Args:
+        ocel: The (encoded) root log the masks refer to.
+        masks: The current row masks.
+        selected: Boolean lookup table over the event id codes to keep.
+    """
+    eid, oid = ocel.event_id_column, ocel.object_id_column
+    event_ids = ocel.events[eid].dtype
+    object_ids = ocel.objects[oid].dtype
+
+    event_codes = codes(ocel.events[eid])
+    events = masks.events & selected[event_codes]
+    selected_events = _lookup_table(event_codes, events, len(event_ids.categories))
+    if not selected_events.any():
+        return masks.cleared()
+
+    relations = masks.relations & selected_events[codes(ocel.relations[eid])]
+    selected_objects = _lookup_table(
+        codes(ocel.relations[oid]), relations, len(object_ids.categories)
+    )
+
+    e2e = (
+        masks.e2e
+        & selected_events[_codes_in(ocel.e2e[eid], event_ids)]
+        & selected_events[_codes_in(ocel.e2e[f"{eid}_2"], event_ids)]
+    )
+    masks = replace(masks, events=events, relations=relations, e2e=e2e)
+
+    if not selected_objects.any():
+        return masks.cleared("objects", "o2o", "object_changes")
+
+    return replace(
+        masks,
+        objects=masks.objects & selected_objects[codes(ocel.objects[oid])],
+        object_changes=masks.object_changes
+        & selected_objects[_codes_in(ocel.object_changes[oid], object_ids)],
+        o2o=masks.o2o
+        & selected_objects[codes(ocel.o2o[oid])]
+        & selected_objects[codes(ocel.o2o[f"{oid}_2"])],
+    )
+
+
+def propagate_object_filtering(ocel: OCEL, masks: RowMasks, selected: np.ndarray) -> RowMasks:
+    """Mask-based equivalent of ``pm4py``'s object filtering and its propagation.
+
+    Args:
+        ocel: The (encoded) root log the masks refer to.
+        masks: The current row masks.
+        selected: Boolean lookup table over the object id codes to keep.
+    """
+    eid, oid = ocel.event_id_column, ocel.object_id_column
+    event_ids = ocel.events[eid].dtype
+    object_ids = ocel.objects[oid].dtype
+
+    object_codes = codes(ocel.objects[oid])
+    objects = masks.objects & selected[object_codes]
+    selected_objects = _lookup_table(object_codes, objects, len(object_ids.categories))
+    if not selected_objects.any():
+        return masks.cleared()
+
+    relations = masks.relations & selected_objects[codes(ocel.relations[oid])]
+    selected_events = _lookup_table(
+        codes(ocel.relations[eid]), relations, len(event_ids.categories)
+    )
+
+    masks = replace(
+        masks,
+        objects=objects,
+        relations=relations,
+        o2o=masks.o2o
+        & selected_objects[codes(ocel.o2o[oid])]
+        & selected_objects[codes(ocel.o2o[f"{oid}_2"])],
+        object_changes=masks.object_changes
+        & selected_objects[_codes_in(ocel.object_changes[oid], object_ids)],
+    )
+
+    if not selected_events.any():
+        return masks.cleared("events", "e2e")
+
+    return replace(
+        masks,
+        events=masks.events & selected_events[codes(ocel.events[eid])],
+        e2e=masks.e2e
+        & selected_events[_codes_in(ocel.e2e[eid], event_ids)]
+        & selected_events[_codes_in(ocel.e2e[f"{eid}_2"], event_ids)],
+    )
+
+
+def mask_ocel(
+    ocel: OCEL, events: pd.Series | None = None, objects: pd.Series | None = None
+) -> MaskedOCEL:
+    """Filter an OCEL by event and object masks without copying any table.
+
+    Produces the same sub-log as ``pm4py.filter_ocel_events`` followed by
+    ``pm4py.filter_ocel_objects`` on the masked event and object ids, but as a
+    :class:`MaskedOCEL` over the root log.
+
+    Args:
+        ocel: An encoded pm4py OCEL or a view of one.
+        events: Boolean mask over the rows of ``ocel.events`` (None keeps all events).
+        objects: Boolean mask over the rows of ``ocel.objects`` (None keeps all objects).
+    """
+    root, base = (
+        (ocel.parent, ocel.masks) if isinstance(ocel, MaskedOCEL) else (ocel, RowMasks.full(ocel))
+    )
+    eid, oid = root.event_id_column, root.object_id_column
+    masks = base
+
+    if events is not None:
+        event_codes = codes(root.events[eid])
+        selected = _lift(base.events, root.events.index[base.events], events)
+        masks = propagate_event_filtering(
+            root,
+            masks,
+            _lookup_table(event_codes, selected, len(root.events[eid].cat.categories)),
+        )
+
+    if objects is not None:
+        # The object ids are taken from the objects before the event filtering
+        object_codes = codes(root.objects[oid])
+        selected = _lift(base.objects, root.objects.index[base.objects], objects)
+        masks = propagate_object_filtering(
+            root,
+            masks,
+            _lookup_table(object_codes, selected, len(root.objects[oid].cat.categories)),
+        )
+
+    return MaskedOCEL(root, masks)
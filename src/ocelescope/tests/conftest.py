@@ -0,0 +1,63 @@
+import pandas as pd
+import pytest
+from pm4py.objects.ocel.obj import OCEL as PM4PYOCEL
+
+from ocelescope import OCEL
+
+
+def small_tables() -> dict[str, pd.DataFrame]:
+    """The tables of a small log with two orders, an item, and four events."""
+    events = pd.DataFrame(
+        {
+            "ocel:eid": ["e1", "e2", "e3", "e4"],
+            "ocel:activity": ["create", "pack", "ship", "pack"],
+            "ocel:timestamp": pd.to_datetime(
+                ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"], utc=True
+            ),
+        }
+    )
+    objects = pd.DataFrame(
+        {
+            "ocel:oid": ["o1", "o2", "i1"],
+            "ocel:type": ["order", "order", "item"],
+            "weight": [None, None, 3.0],
+        }
+    )
+    relations = (
+        pd.DataFrame(
+            {
+                "ocel:eid": ["e1", "e2", "e3", "e4", "e2"],
+                "ocel:oid": ["o1", "o1", "o1", "o2", "i1"],
+                "ocel:qualifier": ["new", None, None, None, "packed"],
+            }
+        )
+        .merge(events, on="ocel:eid")
+        .merge(objects[["ocel:oid", "ocel:type"]], on="ocel:oid")
+    )
+    o2o = pd.DataFrame({"ocel:oid": ["o1"], "ocel:oid_2": ["i1"], "ocel:qualifier": ["contains"]})
+    object_changes = pd.DataFrame(
+        {
+            "ocel:oid": ["i1"],
+            "ocel:type": ["item"],
+            "ocel:timestamp": pd.to_datetime(["2024-01-03"], utc=True),
+            "ocel:field": ["weight"],
+            "weight": [2.5],
+        }
+    )
+    return {
+        "events": events,
+        "objects": objects,
+        "relations": relations,
+        "o2o": o2o,
+        "object_changes": object_changes,
+    }
+
+
+@pytest.fixture
+def tables() -> dict[str, pd.DataFrame]:
+    return small_tables()
+
+
+@pytest.fixture
+def ocel(tables: dict[str, pd.DataFrame]) -> OCEL:
+    return OCEL(PM4PYOCEL(**tables))
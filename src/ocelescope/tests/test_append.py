@@ -0,0 +1,88 @@
+import pandas as pd
+import pytest
+from pm4py.objects.ocel.obj import OCEL as PM4PYOCEL
+
+from ocelescope import OCEL
+from ocelescope.ocel.util.append import APPENDABLE_TABLES
+
+
+def _dtypes(ocel: OCEL) -> dict[str, dict[str, str]]:
+    # Encoded columns stay categorical, with dictionaries grown by the new values
+    return {
+        name: {
+            column: "category" if isinstance(dtype, pd.CategoricalDtype) else str(dtype)
+            for column, dtype in getattr(ocel.ocel, name).dtypes.items()
+        }
+        for name in APPENDABLE_TABLES
+    }
+
+
+def test_append_keeps_the_dtypes_of_every_table(tables: dict[str, pd.DataFrame]):
+    # Relations with naive timestamps, while the events' are UTC
+    tables["relations"]["ocel:timestamp"] = tables["relations"]["ocel:timestamp"].dt.tz_localize(
+        None
+    )
+    ocel = OCEL(PM4PYOCEL(**tables))
+    before = _dtypes(ocel)
+
+    ocel.append(
+        events=pd.DataFrame(
+            {
+                "ocel:eid": ["e5"],
+                "ocel:activity": ["ship"],
+                "ocel:timestamp": ["2024-01-05T12:00:00+01:00"],
+            }
+        ),
+        objects=pd.DataFrame({"ocel:oid": ["o3"], "ocel:type": ["order"], "weight": [1.5]}),
+        relations=pd.DataFrame({"ocel:eid": ["e5", "e5"], "ocel:oid": ["o3", "i1"]}),
+        o2o=pd.DataFrame({"ocel:oid": ["o3"], "ocel:oid_2": ["i1"]}),
+        object_changes=pd.DataFrame(
+            {
+                "ocel:oid": ["i1"],
+                "ocel:timestamp": ["2024-01-05"],
+                "ocel:field": ["weight"],
+                "weight": [4.0],
+            }
+        ),
+    )
+
+    assert _dtypes(ocel) == before
+    relations = ocel.ocel.relations
+    assert relations["ocel:timestamp"].iloc[-2:].tolist() == [pd.Timestamp("2024-01-05 11:00")] * 2
+
+
+def _event(eid: str) -> dict:
+    return {"ocel:eid": eid, "ocel:activity": "pack", "ocel:timestamp": "2024-01-05"}
+
+
+@pytest.mark.parametrize(
+    "batches",
+    [
+        {"events": pd.DataFrame([_event("e2")])},
+        {"events": pd.DataFrame([_event("e5"), _event("e5")])},
+        {"objects": pd.DataFrame({"ocel:oid": ["i1"], "ocel:type": ["item"]})},
+        {"relations": pd.DataFrame({"ocel:eid": ["e1"], "ocel:oid": ["o9"]})},
+        {
+            "events": pd.DataFrame([_event("e5")]),
+            "relations": pd.DataFrame({"ocel:eid": ["e5", "e6"], "ocel:oid": ["o1", "o1"]}),
+        },
+        {"o2o": pd.DataFrame({"ocel:oid": ["o2"], "ocel:oid_2": ["o9"]})},
+    ],
+    ids=[
+        "existing event",
+        "repeated event",
+        "existing object",
+        "unknown object",
+        "unknown event",
+        "unknown o2o target",
+    ],
+)
+def test_append_rejects_inconsistent_batches(ocel: OCEL, batches: dict[str, pd.DataFrame]):
+    tables = {name: getattr(ocel.ocel, name) for name in APPENDABLE_TABLES}
+    start = ocel.events.time_index.start
+
+    with pytest.raises(ValueError):
+        ocel.append(**batches)
+
+    assert all(getattr(ocel.ocel, name) is table for name, table in tables.items())
+    assert ocel.events.time_index.start == start
@@ -0,0 +1,26 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ocelescope import OCEL
+from ocelescope.ocel.filter import Bitset, FilterResult
+
+
+def test_and_merge_aligns_a_partial_series_with_a_bitset(ocel: OCEL):
+    events = ocel.events.df
+    # Covers the last two events only, in reverse order
+    partial = pd.Series([True, False], index=events.index[[3, 2]])
+    bits = FilterResult(events=Bitset.from_mask(np.array([True, True, False, True])))
+
+    for merged in (
+        bits.and_merge(FilterResult(events=partial), ocel),
+        FilterResult(events=partial).and_merge(bits, ocel),
+        bits.and_merge(FilterResult(events=partial)),
+    ):
+        assert merged.events.to_mask().tolist() == [False, False, False, True]
+
+
+def test_and_merge_rejects_bitsets_of_another_size():
+    bits = FilterResult(objects=Bitset.full(3))
+    with pytest.raises(ValueError):
+        bits.and_merge(FilterResult(objects=Bitset.full(4)))
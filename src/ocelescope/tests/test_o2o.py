@@ -0,0 +1,22 @@
+import pandas as pd
+from pm4py.objects.ocel.obj import OCEL as PM4PYOCEL
+
+from ocelescope import OCEL
+
+
+def test_unknown_qualifier_does_not_follow_relations_without_one(
+    tables: dict[str, pd.DataFrame],
+):
+    tables["o2o"] = pd.DataFrame(
+        {
+            "ocel:oid": ["o1", "o2"],
+            "ocel:oid_2": ["i1", "o1"],
+            "ocel:qualifier": ["contains", None],
+        }
+    )
+    o2o = OCEL(PM4PYOCEL(**tables)).o2o
+
+    assert o2o.neighbors("o2") == ["o1"]
+    assert o2o.neighbors("o2", qualifier="nope") == []
+    assert o2o.expand(["o2"], hops=2, qualifier="nope") == {"o2": 0}
+    assert o2o.neighbors("o1", qualifier="contains") == ["i1"]
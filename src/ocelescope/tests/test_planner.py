@@ -0,0 +1,61 @@
+from typing import ClassVar
+
+import pandas as pd
+
+from ocelescope import OCEL
+from ocelescope.ocel.filter import (
+    BaseFilter,
+    EventTypeFilter,
+    FilterEstimate,
+    FilterResult,
+    ObjectTypeFilter,
+    TimeFrameFilter,
+    plan_filters,
+)
+
+
+class CountingFilter(BaseFilter):
+    """Keeps all events, counting how often it is evaluated."""
+
+    calls: ClassVar[list[str]] = []
+    name: str
+    cost: float = 1e9
+
+    def filter(self, ocel):
+        CountingFilter.calls.append(self.name)
+        return FilterResult(events=pd.Series(True, index=ocel.events.df.index))
+
+    def estimate(self, ocel):
+        return FilterEstimate(cost=self.cost, events=0.5, objects=None)
+
+
+def test_filters_after_an_empty_result_are_never_evaluated(ocel: OCEL):
+    CountingFilter.calls = []
+    plan = plan_filters(
+        ocel, [CountingFilter(name="expensive"), EventTypeFilter(event_types=["missing"])]
+    )
+    masks = plan.evaluate()
+
+    assert CountingFilter.calls == []
+    assert [step.outcome for step in plan.steps] == ["evaluated", "skipped"]
+    assert not masks.events.any()
+
+
+def test_filters_of_a_tier_are_evaluated_concurrently_with_the_same_result(ocel: OCEL):
+    def pipeline():
+        return [
+            EventTypeFilter(event_types=["pack", "ship"]),
+            TimeFrameFilter(time_range=("2024-01-02", None)),
+            ObjectTypeFilter(object_types=["order"]),
+        ]
+
+    plan = plan_filters(ocel, pipeline())
+    assert [len(tier) for tier in plan._tiers()] == [3]
+
+    concurrent = plan.evaluate(max_workers=4)
+    sequential = plan_filters(OCEL(ocel.ocel), pipeline()).evaluate(max_workers=1)
+
+    assert concurrent.events.equals(sequential.events)
+    assert concurrent.objects.equals(sequential.objects)
+    assert concurrent.events.tolist() == [False, True, True, True]
+    assert concurrent.objects.tolist() == [True, True, False]
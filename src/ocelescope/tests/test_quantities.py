@@ -0,0 +1,12 @@
+import pandas as pd
+
+from ocelescope import OCEL
+
+
+def test_replaced_quantity_tables_survive_copies_and_filters(ocel: OCEL):
+    oqty = pd.DataFrame({"ocel:oid": ["i1"], "qel:item_type": ["screws"], "qel:quantity": [12]})
+    ocel.quantities.oqty = oqty
+
+    for derived in (ocel.copy(), ocel.filter([]).materialize()):
+        assert derived.quantities.oqty.equals(oqty)
+        assert derived.quantities.qop.empty